@@ -0,0 +1,295 @@
+# entities/behaviors.py
+import pygame
+from game.config import *
+
+# ===== ACTIONS & CONDITIONS =====
+WANDER, CHASE, HOLD, LUNGE, SCHOOL = range(5)
+ACTION_CODES = {
+    "wander": WANDER,
+    "chase": CHASE,
+    "hold": HOLD,     # stand still
+    "lunge": LUNGE,   # straight line toward where the player was on entering
+    "school": SCHOOL, # flock with the school (boids)
+}
+
+NEAR, FAR, TIMER = range(3)
+CONDITION_CODES = {
+    "near": NEAR,
+    "far": FAR,
+    "timer": TIMER,
+}
+
+NO_TARGET = float("inf")
+
+
+class BehaviorTable:
+    """A behavior profile from config compiled into flat per-state tuples.
+
+    Tables are built once per monster type and shared, so each monster only
+    carries a state index and a timer.
+    """
+    __slots__ = ("names", "actions", "speeds", "transitions", "schooling", "school_size")
+
+    def __init__(self, profile):
+        states = profile["states"]
+
+        def resolve(value):
+            return profile[value] if isinstance(value, str) else value
+
+        self.names = tuple(states)
+        index = {name: i for i, name in enumerate(self.names)}
+
+        self.actions = tuple(ACTION_CODES[state["action"]] for state in states.values())
+        self.speeds = tuple(state.get("speed", 1.0) for state in states.values())
+        self.transitions = tuple(
+            tuple(
+                (CONDITION_CODES[condition], resolve(value), index[next_state])
+                for condition, value, next_state in state.get("next", ())
+            )
+            for state in states.values()
+        )
+
+        self.schooling = SCHOOL in self.actions
+        self.school_size = profile.get("school_size", 1)
+
+    def index(self, name):
+        """State index by name, initial state if unknown"""
+        return self.names.index(name) if name in self.names else 0
+
+
+BEHAVIOR_TABLES = {}
+
+
+def build_behavior_tables():
+    """(Re)compile MONSTER_BEHAVIORS, in place so existing references see the new tables"""
+    BEHAVIOR_TABLES.clear()
+    for enemy_type, profile in MONSTER_BEHAVIORS.items():
+        BEHAVIOR_TABLES[enemy_type] = BehaviorTable(profile)
+
+
+build_behavior_tables()
+
+
+def get_behavior_table(enemy_type):
+    return BEHAVIOR_TABLES.get(enemy_type, BEHAVIOR_TABLES["fly"])
+
+
+# ===== INTERPRETER =====
+def run_behavior(monster, dt, target_pos, distance):
+    """Advance a monster through its behavior table and apply the state's action.
+
+    target_pos is None (and distance NO_TARGET) when there is nothing to chase.
+    """
+    table = monster.behavior
+    state = monster.behavior_state
+    monster.behavior_timer += dt
+
+    for condition, value, next_state in table.transitions[state]:
+        if condition == NEAR:
+            fired = distance <= value
+        elif condition == FAR:
+            fired = distance >= value
+        else:
+            fired = monster.behavior_timer >= value
+
+        if fired:
+            state = next_state
+            monster.behavior_state = state
+            monster.behavior_timer = 0.0
+            enter_state(monster, table.actions[state], target_pos)
+            break
+
+    monster.state = table.names[state]
+    monster.speed_scale = table.speeds[state]
+
+    action = table.actions[state]
+    if target_pos is None and (action == CHASE or action == LUNGE):
+        action = WANDER
+
+    if action == WANDER:
+        monster.wander(dt)
+    elif action == CHASE:
+        monster.chase(target_pos)
+    elif action == HOLD:
+        monster.direction.update(0, 0)
+    elif action == SCHOOL:
+        if monster.flock_direction is not None:
+            monster.direction.update(monster.flock_direction)
+        else:
+            monster.wander(dt)
+    # LUNGE keeps the direction locked in when the state was entered
+
+
+def enter_state(monster, action, target_pos):
+    if action == LUNGE and target_pos is not None:
+        monster.aim_at(target_pos)
+    elif action == WANDER:
+        monster.direction = monster.random_direction()
+        monster.change_dir_timer = 0.0
+
+
+# ===== SCHOOLS =====
+class School:
+    """A group of schooling monsters sharing a center and heading"""
+
+    def __init__(self, enemy_type, rng, center):
+        self.enemy_type = enemy_type
+        self.rng = rng
+        self.members = []
+        self.center = pygame.math.Vector2(center)
+        self.heading = pygame.math.Vector2()
+        self.turn_timer = SCHOOL_TURN_INTERVAL  # pick a heading on the first update
+
+    def update(self, dt):
+        """Refresh the shared center and heading once for the whole school"""
+        self.members = [monster for monster in self.members if monster.alive and monster.groups()]
+        if not self.members:
+            return
+
+        total_x = total_y = 0
+        for monster in self.members:
+            total_x += monster.hitbox_rect.centerx
+            total_y += monster.hitbox_rect.centery
+        self.center.update(total_x / len(self.members), total_y / len(self.members))
+
+        self.turn_timer += dt
+        if self.turn_timer >= SCHOOL_TURN_INTERVAL:
+            self.turn_timer = 0.0
+            self.heading = pygame.math.Vector2(1, 0).rotate(self.rng.uniform(0, 360))
+
+
+
+class BehaviorSystem:
+    """Per-game owner of group behaviors (schools), updated once per tick"""
+
+    def __init__(self, rng):
+        self.rng = rng.ai
+        self.schools = {}  # enemy type -> list of School
+
+    def register(self, monster):
+        """Put a newly created schooling monster into a nearby school with room"""
+        table = monster.behavior
+        if not table.schooling:
+            return
+
+        schools = self.schools.setdefault(monster.enemy_type, [])
+        pos = monster.hitbox_rect.center
+        for school in schools:
+            if (
+                len(school.members) < table.school_size
+                and school.center.distance_squared_to(pos) <= SCHOOL_JOIN_RADIUS ** 2
+            ):
+                break
+        else:
+            school = School(monster.enemy_type, self.rng, pos)
+            schools.append(school)
+
+        school.members.append(monster)
+        monster.school = school
+
+    def update(self, dt):
+        for schools in self.schools.values():
+            members = []
+            for school in schools:
+                school.update(dt)
+                members.extend(monster for monster in school.members if not monster.asleep)
+            schools[:] = [school for school in schools if school.members]
+            flock(members)
+
+
+# ===== FLOCKING =====
+def flock(members):
+    """Boids steering (separation, alignment, cohesion + school heading) for
+    every schooling monster of one type in a single batched pass.
+
+    Positions and directions are copied into flat lists and bucketed into a
+    uniform grid with cells one neighbor radius wide, so each fish only
+    looks at the 3x3 cells around it instead of every other fish.
+    """
+    count = len(members)
+    if not count:
+        return
+
+    radius = BOIDS_NEIGHBOR_RADIUS
+    radius_sq = radius * radius
+    separation_sq = BOIDS_SEPARATION_RADIUS * BOIDS_SEPARATION_RADIUS
+    separation_weight = BOIDS_SEPARATION_WEIGHT
+    alignment_weight = BOIDS_ALIGNMENT_WEIGHT
+    cohesion_weight = BOIDS_COHESION_WEIGHT
+    heading_weight = BOIDS_HEADING_WEIGHT
+    max_neighbors = BOIDS_MAX_NEIGHBORS
+
+    # struct-of-arrays copy of the flock
+    xs = [0.0] * count
+    ys = [0.0] * count
+    dxs = [0.0] * count
+    dys = [0.0] * count
+    grid = {}
+    for i, monster in enumerate(members):
+        x, y = monster.hitbox_rect.center
+        xs[i] = x
+        ys[i] = y
+        dxs[i] = monster.direction.x
+        dys[i] = monster.direction.y
+        key = (int(x // radius), int(y // radius))
+        if key in grid:
+            grid[key].append(i)
+        else:
+            grid[key] = [i]
+
+    for i, monster in enumerate(members):
+        x = xs[i]
+        y = ys[i]
+        cell_x = int(x // radius)
+        cell_y = int(y // radius)
+
+        neighbors = 0
+        sep_x = sep_y = 0.0
+        align_x = align_y = 0.0
+        center_x = center_y = 0.0
+
+        for grid_x in (cell_x - 1, cell_x, cell_x + 1):
+            for grid_y in (cell_y - 1, cell_y, cell_y + 1):
+                bucket = grid.get((grid_x, grid_y))
+                if not bucket or neighbors >= max_neighbors:
+                    continue
+                for j in bucket:
+                    if j == i:
+                        continue
+                    offset_x = x - xs[j]
+                    offset_y = y - ys[j]
+                    distance_sq = offset_x * offset_x + offset_y * offset_y
+                    if distance_sq > radius_sq:
+                        continue
+
+                    if neighbors == max_neighbors:
+                        break
+                    neighbors += 1
+                    align_x += dxs[j]
+                    align_y += dys[j]
+                    center_x += xs[j]
+                    center_y += ys[j]
+                    if distance_sq < separation_sq:
+                        # push apart harder the closer they are
+                        scale = 1.0 / max(distance_sq, 1.0)
+                        sep_x += offset_x * scale
+                        sep_y += offset_y * scale
+
+        heading = monster.school.heading
+        steer_x = heading.x * heading_weight
+        steer_y = heading.y * heading_weight
+
+        if neighbors:
+            steer_x += align_x / neighbors * alignment_weight
+            steer_y += align_y / neighbors * alignment_weight
+            steer_x += (center_x / neighbors - x) / radius * cohesion_weight
+            steer_y += (center_y / neighbors - y) / radius * cohesion_weight
+            steer_x += sep_x * BOIDS_SEPARATION_RADIUS * separation_weight
+            steer_y += sep_y * BOIDS_SEPARATION_RADIUS * separation_weight
+
+        length_sq = steer_x * steer_x + steer_y * steer_y
+        if length_sq:
+            length = length_sq ** 0.5
+            monster.flock_direction = (steer_x / length, steer_y / length)
+        else:
+            monster.flock_direction = None
@@ -28,5 +28,7 @@ class Camera(pygame.sprite.Group):
                                                   sprite.rect.centery))
         
         for sprite in self_sprites:
+            if getattr(sprite, 'asleep', False):
+                continue  # far away, its zone is asleep
             offset_pos = pygame.math.Vector2(sprite.rect.topleft) - self.offset
             self.surface.blit(sprite.image, (offset_pos.x, offset_pos.y))
\ No newline at end of file
@@ -1,6 +1,5 @@
 # entities/monster_spawner.py
 import pygame
-from random import randint, choice
 from game.config import *
 from entities.monsters import Monster
 
@@ -13,7 +12,13 @@ class MonsterSpawner:
         enemy_sprites,
         visible_sprites,
         collision_sprites,
-        map_collision_sprites
+        map_collision_sprites,
+        rng,
+        flow_field=None,
+        behaviors=None,
+        events=None,
+        broad_phase=None,
+        assets=None
     ):
         # references
         self.player = player
@@ -21,6 +26,12 @@ class MonsterSpawner:
         self.visible_sprites = visible_sprites
         self.collision_sprites = collision_sprites
         self.map_collision_sprites = map_collision_sprites
+        self.rng = rng
+        self.flow_field = flow_field
+        self.behaviors = behaviors
+        self.events = events
+        self.broad_phase = broad_phase
+        self.assets = assets
 
         # timing
         self.spawn_interval = MONSTER_SPAWN_INTERVAL
@@ -37,6 +48,7 @@ class MonsterSpawner:
 
         # spawn tracking
         self.wave_number = 0
+        self.next_id = 0  # stable per-monster id, like the torpedo pool's
 
         # spawn initial monsters immediately
         self.spawn_initial_batch()
@@ -61,23 +73,37 @@ class MonsterSpawner:
         """Spawn monsters in designated spawn areas"""
         spawn_data = MONSTER_SPAWN_AREA[monster_type]
 
-        area = choice(spawn_data["areas"]) # generates random position
+        spawn_rng = self.rng.spawn
+        area = spawn_rng.choice(spawn_data["areas"]) # generates random position
         x1, y1, x2, y2 = area
 
-        x = randint(min(x1, x2), max(x1, x2))
-        y = randint(min(y1, y2), max(y1, y2))
+        x = spawn_rng.randint(min(x1, x2), max(x1, x2))
+        y = spawn_rng.randint(min(y1, y2), max(y1, y2))
 
-        # create monsters
+        return self.create_monster(monster_type, (x, y))
+
+    def create_monster(self, monster_type, pos, register=True):
+        """Create a monster at a given position and register it for drawing"""
         monster = Monster(
-            pos=(x, y),
+            pos=pos,
             groups=[self.visible_sprites, self.enemy_sprites],
             collision_sprites=self.collision_sprites,
             map_collision_sprites=self.map_collision_sprites,
             player=self.player,
-            enemy_type=monster_type
+            enemy_type=monster_type,
+            rng=self.rng,
+            flow_field=self.flow_field,
+            events=self.events,
+            broad_phase=self.broad_phase,
+            assets=self.assets
         )
+        monster.uid = self.next_id
+        self.next_id = (self.next_id + 1) & 0xFFFFFFFF
         if hasattr(self.player, 'game_ref') and hasattr(self.player.game_ref, 'camera'):
             self.player.game_ref.camera.add(monster)
+        if self.behaviors and register:
+            self.behaviors.register(monster)
+        return monster
 
     def increase_difficulty(self):
         """Increases monster count over time"""
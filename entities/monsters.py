@@ -1,8 +1,12 @@
 # entities/monsters.py
 import pygame
 import os
-from random import randint, choice
+import random
 from game.config import *
+from entities.behaviors import get_behavior_table, run_behavior, NO_TARGET
+from game.events import DAMAGE
+from game.spatial import WALLS
+from game.assets import load_image
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 
@@ -16,7 +20,12 @@ class Monster(pygame.sprite.Sprite):
             collision_sprites, 
             map_collision_sprites, 
             player=None, 
-            enemy_type='fly'
+            enemy_type='fly',
+            rng=None,
+            flow_field=None,
+            events=None,
+            broad_phase=None,
+            assets=None
     ):
         super().__init__(*groups)
 
@@ -24,7 +33,12 @@ class Monster(pygame.sprite.Sprite):
         self.player = player
         self.collision_sprites = collision_sprites
         self.map_collision_sprites = map_collision_sprites
+        self.flow_field = flow_field  # shared path toward the player
+        self.events = events
+        self.broad_phase = broad_phase  # shared collision service
         self.enemy_type = enemy_type
+        self.rng = rng.ai if rng else random
+        spawn_rng = rng.spawn if rng else random
 
         if enemy_type in MONSTER_TYPES:
             data = MONSTER_TYPES[enemy_type]
@@ -35,14 +49,18 @@ class Monster(pygame.sprite.Sprite):
         self.size = data.get("size", (40, 40))
         self.health = data["hp"]
         self.max_health = self.health
-        self.speed = randint(*data["speed"])
+        self.speed = spawn_rng.randint(*data["speed"])
         self.damage = data.get("damage", 10)
         self.xp_reward = data.get("xp", 10)
         self.frames_count = data.get("frames", 1)
         self.alive = True
 
-        # load animations
-        self.animations = self.load_animations(enemy_type)
+        # load animations (once per type when the game shares its assets)
+        if assets:
+            key = ("monster", enemy_type, tuple(self.size), self.frames_count)
+            self.animations = assets.cached(key, self.load_animations, enemy_type)
+        else:
+            self.animations = self.load_animations(enemy_type)
         self.direction_facing = "right"
         self.current_frame = 0
         self.animation_timer = 0.0
@@ -55,13 +73,23 @@ class Monster(pygame.sprite.Sprite):
         self.hitbox_rect = self.create_hitbox()
 
         self.alpha = 255
+        self.reveal_alpha = 0  # set by the sonar system while revealed
         self.z_layer = 3
 
         # movement & AI
         self.direction = self.random_direction()
-        self.state = "wander"
         self.change_dir_timer = 0.0
         self.attack_cooldown = 0.0
+        self.speed_scale = 1.0
+
+        # behavior table state (shared table, per-monster index + timer)
+        self.behavior = get_behavior_table(enemy_type)
+        self.behavior_state = 0
+        self.behavior_timer = 0.0
+        self.state = self.behavior.names[0]
+        self.school = None
+        self.flock_direction = None  # set by the batched flocking pass
+        self.asleep = False  # frozen while its zone is asleep
 
     # ===== SETUP HELPERS =====
     def load_animations(self, enemy_type):
@@ -79,7 +107,7 @@ class Monster(pygame.sprite.Sprite):
             for i in range(self.frames_count):
                 path = f"{MONSTERS_PATH}/{enemy_type}/{direction}/{i}.png"
                 try:
-                    img = pygame.image.load(path).convert_alpha()
+                    img = load_image(path)
                     img = pygame.transform.scale(img, self.size)
 
                 except Exception:
@@ -107,8 +135,8 @@ class Monster(pygame.sprite.Sprite):
 
     def random_direction(self):
         direction = pygame.math.Vector2(
-            randint(-1, 1),
-            randint(-1, 1)
+            self.rng.randint(-1, 1),
+            self.rng.randint(-1, 1)
         )
         return direction.normalize() if direction.length() else direction
 
@@ -120,22 +148,26 @@ class Monster(pygame.sprite.Sprite):
             self.change_dir_timer = 0.0
 
     def chase(self, target_pos):
+        # follow the shared flow field around walls, straight line once close
+        if self.flow_field:
+            flow = self.flow_field.direction_at(self.hitbox_rect.center)
+            if flow is not None:
+                self.direction = flow
+                return
+
+        self.aim_at(target_pos)
+
+    def aim_at(self, target_pos):
         direction = target_pos - pygame.math.Vector2(self.rect.center)
         if direction.length():
             self.direction = direction.normalize()
 
-    def update_state(self, distance):
-        if distance <= DETECTION_RANGE:
-            self.state = "chase"
-        elif distance >= LOSE_INTEREST_RANGE:
-            self.state = "wander"
-
     # ===== MOVEMENT AND COLLISIONS =====
     def move(self, dt):
         if not self.direction.length():
             return
         
-        movement = self.direction * self.speed * dt
+        movement = self.direction * self.speed * self.speed_scale * dt
 
         self.axis_move(movement.x, 0)
         self.axis_move(0, movement.y)
@@ -154,7 +186,11 @@ class Monster(pygame.sprite.Sprite):
         self.hitbox_rect.x += dx
         self.hitbox_rect.y += dy
 
-        for sprite in self.map_collision_sprites:
+        if self.broad_phase:
+            walls = self.broad_phase.query(self.hitbox_rect, WALLS)
+        else:
+            walls = self.map_collision_sprites
+        for sprite in walls:
             if self.hitbox_rect.colliderect(sprite.rect):
                 if dx > 0:
                     self.hitbox_rect.right = sprite.rect.left
@@ -176,10 +212,9 @@ class Monster(pygame.sprite.Sprite):
 
     # ===== COMBAT & VISIBILITY =====
     def update_visibility(self, distance):
-        if self.player and getattr(self.player, "sonar_active", False):
-            if distance <= self.player.sonar_range:
-                self.set_alpha(255)
-                return
+        if self.reveal_alpha >= 255:
+            self.set_alpha(255)
+            return
 
         if distance <= VISIBILITY_RADIUS:
             alpha = 255
@@ -189,7 +224,7 @@ class Monster(pygame.sprite.Sprite):
             ratio = 1 - (distance - VISIBILITY_RADIUS) / (FOG_RADIUS - VISIBILITY_RADIUS)
             alpha = int(255 * ratio)
 
-        self.set_alpha(alpha)
+        self.set_alpha(max(alpha, self.reveal_alpha))
 
     def set_alpha(self, alpha):
         self.alpha = alpha
@@ -226,6 +261,9 @@ class Monster(pygame.sprite.Sprite):
             self.kill()
             return
 
+        if self.asleep:
+            return
+
         if self.attack_cooldown > 0:
             self.attack_cooldown -= dt
 
@@ -233,34 +271,34 @@ class Monster(pygame.sprite.Sprite):
         enemy_pos = pygame.math.Vector2(self.rect.center)
         distance = player_pos.distance_to(enemy_pos)
 
-        self.update_state(distance)
-
-        if self.player.is_invincible or self.player.is_dead:
-            self.wander(dt)
-        elif self.state == "wander":
-            self.wander(dt)
-        elif self.state == "chase":
-            self.chase(player_pos)
+        # invincible or dead players can't be targeted
+        targetable = not self.player.is_invincible and not self.player.is_dead
+        if targetable:
+            run_behavior(self, dt, player_pos, distance)
+        else:
+            run_behavior(self, dt, None, NO_TARGET)
 
         self.update_visibility(distance)
         self.move(dt)
         self.keep_within_bounds()
 
         if (
-            not self.player.is_dead
-            and not self.player.is_invincible
+            targetable
             and self.hitbox_rect.colliderect(self.player.hitbox_rect)
             and self.attack_cooldown <= 0
         ):
             
             if self.hitbox_rect.colliderect(self.player.hitbox_rect) and self.attack_cooldown <= 0:
-                self.player.take_damage(self.damage)
+                if self.events:
+                    self.events.emit(DAMAGE, self, self.player, self.damage, self.hitbox_rect.center)
+                else:
+                    self.player.take_damage(self.damage)
                 self.attack_cooldown = 1.0
 
                 # push monsters away
                 push_vector = pygame.math.Vector2(self.hitbox_rect.center) - pygame.math.Vector2(self.player.hitbox_rect.center)
                 if push_vector.length() == 0:
-                    push_vector = pygame.math.Vector2(randint(-1,1), randint(-1,1))
+                    push_vector = pygame.math.Vector2(self.rng.randint(-1,1), self.rng.randint(-1,1))
                 push_vector = push_vector.normalize() * 20 # push/knockback strength (adjustable)
                 self.hitbox_rect.center += push_vector
                 self.rect.center = self.hitbox_rect.center
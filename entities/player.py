@@ -2,7 +2,12 @@
 import pygame
 from os.path import join
 from game.config import *
-from entities.torpedo import Torpedo
+from game.clock import SimClock
+from game.events import SOUND, DEATH, SONAR_PULSE
+from game.spatial import WALLS, PORTALS
+from game.assets import load_image
+from entities.progression import ProgressionTable
+from game.input import InputState, MOVE_UP, MOVE_DOWN, MOVE_LEFT, MOVE_RIGHT, BOOST, FIRE, SONAR
 
 class Player(pygame.sprite.Sprite):
     def __init__(self, 
@@ -13,7 +18,8 @@ class Player(pygame.sprite.Sprite):
             map_width, 
             map_height, 
             obstacle_group=None, 
-            game_ref=None
+            game_ref=None,
+            progression=None
     ):
         super().__init__(group)
 
@@ -22,9 +28,7 @@ class Player(pygame.sprite.Sprite):
         self.visible_sprites = visible_sprites
         self.collision_sprites = collision_sprites
         self.obstacle_group = obstacle_group
-
-        self.explosion_frames = game_ref.explosion_frames if game_ref else []
-        self.explosion_group = game_ref.explosion_group if game_ref else None
+        self.clock = game_ref.clock if game_ref else SimClock()
 
         # movement & direction
         self.direction = pygame.math.Vector2()
@@ -38,7 +42,6 @@ class Player(pygame.sprite.Sprite):
         self.max_health = PLAYER_HEALTH
         self.health = self.max_health
 
-        self.hp_regen_rate = 0.0
         self.last_damage_time = 0
         self.last_hit_time = 0
         self.hit_cooldown = TAKE_DAMAGE_CD
@@ -46,9 +49,6 @@ class Player(pygame.sprite.Sprite):
         self.hit_timer = 0.0
         self.hit_flash_duration = 0.2 # seconds
 
-        self.base_damage = PLAYER_BASE_DAMAGE
-        self.damage = self.base_damage
-
         # death & invincibility
         self.is_dead = False
         self.is_invincible = False
@@ -62,24 +62,19 @@ class Player(pygame.sprite.Sprite):
         self.power = self.max_power
         self.power_regen_rate = POWER_REGEN
 
-        self.boost_cost = BOOST_COST
-        self.torpedo_cost = TORPEDO_COST
-
         # XP & level system
+        # damage, costs, regen and unlocks per level come from the progression table
+        self.progression = progression or ProgressionTable()
         self.level = 1
-        self.max_level = PLAYER_MAX_LEVEL
+        self.max_level = self.progression.max_level
         self.xp = 0
-
-        self.xp_to_next = [0]
-        for lvl in range(1, self.max_level + 1):
-            self.xp_to_next.append(50 + (lvl - 1) * 25)
+        self.update_level_stats()
         
         # torpedoes
         self.torpedo_cooldown = TORPEDO_COOLDOWN
-        self.last_torpedo_time = 0
+        self.last_torpedo_time = -9999
 
         # sonar activation
-        self.sonar_level_required = SONAR_LEVEL_REQUIRED
         self.sonar_active = False
         self.sonar_duration = SONAR_DURATION
         self.sonar_start_time = 0
@@ -114,23 +109,17 @@ class Player(pygame.sprite.Sprite):
         self.crosshair_pos = pygame.math.Vector2(self.rect.center)
         self.aim_direction = pygame.math.Vector2(1, 0)
 
-        # load audio
-        self.sounds = game_ref.sounds if game_ref else {}
-
-        self.update_hp_regen_rate()
-
     # ===== INPUT & MOVEMENT =====
     def input(self, dt):
         """Handles user input to perform actions/motion"""
         if self.is_dead: # no input while dead
             return
         
-        keys = pygame.key.get_pressed()
-        mouse_buttons = pygame.mouse.get_pressed()
+        controls = self.get_input_state()
 
         # movement (WASD)
-        x_input = int(keys[pygame.K_d]) - int(keys[pygame.K_a])
-        y_input = int(keys[pygame.K_s]) - int(keys[pygame.K_w])
+        x_input = int(controls.held(MOVE_RIGHT)) - int(controls.held(MOVE_LEFT))
+        y_input = int(controls.held(MOVE_DOWN)) - int(controls.held(MOVE_UP))
         self.direction.x = x_input
         self.direction.y = y_input
 
@@ -141,7 +130,7 @@ class Player(pygame.sprite.Sprite):
             self.direction = self.direction.normalize()
 
         # boost (Lshift)
-        if keys[pygame.K_LSHIFT] and self.power > 0:
+        if controls.held(BOOST) and self.power > 0:
             self.speed = self.boost_speed
             self.power -= self.boost_cost * dt
             self.power = max(0, self.power)
@@ -150,17 +139,23 @@ class Player(pygame.sprite.Sprite):
 
         # torpedo launching (left click or space)
         can_fire = self.power >= self.torpedo_cost
-        current_time = pygame.time.get_ticks()
-        if (mouse_buttons[0] or keys[pygame.K_SPACE]) and can_fire:
+        current_time = self.clock.get_ticks()
+        if controls.held(FIRE) and can_fire:
             # check cooldown
             if current_time - self.last_torpedo_time >= self.torpedo_cooldown * 1000:
                 self.launch_torpedo()
                 self.last_torpedo_time = current_time
 
         # sonar activation (F)
-        if keys[pygame.K_f]:
+        if controls.held(SONAR):
             self.activate_sonar()
 
+    def get_input_state(self):
+        """This tick's input, polled once per tick by the game state"""
+        if self.game_ref:
+            return self.game_ref.input_state
+        return InputState()
+
     def move(self, dt):
         if self.is_dead:
             return # no movement while dead 
@@ -175,7 +170,11 @@ class Player(pygame.sprite.Sprite):
         self.update_animation(dt)
 
     def collision(self, direction):
-            for sprite in self.collision_sprites:
+            if self.game_ref:
+                walls = self.game_ref.broad_phase.query(self.hitbox_rect, WALLS)
+            else:
+                walls = self.collision_sprites
+            for sprite in walls:
                 if self.hitbox_rect.colliderect(sprite.rect):
                     if direction == "horizontal":
                         if self.direction.x > 0:
@@ -210,41 +209,32 @@ class Player(pygame.sprite.Sprite):
             direction = pygame.math.Vector2(1, 0)
         direction = direction.normalize()
 
-        torpedo = Torpedo(
-            pos=self.rect.center,
-            direction=direction,
-            player_facing=self.last_horizontal,
-            group=self.visible_sprites,
-            collision_sprites=self.collision_sprites,
-            explosion_frames=self.explosion_frames,
-            explosion_group=self.explosion_group,
-            monster_group=self.game_ref.enemy_sprites,
-            obstacle_group=self.obstacle_group,
-            visible_sprites=self.visible_sprites,
-            game_ref=self.game_ref,
-            damage=self.damage,
-            owner=self
-            )
-        
-        if self.game_ref and hasattr(self.game_ref, 'camera'):
-            self.game_ref.camera.add(torpedo)
+        slot = self.game_ref.torpedoes.launch(
+            self.rect.center, direction, self.last_horizontal, self.damage, self
+        )
+        if slot < 0: # pool full
+            return
 
         # play sound
-        if self.game_ref and hasattr(self.game_ref, 'sounds'):
-            self.game_ref.sounds['torpedo_launch'].play()
+        self.play_sound('torpedo_launch')
 
         self.power -= self.torpedo_cost
 
+    def play_sound(self, name):
+        """Queue a sound effect, played when the game's events drain"""
+        if self.game_ref:
+            self.game_ref.events.emit(SOUND, self, value=name)
+
     def activate_sonar(self):
         """Activate sonar pulse if conditions are met."""
         if self.is_dead: # Can't activate sonar while dead
             return False 
         
-        current_time = pygame.time.get_ticks()
+        current_time = self.clock.get_ticks()
         
         # Check requirements
-        if self.level < self.sonar_level_required:
-            print(f"Sonar requires level {self.sonar_level_required}")
+        if not self.progression.unlocked(self.level, "sonar"):
+            print(f"Sonar requires level {self.progression.unlock_level['sonar']}")
             return False
         
         if self.power < self.sonar_cost:
@@ -263,8 +253,9 @@ class Player(pygame.sprite.Sprite):
         self.power -= self.sonar_cost
         self.last_sonar_time = current_time
 
-        if self.game_ref and hasattr(self.game_ref, 'sounds'):
-            self.game_ref.sounds['sonar_ping'].play()
+        self.play_sound('sonar_ping')
+        if self.game_ref:
+            self.game_ref.events.emit(SONAR_PULSE, self, value=self.sonar_range, pos=self.rect.center)
         
         return True
     
@@ -276,7 +267,13 @@ class Player(pygame.sprite.Sprite):
         for portal in portal_group:
             portal.is_current = False
 
-        for portal in portal_group:
+        if self.game_ref:
+            nearby = self.game_ref.broad_phase.query_radius(
+                self.rect.center, self.portal_interaction_radius, PORTALS
+            )
+        else:
+            nearby = portal_group
+        for portal in nearby:
             # calculate distance to portal
             player_pos = pygame.math.Vector2(self.rect.center)
             portal_pos = pygame.math.Vector2(portal.rect.center)
@@ -297,7 +294,7 @@ class Player(pygame.sprite.Sprite):
         if self.is_invincible or self.is_dead:
             return
         
-        current = pygame.time.get_ticks()
+        current = self.clock.get_ticks()
         if current - self.last_hit_time > self.hit_cooldown:
             self.health -= amount
             self.is_hit = True
@@ -305,8 +302,8 @@ class Player(pygame.sprite.Sprite):
             self.last_hit_time = current
             self.last_damage_time = current
 
-        if "damage" in self.sounds:
-            self.sounds['damage'].play()
+            # only audible when the hit actually lands
+            self.play_sound('damage')
 
             if self.health <= 0:
                 self.die()
@@ -315,7 +312,7 @@ class Player(pygame.sprite.Sprite):
         if self.is_dead or self.health >= self.max_health:
             return
         
-        current_time = pygame.time.get_ticks()
+        current_time = self.clock.get_ticks()
         time_since_damage = (current_time - self.last_damage_time) / 1000.0
 
         # wait before regen
@@ -337,37 +334,23 @@ class Player(pygame.sprite.Sprite):
 
             while(
                 self.level < self.max_level
-                and self.xp >= self.xp_to_next[self.level]
+                and self.xp >= self.progression.xp_to_next[self.level]
             ):
-                self.xp -= self.xp_to_next[self.level]
+                self.xp -= self.progression.xp_to_next[self.level]
                 self.level_up()
 
     def level_up(self):
         self.level += 1
+        self.update_level_stats()
 
-        # damage scaling
-        damage_step = (PLAYER_MAX_DAMAGE - PLAYER_BASE_DAMAGE) / (self.max_level - 1)
-        self.damage = round(PLAYER_BASE_DAMAGE + damage_step * (self.level - 1))
-
-        # cost reduction as level increases
-        self.boost_cost = max(3, BOOST_COST - self.level * 0.4)
-        self.torpedo_cost = max(5, TORPEDO_COST - self.level * 0.6)
-        self.update_hp_regen_rate()
-
-    def update_hp_regen_rate(self):
-        """Handles HP regen rates based on level"""
-        if self.level < HP_REGEN_LEVEL_REQUIRED:
-            self.hp_regen_rate = 0
-            return
-        
-        hp_regen_increment = round(
-            (self.level - HP_REGEN_LEVEL_REQUIRED)
-            / (self.max_level - HP_REGEN_LEVEL_REQUIRED)
-        )
-        self.hp_regen_rate = round(
-            HP_REGEN_MIN
-            + hp_regen_increment * (HP_REGEN_MAX - HP_REGEN_MIN)
-        )
+    def update_level_stats(self):
+        """Damage, costs and regen for the current level (also re-run when settings change)"""
+        table = self.progression
+        level = self.level
+        self.damage = table.damage[level]
+        self.boost_cost = table.boost_cost[level]
+        self.torpedo_cost = table.torpedo_cost[level]
+        self.hp_regen_rate = table.hp_regen[level]
 
     # ===== DEATH & RESPAWN =====
     def die(self):
@@ -376,10 +359,11 @@ class Player(pygame.sprite.Sprite):
             self.is_dead = True
             self.health = 0
             self.image.set_alpha(100) # make semi-transparent
+            self.respawn_timer = self.clock.get_ticks()
             print('Player Died!')
 
-            if self.game_ref and hasattr(self.game_ref, 'player_respawn'):
-                self.game_ref.player_respawn.start_respawn()
+            if self.game_ref:
+                self.game_ref.events.emit(DEATH, target=self, pos=self.rect.center)
 
     def respawn(self, pos):
         """Respawn player at specific position"""
@@ -394,8 +378,8 @@ class Player(pygame.sprite.Sprite):
     def start_invincibility(self):
         """Start invincibility after respawn"""
         self.is_invincible = True
-        self.invincibility_timer = pygame.time.get_ticks()
-        self.last_flash_time = pygame.time.get_ticks()
+        self.invincibility_timer = self.clock.get_ticks()
+        self.last_flash_time = self.clock.get_ticks()
         self.flash_visible = True
         print("Invincible")
 
@@ -405,7 +389,7 @@ class Player(pygame.sprite.Sprite):
             self.image.set_alpha(255)
             return
         
-        current_time = pygame.time.get_ticks()
+        current_time = self.clock.get_ticks()
         elapsed = (current_time - self.invincibility_timer) / 1000.0
         
         # end invincibility after protection time
@@ -429,27 +413,13 @@ class Player(pygame.sprite.Sprite):
 
     # ===== ANIMATION & RENDERING =====
     def load_animation(self):
-        self.animations = {}
-        animation_folders = ['right', 'right_down', 'right_up', 'left', 'left_down', 'left_up']
-        for folder in animation_folders:
-            frames = []
-            try:
-                for i in range(4):
-                    frame_path = join('assets/images/player', folder, f'{i}.png')
-                    frame = pygame.image.load(frame_path).convert_alpha()
-                    frames.append(frame)
-                self.animations[folder] = frames
-            except Exception as e:
-                print(f"Warning: Could not load animation {folder}: {e}")
-                frames = []
-                for i in range(4):
-                    surf = pygame.Surface((32, 32), pygame.SRCALPHA)
-                    color = (0, 150, 255) if 'right' in folder else (100, 200, 255)
-                    radius = 8 + (i * 2)
-                    pygame.draw.rect(surf, color, (0, 0, 32, 32), border_radius=8)
-                    pygame.draw.circle(surf, (255, 255, 255), (16, 16), radius)
-                    frames.append(surf)
-                self.animations[folder] = frames
+        assets = getattr(self.game_ref, "assets", None)
+        animations = assets.cached("player", load_player_animations) if assets else load_player_animations()
+        # own copies: flashing changes the alpha of the current frame
+        self.animations = {
+            folder: [frame.copy() for frame in frames]
+            for folder, frames in animations.items()
+        }
 
     def update_animation(self, dt):
         if self.direction.length() == 0:
@@ -484,10 +454,10 @@ class Player(pygame.sprite.Sprite):
 
     def draw_trajectory(self, screen, camera_offset, dt):
         """Draw player crosshair line from player to mouse position"""
-        self.update_mouse_aim(camera_offset) # to update mouse aim
-
-        player_screen_pos = pygame.math.Vector2(self.rect.center) - camera_offset
-        cross_screen_pos = self.crosshair_pos - camera_offset
+        # aim is simulation state (updated in update), drawing only reads it
+        player_pos = pygame.math.Vector2(self.rect.center)
+        player_screen_pos = player_pos - camera_offset
+        cross_screen_pos = player_pos + self.aim_direction * self.crosshair_length - camera_offset
 
         # crosshair line
         pygame.draw.line(screen,(CROSSHAIR_COLOR), 
@@ -499,7 +469,7 @@ class Player(pygame.sprite.Sprite):
 
     def update_mouse_aim(self, camera_offset):
         """Update crosshair position based on mouse cursor"""
-        mouse_screen = pygame.mouse.get_pos()
+        mouse_screen = self.get_input_state().mouse_pos
         mouse_world = pygame.math.Vector2(mouse_screen) + camera_offset
 
         direction = mouse_world - pygame.math.Vector2(self.rect.center)
@@ -516,9 +486,10 @@ class Player(pygame.sprite.Sprite):
         self.power_regen(dt)
 
         if not self.is_dead:
+            camera_offset = self.game_ref.camera.offset if self.game_ref else pygame.math.Vector2()
+            self.update_mouse_aim(camera_offset)
             self.input(dt)
             self.move(dt)
-            self.update_mouse_aim(pygame.math.Vector2(0, 0))
 
         if self.is_hit:
             self.hit_timer += dt
@@ -531,17 +502,42 @@ class Player(pygame.sprite.Sprite):
 
         # low health alert
         if self.health <= 20 and not getattr(self, "low_health_alerted", False):
-            if "low_health" in self.sounds:
-                self.sounds["low_health"].play()
-            self.low_health_aletered = True
+            self.play_sound('low_health')
+            self.low_health_alerted = True
 
         if self.health > 20:
-            self.low_health_aletered = False
+            self.low_health_alerted = False
             
         self.update_invincibility()
 
         # sonar duration
         if self.sonar_active:
-            elapsed = (pygame.time.get_ticks() - self.sonar_start_time) / 1000.0
+            elapsed = (self.clock.get_ticks() - self.sonar_start_time) / 1000.0
             if elapsed >= self.sonar_duration:
                 self.sonar_active = False
+
+
+# ===== ASSETS =====
+def load_player_animations():
+    animations = {}
+    animation_folders = ['right', 'right_down', 'right_up', 'left', 'left_down', 'left_up']
+    for folder in animation_folders:
+        frames = []
+        try:
+            for i in range(4):
+                frame_path = join('assets/images/player', folder, f'{i}.png')
+                frame = load_image(frame_path)
+                frames.append(frame)
+            animations[folder] = frames
+        except Exception as e:
+            print(f"Warning: Could not load animation {folder}: {e}")
+            frames = []
+            for i in range(4):
+                surf = pygame.Surface((32, 32), pygame.SRCALPHA)
+                color = (0, 150, 255) if 'right' in folder else (100, 200, 255)
+                radius = 8 + (i * 2)
+                pygame.draw.rect(surf, color, (0, 0, 32, 32), border_radius=8)
+                pygame.draw.circle(surf, (255, 255, 255), (16, 16), radius)
+                frames.append(surf)
+            animations[folder] = frames
+    return animations
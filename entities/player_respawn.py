@@ -1,17 +1,18 @@
 # entities/player_respawn.py
 import pygame
-from random import shuffle
 from game.config import *
+from game.spatial import WALLS, MONSTERS
 
 class RespawnSystem:
     """Handles player death, respawn timing, and invincibility"""
     def __init__(self, game_state):
         self.game_state = game_state
         self.player = game_state.player
+        self.clock = game_state.clock
         
         # respawn points
         self.respawn_points = RESPAWN_POINTS[:]  
-        shuffle(self.respawn_points)  # shuffle for fun
+        game_state.rng.respawn.shuffle(self.respawn_points)  # shuffle for fun
         self.current_respawn_index = 0
         
         # respawn state
@@ -26,14 +27,13 @@ class RespawnSystem:
             
     # ===== RESPAWN LOGIC =====
     def get_safe_respawn_point(self):
-        monsters = self.game_state.enemy_sprites
-        collision_sprites = self.game_state.collision_sprites
+        broad_phase = self.game_state.broad_phase
 
         for _ in range(len(self.respawn_points)):
             point = pygame.math.Vector2(self.respawn_points[self.current_respawn_index])
             safe = True
 
-            for monster in monsters:
+            for monster in broad_phase.query_radius(point, RESPAWN_SAFE_RADIUS, MONSTERS):
                 if pygame.math.Vector2(monster.rect.center).distance_to(point) < RESPAWN_SAFE_RADIUS:
                     safe = False
                     break
@@ -41,10 +41,7 @@ class RespawnSystem:
             if safe:
                 temp_rect = self.player.rect.copy()
                 temp_rect.center = point
-                for sprite in collision_sprites:
-                    if temp_rect.colliderect(sprite.rect):
-                        safe = False
-                        break
+                safe = not broad_phase.collides(temp_rect, WALLS)
 
             self.current_respawn_index = (self.current_respawn_index + 1) % len(self.respawn_points)
 
@@ -57,7 +54,7 @@ class RespawnSystem:
         """Start the respawn process"""
         if not self.is_respawning and self.player.health <= 0:
             self.is_respawning = True
-            self.respawn_timer = pygame.time.get_ticks()
+            self.respawn_timer = self.clock.get_ticks()
             print(f"Respawning in {RESPAWN_DELAY} seconds...")
     
     def execute_respawn(self, current_time):
@@ -71,9 +68,9 @@ class RespawnSystem:
         self.visible = True
 
         # remove active torpedoes
-        for sprite in self.game_state.visible_sprites:
-            if getattr(sprite, "is_torpedo", False):
-                sprite.kill()
+        self.game_state.torpedoes.clear()
+
+        self.player.play_sound('respawn')
             
         self.is_respawning = False
 
@@ -98,7 +95,7 @@ class RespawnSystem:
     # ===== UPDATE & DEBUG =====
 
     def update(self, dt):
-            current_time = pygame.time.get_ticks()
+            current_time = self.clock.get_ticks()
 
             if self.is_respawning:
                 elapsed = (current_time - self.respawn_timer) / 1000
@@ -120,7 +117,7 @@ class RespawnSystem:
         if not self.waiting_for_respawn:
             return
 
-        elapsed = (pygame.time.get_ticks() - self.respawn_timer) / 1000
+        elapsed = (self.clock.get_ticks() - self.respawn_timer) / 1000
         remaining = max(0, RESPAWN_DELAY - elapsed)
 
         text = f"Respawning in: {remaining:.1f}s"
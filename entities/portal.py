@@ -2,9 +2,9 @@
 import pygame
 from os.path import join
 from game.config import *
-
-portal_network_created = False
-existing_portal_group = None
+from game.input import PORTAL_NEXT, PORTAL_PREV, NO_PORTAL_TARGET
+from game.spatial import PORTALS
+from game.assets import load_image
 
 
 class PortalNode:
@@ -12,8 +12,10 @@ class PortalNode:
     def __init__(self, position, portal_index):
         self.position = pygame.math.Vector2(position)
         self.portal_index = portal_index
+        self.rect = None  # (left, top, right, bottom)
         self.next = None
         self.prev = None
+        self.neighbors = []  # every directly linked node
 
 
 class Portal(pygame.sprite.Sprite):
@@ -23,23 +25,16 @@ class Portal(pygame.sprite.Sprite):
         self.node = node
         self.game_ref = game_ref
 
-        # Get portal size from PORTAL_NODES
-        left, top, right, bottom = PORTAL_NODES[node.portal_index]
+        # Get portal size from its node
+        left, top, right, bottom = node.rect
         width = right - left
         height = bottom - top
 
-        # Load portal frames
-        self.frames = []
-        for i in range(6):
-            try:
-                frame = pygame.image.load(join(PORTAL_PATH, f'{i}.png')).convert_alpha()
-                frame = pygame.transform.scale(frame, (width, height))
-            except:
-                frame = pygame.Surface((width, height), pygame.SRCALPHA)
-                color = [(150, 50, 250), (50, 150, 250), (250, 50, 150), (50, 250, 150)][node.portal_index % 4]
-                pygame.draw.ellipse(frame, (*color, 200), (0, 0, width, height))
-                pygame.draw.ellipse(frame, (*color, 100), (10, 10, width - 20, height - 20))
-            self.frames.append(frame)
+        # Load portal frames (shared by every game with the same assets)
+        self.frames = game_ref.assets.cached(
+            ("portal", width, height, node.portal_index % 4),
+            load_portal_frames, width, height, node.portal_index
+        )
 
         self.frame_index = 0
         self.animation_speed = 0.15
@@ -67,17 +62,32 @@ class Portal(pygame.sprite.Sprite):
         if not target_node:
             return False
 
-        old_pos = player.rect.center
+        self.teleport_to(player, target_node, current_time)
+        return True
+
+    def travel(self, player, network, goal, current_time):
+        """Hop to the next portal on the shortest route to portal goal.
+
+        One hop per cooldown; holding the travel key keeps going from each
+        landing, a direct neighbour the zones have already prefetched.
+        """
+        if current_time - player.last_portal_time < PORTAL_COOLDOWN:
+            return False
+
+        route = network.route(self.node.portal_index, goal)
+        if not route:
+            return False
+
+        self.teleport_to(player, network.nodes[route[0]], current_time)
+        return True
+
+    def teleport_to(self, player, target_node, current_time):
         player.rect.center = target_node.position
         player.hitbox_rect.center = target_node.position
         player.last_hit_time = current_time
         player.last_portal_time = current_time
 
-        if player.game_ref and hasattr(player.game_ref, 'sounds'):
-            if 'teleport' in player.game_ref.sounds:
-                player.game_ref.sounds['teleport'].play()
-
-        return True
+        player.play_sound('teleport')
 
     # ===== DRAW =====
     def draw(self, screen, camera_offset):
@@ -90,46 +100,150 @@ class Portal(pygame.sprite.Sprite):
             pygame.draw.circle(screen, icon_color, pos + pygame.math.Vector2(self.rect.width/2, self.rect.height/2), 10)
 
 
-# ===== PORTAL NETWORK =====
-def create_portal_network(visible_sprites, camera, game_ref):
-    """Create circular doubly-linked portal network with sprites."""
-    global portal_network_created, existing_portal_group
-
-    if portal_network_created and existing_portal_group:
-        return existing_portal_group
+def load_portal_frames(width, height, portal_index):
+    frames = []
+    for i in range(6):
+        try:
+            frame = load_image(join(PORTAL_PATH, f'{i}.png'))
+            frame = pygame.transform.scale(frame, (width, height))
+        except:
+            frame = pygame.Surface((width, height), pygame.SRCALPHA)
+            color = [(150, 50, 250), (50, 150, 250), (250, 50, 150), (50, 250, 150)][portal_index % 4]
+            pygame.draw.ellipse(frame, (*color, 200), (0, 0, width, height))
+            pygame.draw.ellipse(frame, (*color, 100), (10, 10, width - 20, height - 20))
+        frames.append(frame)
+    return frames
 
-    portal_group = pygame.sprite.Group()
-    nodes = []
 
-    # Create nodes
-    for i, rect in enumerate(PORTAL_NODES):
-        left, top, right, bottom = rect
-        center = (left + (right - left) // 2, top + (bottom - top) // 2)
-        nodes.append(PortalNode(center, i))
-
-    # Link nodes circularly
-    for i, node in enumerate(nodes):
-        node.next = nodes[(i + 1) % len(nodes)]
-        node.prev = nodes[(i - 1) % len(nodes)]
-
-    # Create portal sprites
-    for node in nodes:
-        Portal(node, visible_sprites, portal_group, camera, game_ref)
-
-    portal_network_created = True
-    existing_portal_group = portal_group
-    return portal_group
+# ===== PORTAL NETWORK =====
+class PortalNetwork:
+    """Portal graph of one game: nodes, two-way links and shortest hop routes.
+
+    Routes are precomputed for every pair of portals (a breadth-first search
+    from each node), so traveling to any portal is a table lookup per hop.
+    """
+
+    def __init__(self, rects, edges):
+        self.nodes = []
+        for i, (left, top, right, bottom) in enumerate(rects):
+            center = (left + (right - left) // 2, top + (bottom - top) // 2)
+            node = PortalNode(center, i)
+            node.rect = (left, top, right, bottom)
+            self.nodes.append(node)
+
+        # E/Q follow the first link out of / into each node, any link can be traveled
+        for a, b in edges:
+            node_a, node_b = self.nodes[a], self.nodes[b]
+            if node_b not in node_a.neighbors:
+                node_a.neighbors.append(node_b)
+                node_b.neighbors.append(node_a)
+            if node_a.next is None:
+                node_a.next = node_b
+            if node_b.prev is None:
+                node_b.prev = node_a
+
+        self.group = pygame.sprite.Group()
+        self.compute_routes()
+
+    def compute_routes(self):
+        """next_hop[a][b]: first portal on the shortest route a -> b (-1 if unreachable)"""
+        count = len(self.nodes)
+        self.next_hop = [[-1] * count for _ in range(count)]
+        self.hops = [[-1] * count for _ in range(count)]
+
+        for start in range(count):
+            first_hop = self.next_hop[start]
+            hops = self.hops[start]
+            hops[start] = 0
+            first_hop[start] = start
+            frontier = [start]
+            while frontier:
+                following = []
+                for index in frontier:
+                    for neighbor in self.nodes[index].neighbors:
+                        target = neighbor.portal_index
+                        if hops[target] >= 0:
+                            continue
+                        hops[target] = hops[index] + 1
+                        # leaving start, the first hop is the neighbor itself
+                        first_hop[target] = target if index == start else first_hop[index]
+                        following.append(target)
+                frontier = following
+
+    def route(self, start, goal):
+        """Portal indices visited going from start to goal, empty if unreachable"""
+        if not (0 <= goal < len(self.nodes)) or self.hops[start][goal] <= 0:
+            return []
+        path = []
+        current = start
+        while current != goal:
+            current = self.next_hop[current][goal]
+            path.append(current)
+        return path
+
+
+def load_portal_layout(tmx_data):
+    """Portal rects and links from the map's portal object layer, config as fallback.
+
+    Objects in the layer are portals in order; a "links" property lists the
+    (1-based) portals it connects to, e.g. "2,4".
+    """
+    try:
+        layer = tmx_data.get_layer_by_name(PORTAL_LAYER) if tmx_data else None
+    except Exception:
+        layer = None
+    if not layer:
+        return PORTAL_NODES, PORTAL_EDGES
+
+    rects = []
+    edges = []
+    for i, obj in enumerate(layer):
+        rects.append((int(obj.x), int(obj.y), int(obj.x + obj.width), int(obj.y + obj.height)))
+        links = str(obj.properties.get("links", ""))
+        for link in links.split(","):
+            if link.strip().isdigit():
+                edges.append((i, int(link) - 1))
+
+    # drop links to missing portals and to the portal itself
+    edges = [(a, b) for a, b in edges if 0 <= b < len(rects) and a != b]
+    return rects, edges
+
+
+def create_portal_network(tmx_data, visible_sprites, camera, game_ref):
+    """Build this game's portal graph and its sprites"""
+    rects, edges = load_portal_layout(tmx_data)
+    network = PortalNetwork(rects, edges)
+    for node in network.nodes:
+        Portal(node, visible_sprites, network.group, camera, game_ref)
+    return network
+
+
+# ===== PREFETCH =====
+def portal_destinations(player, broad_phase):
+    """Where the portals within the player's reach lead (every linked portal).
+
+    Used to warm the far side of a jump before it happens.
+    """
+    destinations = []
+    nearby = broad_phase.query_radius(player.rect.center, player.portal_interaction_radius, PORTALS)
+    for portal in nearby:
+        for node in portal.node.neighbors:
+            if node.position not in destinations:
+                destinations.append(node.position)
+    return destinations
 
 
 # ===== PORTAL COLLISIONS =====
-def check_portal_collisions(portal_group, player, current_time):
+def check_portal_collisions(network, player, current_time, input_state):
     """Check if player can teleport through nearby portals."""
-    player.update_portal_detection(portal_group)
+    player.update_portal_detection(network.group)
     if not player.current_portal:
         return
 
-    keys = pygame.key.get_pressed()
-    if keys[pygame.K_e]:
+    target = input_state.portal_target
+    if target != NO_PORTAL_TARGET:
+        player.current_portal.travel(player, network, target, current_time)
+    elif input_state.held(PORTAL_NEXT):
         player.current_portal.try_teleport(player, "next", current_time)
-    elif keys[pygame.K_q]:
+    elif input_state.held(PORTAL_PREV):
         player.current_portal.try_teleport(player, "prev", current_time)
@@ -0,0 +1,94 @@
+# entities/progression.py
+from game.config import *
+
+# ===== CURVES =====
+# per-level value of a column, level 1 being the starting level
+def xp_curve(level, max_level):
+    """xp needed to leave the level"""
+    return PLAYER_XP_BASE + (level - 1) * PLAYER_XP_STEP
+
+
+def damage_curve(level, max_level):
+    damage_step = (PLAYER_MAX_DAMAGE - PLAYER_BASE_DAMAGE) / max(1, max_level - 1)
+    return round(PLAYER_BASE_DAMAGE + damage_step * (level - 1))
+
+
+def boost_cost_curve(level, max_level):
+    # cost reduction as level increases
+    if level == 1:
+        return BOOST_COST
+    return max(3, BOOST_COST - level * 0.4)
+
+
+def torpedo_cost_curve(level, max_level):
+    if level == 1:
+        return TORPEDO_COST
+    return max(5, TORPEDO_COST - level * 0.6)
+
+
+def hp_regen_curve(level, max_level):
+    """hp per second once out of combat"""
+    if level < HP_REGEN_LEVEL_REQUIRED:
+        return 0
+    hp_regen_increment = round(
+        (level - HP_REGEN_LEVEL_REQUIRED)
+        / max(1, max_level - HP_REGEN_LEVEL_REQUIRED)
+    )
+    return round(HP_REGEN_MIN + hp_regen_increment * (HP_REGEN_MAX - HP_REGEN_MIN))
+
+
+DEFAULT_CURVES = {
+    "xp_to_next": xp_curve,
+    "damage": damage_curve,
+    "boost_cost": boost_cost_curve,
+    "torpedo_cost": torpedo_cost_curve,
+    "hp_regen": hp_regen_curve,
+}
+
+
+def unlock_levels():
+    """ability -> level it unlocks at"""
+    return {
+        "hp_regen": HP_REGEN_LEVEL_REQUIRED,
+        "sonar": SONAR_LEVEL_REQUIRED,
+    }
+
+
+# ===== TABLE =====
+class ProgressionTable:
+    """Per-level rows (xp needed, damage, costs, regen, unlocked abilities)
+    computed once from config, indexed by level (index 0 is unused).
+
+    Columns come from curves, functions of (level, max_level); pass curves
+    to swap some of them for another progression. PLAYER_PROGRESSION lists
+    in config (or a settings file) replace a column's first values outright.
+    Each game builds its own table, so it follows the config (and overrides)
+    in effect when the game was created.
+    """
+    __slots__ = ("curves", "max_level", "xp_to_next", "damage", "boost_cost",
+                 "torpedo_cost", "hp_regen", "unlock_level", "unlocks")
+
+    def __init__(self, curves=None):
+        self.curves = dict(DEFAULT_CURVES)
+        if curves:
+            self.curves.update(curves)
+        self.build()
+
+    def build(self):
+        """(Re)compute every row from the current config"""
+        self.max_level = max_level = PLAYER_MAX_LEVEL
+        levels = range(1, max_level + 1)
+        for column, curve in self.curves.items():
+            values = [0] + [curve(level, max_level) for level in levels]
+            explicit = PLAYER_PROGRESSION.get(column, ())
+            values[1:1 + len(explicit)] = explicit[:max_level]
+            setattr(self, column, tuple(values))
+
+        self.unlock_level = unlock_levels()
+        self.unlocks = (frozenset(),) + tuple(
+            frozenset(ability for ability, required in self.unlock_level.items() if level >= required)
+            for level in levels
+        )
+
+    def unlocked(self, level, ability):
+        return ability in self.unlocks[level]
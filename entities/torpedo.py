@@ -1,314 +1,289 @@
 # entities/torpedo.py
-import pygame
-from os.path import join
 import math
+from array import array
+from os.path import join
+
+import pygame
+
 from game.config import *
-from entities.explosion import AnimatedExplosion
-
-class Torpedo(pygame.sprite.Sprite):
-    """Handles torpedo movement states, animation, trigger explosion animation, collision detection"""
-
-    def __init__(
-        self,
-        pos,
-        direction,
-        player_facing,
-        group,
-        collision_sprites,
-        explosion_frames,
-        explosion_group,
-        monster_group,
-        obstacle_group,
-        visible_sprites,
-        game_ref,
-        damage,
-        owner
-    ):
-        super().__init__(group)
-        self.monster_group = monster_group
-        self.owner = owner
-
-        # store player's facing direction
-        self.player_facing = player_facing
-
-        #store mouse direction
-        self.target_direction = direction.normalize()
-
-        # initial drop direction(purely horizontal based on player facing)
-        self.drop_direction = pygame.math.Vector2(-1,0) if player_facing == 'left' else pygame.math.Vector2(1,0)
-
-        # current direction starts as drop direction
-        self.current_direction = self.drop_direction.copy()
-        self.direction = self.drop_direction.copy()
-
-        # load frames based on direction
-        if player_facing == 'left':
-            torpedo_folder = RIGHT_TORPEDO_PATH
-            self.image_facing_left = True
-        else:
-            torpedo_folder = LEFT_TORPEDO_PATH
-            self.image_facing_left = False
-        
-        # load frames
-        self.frames = []
-        for i in range(5):
+from game.assets import load_image
+from game.events import DAMAGE, EXPLOSION, SOUND
+from game.spatial import WALLS, MONSTERS, OBSTACLES
+
+# ===== TORPEDO STATES =====
+DROPPING, FLOATING, ACCELERATING, ACTIVE = range(4)
+TORPEDO_STATES = ("dropping", "floating", "accelerating", "active")
+
+TORPEDO_FRAMES = 5
+GRAVITY = 0.15
+DRAG = 0.995
+
+
+def load_torpedo_atlas(angle_steps=TORPEDO_ANGLE_STEPS):
+    """Every torpedo frame pre-rotated in angle_steps buckets.
+
+    atlas[facing_left][frame][bucket] = (surface, half width, half height)
+    """
+    step = 360 / angle_steps
+    atlas = []
+    # torpedoes fired facing left use the right-pointing images (and vice versa)
+    for folder, base_angle in ((LEFT_TORPEDO_PATH, 180), (RIGHT_TORPEDO_PATH, 0)):
+        frames = []
+        for i in range(TORPEDO_FRAMES):
             try:
-                frame = pygame.image.load(
-                    join(torpedo_folder, f'{i}.png')
-                ).convert_alpha()
-                self.frames.append(frame)
+                frame = load_image(join(folder, f'{i}.png'))
             except Exception as e:
                 print(f"Error loading torpedo frame {i}: {e}")
                 frame = pygame.Surface((20, 8), pygame.SRCALPHA)
                 pygame.draw.rect(frame, (50, 150, 200), (0, 0, 20, 8))
                 pygame.draw.rect(frame, (100, 200, 255), (2, 2, 16, 4))
-                self.frames.append(frame)
-                
-        # preserve original frames for rotation
-        self.original_frames = []
-        for frame in self.frames:
-            self.original_frames.append(frame.copy())
-
-        # movement states
-        self.state = 'dropping'
-        self.state_timer = 0
-        self.drop_duration = TORPEDO_DROP_DURATION
-        self.float_duration = TORPEDO_FLOAT_DURATION
-        self.accel_duration = TORPEDO_ACCEL_DURATION
-        self.drop_speed = TORPEDO_DROP_SPEED
-        self.float_speed = TORPEDO_FLOAT_SPEED
-        self.max_speed = TORPEDO_SPEED
-        self.acceleration = TORPEDO_ACCELERATION
-
-        # damage
-        self.damage = damage
-        self.torpedo_damage_radius = TORPEDO_DAMAGE_RADIUS
-        
-        # collision & effects
-        self.collision_sprites = collision_sprites
-        self.obstacle_group = obstacle_group
-        self.explosion_frames = explosion_frames
-        self.explosion_group = explosion_group
-        self.visible_sprites = visible_sprites
+
+            rotations = []
+            for bucket in range(angle_steps):
+                rotated = pygame.transform.rotate(frame, -(bucket * step + base_angle))
+                rotations.append((rotated, rotated.get_width() / 2, rotated.get_height() / 2))
+            frames.append(rotations)
+        atlas.append(frames)
+    return atlas
+
+
+class TorpedoPool:
+    """Every live torpedo, stored as preallocated parallel arrays.
+
+    Launching fills the next free slot and removing one moves the last live
+    slot into the hole, so firing never allocates. The four flight phases
+    (dropping, floating, accelerating, active) are stepped for all torpedoes
+    in one loop and drawing goes through a shared atlas of pre-rotated frames
+    in a single blits() call.
+    """
+
+    def __init__(self, game_ref, capacity=TORPEDO_CAPACITY):
         self.game_ref = game_ref
+        self.broad_phase = game_ref.broad_phase
 
-        # movement & physics
-        self.pos = pygame.math.Vector2(pos)  # must be first
-        self.velocity = pygame.math.Vector2(0, 0)
-        self.gravity = pygame.math.Vector2(0, 0.15)
-        self.drag = 0.995
-
-        # Animation control
-        self.frame_index = 0
-        self.animation_speed = 0.2
-        self.animation_timer = 0
-
-        # initial frame setup
-        self.image = self.get_current_frame()  # uses self.pos internally
-        self.rect = self.image.get_rect(center=self.pos)
-
-        # state & collision flags
-        self.state = 'dropping'
-        self.state_timer = 0
-        self.alive = True
-        self.has_hit_something = False
-        self.z_layer = 2
-
-    # ===== ANIMATIONS =====
-    def get_current_frame(self):
-        frame = self.original_frames[int(self.frame_index)]
-        
-        if self.current_direction.length() > 0:
-            # calculate the angle in radians first
-            angle_rad = math.atan2(self.current_direction.y, self.current_direction.x)
-            # convert to degrees (pygame uses degrees for rotation)
-            angle_deg = math.degrees(angle_rad)
-            
-            # handle left-facing sprites differently
-            if not self.image_facing_left:  # Original sprite faces left
-                # for left-facing sprites, they're already 180 degrees rotated
-                angle_deg += 180
-            
-        else:
-            angle_deg = 0
-        
-        rotated_frame = pygame.transform.rotate(frame, -angle_deg)
-        return rotated_frame
-
-    def create_explosion(self):
-        """Spawn explosion animation at impact point."""
-        AnimatedExplosion(
-            self.explosion_frames,
-            self.rect.center,
-            [self.explosion_group, self.visible_sprites]
-        )
-
-    # ===== TORPEDO MOVEMENT =====
-    def update_state(self, dt):
-        """Handle movement logic based on the torpedo's current state with true 2D motion."""
-        if self.has_hit_something:
-            return
-            
-        self.state_timer += dt
-        
-        # advance animation frames
-        self.animation_timer += dt
-        if self.animation_timer >= self.animation_speed:
-            self.animation_timer = 0
-            self.frame_index = (self.frame_index + 1) % len(self.frames)
-        
-        # DROPPING STATE
-        if self.state == 'dropping':
-            self.velocity = self.drop_direction * self.drop_speed
-            self.velocity += self.gravity * dt
-            self.current_direction = self.drop_direction  # For rotation
-            
-            if self.state_timer >= self.drop_duration:
-                self.state = 'floating'
-                self.state_timer = 0
-
-        # FLOATING STATE  
-        elif self.state == 'floating':
-            # spherical linear interpolation (slerp) for smooth rotation
-            t = min(self.state_timer / self.float_duration, 1.0)
-            
-            # normalize both vectors
-            start = self.drop_direction.normalize()
-            end = self.target_direction.normalize()
-            
-            # calculate angle between vectors
-            dot = start.dot(end)
-            dot = max(-1, min(1, dot))  # Clamp
+        self.atlas = game_ref.assets.cached("torpedo_atlas", load_torpedo_atlas)
+        self.angle_steps = TORPEDO_ANGLE_STEPS
+        self.hit_rect = pygame.Rect(0, 0, 0, 0)
+
+        self.capacity = capacity
+        self.count = 0
+        self.next_id = 0
+
+        doubles = bytes(8 * capacity)
+        self.xs = array("d", doubles)
+        self.ys = array("d", doubles)
+        self.vxs = array("d", doubles)
+        self.vys = array("d", doubles)
+        self.target_xs = array("d", doubles)  # aim direction (unit)
+        self.target_ys = array("d", doubles)
+        self.dir_xs = array("d", doubles)  # current heading, used for rotation
+        self.dir_ys = array("d", doubles)
+        self.timers = array("d", doubles)  # time in the current state
+        self.anim_timers = array("d", doubles)
+        self.damages = array("d", doubles)
+        self.states = array("b", bytes(capacity))
+        self.frames = array("b", bytes(capacity))
+        self.facing_left = array("b", bytes(capacity))
+        self.ids = array("I", bytes(4 * capacity))  # stable identity for debug tools
+        self.owners = [None] * capacity
+
+    # ===== SLOTS =====
+    def launch(self, pos, direction, player_facing, damage, owner=None):
+        """Start a torpedo in its dropping phase, returns the slot or -1 if the pool is full"""
+        i = self.count
+        if i >= self.capacity:
+            return -1
+
+        target = pygame.math.Vector2(direction)
+        if target.length_squared():
+            target = target.normalize()
+        drop_x = -1.0 if player_facing == 'left' else 1.0
+
+        self.xs[i], self.ys[i] = pos
+        self.vxs[i] = self.vys[i] = 0.0
+        self.target_xs[i] = target.x
+        self.target_ys[i] = target.y
+        self.dir_xs[i] = drop_x
+        self.dir_ys[i] = 0.0
+        self.timers[i] = 0.0
+        self.anim_timers[i] = 0.0
+        self.damages[i] = damage
+        self.states[i] = DROPPING
+        self.frames[i] = 0
+        self.facing_left[i] = player_facing == 'left'
+        self.ids[i] = self.next_id
+        self.owners[i] = owner
+
+        self.next_id = (self.next_id + 1) & 0xFFFFFFFF
+        self.count = i + 1
+        return i
+
+    def remove(self, i):
+        """Free slot i by moving the last live torpedo into it"""
+        last = self.count - 1
+        if i != last:
+            for column in (
+                self.xs, self.ys, self.vxs, self.vys, self.target_xs, self.target_ys,
+                self.dir_xs, self.dir_ys, self.timers, self.anim_timers, self.damages,
+                self.states, self.frames, self.facing_left, self.ids, self.owners,
+            ):
+                column[i] = column[last]
+        self.owners[last] = None
+        self.count = last
+
+    def clear(self):
+        for i in range(self.count):
+            self.owners[i] = None
+        self.count = 0
+
+    # ===== MOVEMENT =====
+    def step(self, i, dt):
+        """Advance torpedo i through its flight phases (velocity & heading only)"""
+        state = self.states[i]
+        timer = self.timers[i] + dt
+        target_x = self.target_xs[i]
+        target_y = self.target_ys[i]
+        vx = self.vxs[i]
+        vy = self.vys[i]
+
+        # animation frames
+        anim = self.anim_timers[i] + dt
+        if anim >= 0.2:
+            anim = 0.0
+            self.frames[i] = (self.frames[i] + 1) % TORPEDO_FRAMES
+        self.anim_timers[i] = anim
+
+        if state == DROPPING:
+            drop_x = -1.0 if self.facing_left[i] else 1.0
+            vx = drop_x * TORPEDO_DROP_SPEED
+            vy = GRAVITY * dt
+            self.dir_xs[i] = drop_x
+            self.dir_ys[i] = 0.0
+            if timer >= TORPEDO_DROP_DURATION:
+                state = FLOATING
+                timer = 0.0
+
+        elif state == FLOATING:
+            # slerp from the drop direction to the aim
+            t = min(timer / TORPEDO_FLOAT_DURATION, 1.0)
+            start_x = -1.0 if self.facing_left[i] else 1.0
+            dot = max(-1.0, min(1.0, start_x * target_x))
             angle = math.acos(dot)
-            
-            if angle < 0.001:  # too close, use end direction
-                self.current_direction = end
+            if angle < 0.001:
+                dir_x, dir_y = target_x, target_y
             else:
-                # spherical interpolation
-                self.current_direction = (math.sin((1 - t) * angle) * start + 
-                                        math.sin(t * angle) * end) / math.sin(angle)
-                                    
-            # ,ove in current direction
-            self.velocity = self.current_direction * self.float_speed
-            
-            # add sine wave effect
-            perpendicular = pygame.math.Vector2(-self.current_direction.y, self.current_direction.x)
-            self.velocity += perpendicular * math.sin(self.state_timer * 8) * (self.float_speed * 0.5)
-            self.velocity += self.gravity * dt * 0.5
-            self.velocity *= self.drag
-            
-            if self.state_timer >= self.float_duration:
-                self.state = 'accelerating'
-                self.state_timer = 0
-
-        # ACCELERATING STATE
-        elif self.state == 'accelerating':
-            # use target_direction(mouse), not self.direction
-            self.current_direction = self.target_direction
-            
-            # accelerate in target direction
-            self.velocity += self.target_direction * self.acceleration * dt
-            self.velocity += self.gravity * dt
-            self.velocity *= self.drag
-            
-            if self.velocity.length() > self.max_speed:
-                self.velocity = self.velocity.normalize() * self.max_speed
-                
-            if self.state_timer >= self.accel_duration:
-                self.state = 'active'
-
-        # ACTIVE STATE  
-        elif self.state == 'active':
-            # continue in target direction
-            if self.velocity.length() < self.max_speed:
-                self.velocity += self.target_direction * self.acceleration * 0.5 * dt
-            self.velocity += self.gravity * dt
-            self.velocity *= self.drag
-            
-            if self.velocity.length() < self.max_speed * 0.7:
-                self.velocity = self.target_direction * self.max_speed * 0.7
-    
-        # if self.velocity.length() > 0:
-        #     self.direction = self.velocity.normalize()
-
-    # ===== CHECK COLLISIONS (WALLS & MONSTERS) =====
-    def check_collision(self):
-        """Detect collision with enemies or environment."""
-        if self.has_hit_something:
-            return False
-        
-        torpedo_center = pygame.math.Vector2(self.rect.center)
+                sin_angle = math.sin(angle)
+                a = math.sin((1 - t) * angle) / sin_angle
+                b = math.sin(t * angle) / sin_angle
+                dir_x = a * start_x + b * target_x
+                dir_y = b * target_y
+            self.dir_xs[i] = dir_x
+            self.dir_ys[i] = dir_y
+
+            # drift along the heading with a sine wobble
+            wobble = math.sin(timer * 8) * (TORPEDO_FLOAT_SPEED * 0.5)
+            vx = (dir_x * TORPEDO_FLOAT_SPEED - dir_y * wobble) * DRAG
+            vy = (dir_y * TORPEDO_FLOAT_SPEED + dir_x * wobble + GRAVITY * dt * 0.5) * DRAG
+            if timer >= TORPEDO_FLOAT_DURATION:
+                state = ACCELERATING
+                timer = 0.0
+
+        elif state == ACCELERATING:
+            self.dir_xs[i] = target_x
+            self.dir_ys[i] = target_y
+            vx = (vx + target_x * TORPEDO_ACCELERATION * dt) * DRAG
+            vy = (vy + target_y * TORPEDO_ACCELERATION * dt + GRAVITY * dt) * DRAG
+            speed = math.hypot(vx, vy)
+            if speed > TORPEDO_SPEED:
+                vx = vx / speed * TORPEDO_SPEED
+                vy = vy / speed * TORPEDO_SPEED
+            if timer >= TORPEDO_ACCEL_DURATION:
+                state = ACTIVE
+
+        else:  # ACTIVE
+            if math.hypot(vx, vy) < TORPEDO_SPEED:
+                vx += target_x * TORPEDO_ACCELERATION * 0.5 * dt
+                vy += target_y * TORPEDO_ACCELERATION * 0.5 * dt
+            vx *= DRAG
+            vy = (vy + GRAVITY * dt) * DRAG
+            if math.hypot(vx, vy) < TORPEDO_SPEED * 0.7:
+                vx = target_x * TORPEDO_SPEED * 0.7
+                vy = target_y * TORPEDO_SPEED * 0.7
+
+        self.states[i] = state
+        self.timers[i] = timer
+        self.vxs[i] = vx
+        self.vys[i] = vy
+
+    def frame_at(self, i):
+        """Atlas entry for torpedo i's current frame and heading"""
+        dir_x = self.dir_xs[i]
+        dir_y = self.dir_ys[i]
+        if dir_x or dir_y:
+            angle = math.degrees(math.atan2(dir_y, dir_x))
+            bucket = round(angle * self.angle_steps / 360) % self.angle_steps
+        else:
+            bucket = 0
+        return self.atlas[self.facing_left[i]][self.frames[i]][bucket]
+
+    # ===== COLLISIONS =====
+    def check_collision(self, i):
+        """Queue damage/explosion events for torpedo i, True if it hit something"""
+        x = self.xs[i]
+        y = self.ys[i]
+        surf, half_w, half_h = self.frame_at(i)
+        rect = self.hit_rect
+        rect.size = surf.get_size()
+        rect.center = (x, y)
+        broad_phase = self.broad_phase
+        events = self.game_ref.events
+
+        # monster splash damage, applied when events drain
         hit_any = False
+        for monster in broad_phase.query_radius(rect.center, TORPEDO_DAMAGE_RADIUS, MONSTERS):
+            events.emit(DAMAGE, self.owners[i], monster, self.damages[i], rect.center)
+            hit_any = True
 
-        # monster splash damage
-        if hasattr(self, 'monster_group') and self.monster_group:
-            for monster in self.monster_group:
-                monster_center = pygame.math.Vector2(monster.rect.center)
-                distance = torpedo_center.distance_to(monster_center)
-
-                if distance <= self.torpedo_damage_radius:
-                    # apply damdage and get xp
-                    xp = monster.take_damage(self.damage)
-                    if xp > 0 and self.owner:
-                        self.owner.add_xp(xp)
-                    hit_any = True
-        
-        # check wall collision
-        if hasattr(self, 'collision_sprites'):
-            hitbox = self.rect.inflate(-15, -15) 
-            
-            for sprite in self.collision_sprites:
-                if hasattr(sprite, 'rect') and hitbox.colliderect(sprite.rect):
-                    self.create_explosion()
-                    self.has_hit_something = True
-                    self.velocity.update(0, 0)
-                    if self.game_ref and hasattr(self.game_ref, 'sounds'):
-                        self.game_ref.sounds['torpedo_hit'].play()
-                    return True
-        
-        # check obstacle collisions
-        if hasattr(self, 'obstacle_group') and self.obstacle_group:
-            obstacle_hits = pygame.sprite.spritecollide(self, self.obstacle_group, False)
-            if obstacle_hits:
-                self.create_explosion()
-                self.has_hit_something = True
-                self.velocity.update(0, 0)
-                if self.game_ref and hasattr(self.game_ref, 'sounds'):
-                    self.game_ref.sounds['torpedo_hit'].play()
-                return True
-        
-        # handle hit
-        if hit_any:
-            self.has_hit_something = True
-            self.create_explosion()
-            self.velocity.update(0, 0)
-            if self.game_ref and hasattr(self.game_ref, 'sounds'):
-                self.game_ref.sounds['torpedo_hit'].play()
+        # walls, obstacles, or anything caught in the splash
+        if (
+            hit_any
+            or broad_phase.collides(rect.inflate(-15, -15), WALLS)
+            or broad_phase.collides(rect, OBSTACLES)
+        ):
+            events.emit(EXPLOSION, self.owners[i], pos=rect.center)
+            events.emit(SOUND, self.owners[i], value='torpedo_hit', pos=rect.center)
             return True
-
         return False
 
+    # ===== UPDATE & DRAW =====
     def update(self, dt):
-        if not self.alive:
-            self.kill()
-            return
-            
-        # update movement and animation    
-        self.update_state(dt)
-        self.pos += self.velocity * dt
-        
-        # update image based on current frame and rotation
-        self.image = self.get_current_frame()
-        self.rect = self.image.get_rect(center=self.pos)
-
-        if self.check_collision():
-            self.alive = False
-            self.kill()
-            return
-        
-        # cleanup if far outside world bounds
-        if (self.rect.right < WORLD_LEFT or
-            self.rect.left > WORLD_RIGHT or
-            self.rect.bottom < -3520 or
-            self.rect.top > WORLD_BOTTOM):
-            self.kill()
\ No newline at end of file
+        i = 0
+        while i < self.count:
+            self.step(i, dt)
+            self.xs[i] += self.vxs[i] * dt
+            self.ys[i] += self.vys[i] * dt
+
+            x = self.xs[i]
+            y = self.ys[i]
+            if (
+                self.check_collision(i)
+                # far outside the world
+                or x < WORLD_LEFT or x > WORLD_RIGHT
+                or y < -3520 or y > WORLD_BOTTOM
+            ):
+                self.remove(i)  # the last torpedo moved into slot i, step it next
+                continue
+            i += 1
+
+    def draw(self, screen, camera_offset):
+        offset_x, offset_y = camera_offset
+        width, height = screen.get_size()
+        batch = []
+        for i in range(self.count):
+            surf, half_w, half_h = self.frame_at(i)
+            left = self.xs[i] - half_w - offset_x
+            top = self.ys[i] - half_h - offset_y
+            if -2 * half_w < left < width and -2 * half_h < top < height:
+                batch.append((surf, (left, top)))
+        if batch:
+            screen.blits(batch, doreturn=False)
@@ -0,0 +1,49 @@
+# game/assets.py
+import pygame
+
+from game.config import *
+from game.map import MapSystem
+from game.navigation import NavigationGrid
+from game.spatial import SpatialGrid, WALLS
+
+
+def load_image(path):
+    """Load an image, converted for fast blitting when there is a display.
+
+    Headless games have no display to convert for, so they keep the plain
+    surface (convert_alpha() would raise).
+    """
+    image = pygame.image.load(path)
+    if pygame.display.get_surface() is not None:
+        return image.convert_alpha()
+    return image
+
+
+class SharedAssets:
+    """Read-only data that any number of GameStates in one process can share.
+
+    Holds the parsed map with its wall sprites, the walkability grid, the
+    static wall grid used by the broad phase, and every frame list loaded so
+    far. None of it changes after it is built, so extra simulations skip
+    the map parsing and image decoding entirely.
+    """
+
+    def __init__(self):
+        self.map_system = MapSystem()
+        self.nav_grid = NavigationGrid(
+            self.map_system.collision_sprites,
+            self.map_system.map_width,
+            self.map_system.map_height
+        )
+        self.walls = SpatialGrid(SPATIAL_STATIC_CELL_SIZE)
+        for sprite in self.map_system.collision_sprites:
+            self.walls.insert(sprite, sprite.rect, WALLS)
+
+        self.cache = {}  # key -> loaded frames, atlases, icons...
+
+    def cached(self, key, loader, *args):
+        """The asset stored under key, built with loader(*args) on first use"""
+        asset = self.cache.get(key)
+        if asset is None:
+            asset = self.cache[key] = loader(*args)
+        return asset
@@ -0,0 +1,129 @@
+# game/audio.py
+import pygame
+from game.config import *
+
+
+class AudioManager:
+    """Owns the mixer channels and decides which sound effects actually play.
+
+    Every request goes through voice caps, a retrigger interval, distance
+    culling and priority-based channel stealing, so the cost of a play call
+    depends on the channel count and not on how many entities request it.
+    """
+
+    def __init__(self, sound_effects=SOUND_EFFECTS, channel_count=AUDIO_CHANNELS):
+        self.sound_effects = sound_effects
+        self.listener = None  # sprite used for distance culling (the player)
+        self.enabled = pygame.mixer.get_init() is not None
+
+        # loaded sounds & per-sound settings
+        self.sounds = {}
+        self.settings = {}
+        self.last_play_time = {}
+
+        # channel pool: each slot tracks (sound name, priority, start time)
+        self.channels = []
+        self.channel_owner = []
+
+        if self.enabled:
+            pygame.mixer.set_num_channels(channel_count)
+            pygame.mixer.set_reserved(channel_count)  # nothing else may grab our channels
+            self.channels = [pygame.mixer.Channel(i) for i in range(channel_count)]
+            self.channel_owner = [None] * channel_count
+
+        self.load_sounds()
+
+    # ===== LOADING =====
+    def load_sounds(self):
+        """Load every configured sound effect, skipping the ones that fail"""
+        for name, data in self.sound_effects.items():
+            self.settings[name] = {
+                "voices": data.get("voices", 1),
+                "interval": data.get("interval", 0),
+                "priority": data.get("priority", 1),
+                "volume": data.get("volume", 1.0),
+                "max_distance": data.get("max_distance", SFX_MAX_DISTANCE),
+            }
+            self.last_play_time[name] = -9999
+
+            if not self.enabled:
+                continue
+            try:
+                self.sounds[name] = pygame.mixer.Sound(data["path"])
+            except Exception as e:
+                print(f"Failed to load audio '{name}': {e}")
+
+    # ===== PLAYBACK =====
+    def play(self, name, pos=None):
+        """Play a sound effect, returns the channel used or None if it was culled"""
+        sound = self.sounds.get(name)
+        if sound is None:
+            return None
+
+        settings = self.settings[name]
+        current_time = pygame.time.get_ticks()
+
+        # retrigger throttle
+        if current_time - self.last_play_time[name] < settings["interval"]:
+            return None
+
+        # distance culling & attenuation
+        volume = settings["volume"]
+        if pos is not None and self.listener is not None:
+            dx = pos[0] - self.listener.rect.centerx
+            dy = pos[1] - self.listener.rect.centery
+            distance_sq = dx * dx + dy * dy
+            max_distance = settings["max_distance"]
+            if distance_sq >= max_distance * max_distance:
+                return None
+            volume *= 1 - (distance_sq ** 0.5) / max_distance
+
+        index = self.find_channel(name, settings)
+        if index is None:
+            return None
+
+        channel = self.channels[index]
+        channel.play(sound)
+        channel.set_volume(volume)
+        self.channel_owner[index] = (name, settings["priority"], current_time)
+        self.last_play_time[name] = current_time
+        return channel
+
+    def find_channel(self, name, settings):
+        """Pick a free channel, or steal the weakest one the new sound outranks"""
+        voices = 0
+        free_index = None
+        steal_index = None
+        steal_key = None
+
+        for i, channel in enumerate(self.channels):
+            owner = self.channel_owner[i]
+            if owner is None or not channel.get_busy():
+                self.channel_owner[i] = None
+                if free_index is None:
+                    free_index = i
+                continue
+
+            owner_name, owner_priority, owner_start = owner
+            if owner_name == name:
+                voices += 1
+
+            # lowest priority first, then the oldest sound
+            key = (owner_priority, owner_start)
+            if steal_key is None or key < steal_key:
+                steal_key = key
+                steal_index = i
+
+        if voices >= settings["voices"]:
+            return None
+        if free_index is not None:
+            return free_index
+        if steal_key is not None and steal_key[0] <= settings["priority"]:
+            self.channels[steal_index].stop()
+            return steal_index
+        return None
+
+    def stop_all(self):
+        for i, channel in enumerate(self.channels):
+            channel.stop()
+            self.channel_owner[i] = None
@@ -0,0 +1,245 @@
+# game/batch.py
+import os
+import sys
+import csv
+import json
+import time
+import argparse
+import itertools
+import contextlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from game.config import *
+from game.settings import apply_overrides, load_settings, merge_override, rebuild_tables
+
+# set once per worker process by init_worker()
+worker_assets = None
+
+
+# ===== SINGLE RUN =====
+def init_worker():
+    """Load the shared map & frames once per worker process"""
+    global worker_assets
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    from game.assets import SharedAssets
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        worker_assets = SharedAssets()
+
+
+def run_simulation(job):
+    """Play one headless game with the bot under job's overrides, return its metrics"""
+    restore = apply_overrides(job["overrides"])
+    try:
+        # same hooks as a settings reload, for tables built at import time
+        rebuild_tables()
+        # gameplay prints (deaths, sonar...) would flood the terminal
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            return simulate(job)
+    finally:
+        restore()
+        rebuild_tables()
+
+
+def simulate(job):
+    from game.gamestate import GameState
+    from game.bot import BotController
+    from game.events import KILL, DEATH
+
+    seed = job["seed"]
+    game_state = GameState(seed=seed, controller=BotController(seed), assets=worker_assets)
+    clock = game_state.clock
+
+    kills = {}
+    deaths = []
+
+    def on_kill(killer, victim, xp, pos):
+        kills[victim.enemy_type] = kills.get(victim.enemy_type, 0) + 1
+
+    def on_death(source, target, value, pos):
+        deaths.append(clock.seconds)
+
+    game_state.events.subscribe(KILL, on_kill)
+    game_state.events.subscribe(DEATH, on_death)
+
+    ticks = int(job["duration"] / BATCH_TICK)
+    sample_every = max(1, round(BATCH_SAMPLE_INTERVAL / BATCH_TICK))
+    population = []
+    tick_time = 0.0
+
+    update = game_state.update
+    perf_counter = time.perf_counter
+    for tick in range(ticks):
+        if tick % sample_every == 0:
+            population.append(len(game_state.enemy_sprites))
+        start = perf_counter()
+        update(BATCH_TICK)
+        tick_time += perf_counter() - start
+
+    player = game_state.player
+    return {
+        "run": job["run"],
+        "seed": seed,
+        "overrides": job["overrides"],
+        "time_to_death": deaths[0] if deaths else None,
+        "deaths": len(deaths),
+        "level": player.level,
+        "xp": player.xp,
+        "kills": kills,
+        "population": population,
+        "avg_tick_ms": tick_time / max(1, ticks) * 1000,
+        "ticks": ticks,
+    }
+
+
+# ===== BATCH =====
+def make_jobs(runs, seed, duration, overrides=None, sweep=None):
+    """runs games (seeds seed, seed + 1...) for every combination of sweep values"""
+    overrides = overrides or {}
+    sweep = sweep or {}
+    names = list(sweep)
+    jobs = []
+    for values in itertools.product(*(sweep[name] for name in names)):
+        combo = dict(overrides)
+        combo.update(zip(names, values))
+        for i in range(runs):
+            jobs.append({
+                "run": len(jobs),
+                "seed": seed + i,
+                "duration": duration,
+                "overrides": combo,
+            })
+    return jobs
+
+
+class ResultsWriter:
+    """Streams one CSV row per finished run, one column per metric.
+
+    Kills get a column per monster type and the population a column per
+    sample time, so every run has the same columns.
+    """
+
+    def __init__(self, path, duration, kill_types=None):
+        samples = int(duration / BATCH_SAMPLE_INTERVAL + 0.999)
+        self.kill_types = list(kill_types or MONSTER_TYPES)
+        self.sample_times = [int(i * BATCH_SAMPLE_INTERVAL) for i in range(samples)]
+        self.columns = (
+            ["run", "seed", "overrides", "time_to_death", "deaths", "level", "xp", "kills"]
+            + [f"kills_{enemy_type}" for enemy_type in self.kill_types]
+            + [f"population_{t}s" for t in self.sample_times]
+            + ["avg_tick_ms", "ticks"]
+        )
+        self.file = open(path, "w", newline="")
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(self.columns)
+
+    def write(self, result):
+        kills = result["kills"]
+        population = result["population"] + [""] * (len(self.sample_times) - len(result["population"]))
+        time_to_death = result["time_to_death"]
+        self.writer.writerow(
+            [
+                result["run"], result["seed"], json.dumps(result["overrides"], sort_keys=True),
+                "" if time_to_death is None else f"{time_to_death:.2f}",
+                result["deaths"], result["level"], result["xp"], sum(kills.values()),
+            ]
+            + [kills.get(enemy_type, 0) for enemy_type in self.kill_types]
+            + population[:len(self.sample_times)]
+            + [f"{result['avg_tick_ms']:.3f}", result["ticks"]]
+        )
+        self.file.flush()  # partial results survive an interrupted sweep
+
+    def close(self):
+        self.file.close()
+
+
+def job_monster_types(jobs):
+    """Every monster type any job can spawn, with its MONSTER_TYPES override merged in"""
+    types = {}
+    for job in jobs:
+        merged = merge_override(MONSTER_TYPES, job["overrides"].get("MONSTER_TYPES", {}))
+        types.update(dict.fromkeys(merged))
+    return list(types)
+
+
+def run_batch(jobs, path=BATCH_RESULTS_PATH, workers=None, duration=BATCH_DURATION):
+    """Spread jobs over a process pool, writing each result as it arrives"""
+    writer = ResultsWriter(path, duration, job_monster_types(jobs))
+    start = time.perf_counter()
+    done = 0
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as pool:
+            futures = [pool.submit(run_simulation, job) for job in jobs]
+            for future in as_completed(futures):
+                writer.write(future.result())
+                done += 1
+                print(f"\r{done}/{len(jobs)} runs", end="", flush=True)
+    finally:
+        writer.close()
+    print(f"\nWrote {done} runs to {path} in {time.perf_counter() - start:.1f}s")
+
+
+# ===== CHECKS =====
+def check_overrides(seed=1, duration=30.0):
+    """Run a PLAYER_XP_BASE sweep back to back in one process, the way a
+    single worker would, and make sure the override reaches the level the
+    bot gets to (tables built from config must not keep the first job's
+    values). Returns True when it does.
+    """
+    init_worker()
+    jobs = make_jobs(1, seed, duration, sweep={"PLAYER_XP_BASE": [10, 200]})
+    levels = [run_simulation(job)["level"] for job in jobs]
+    print(f"PLAYER_XP_BASE 10 -> level {levels[0]}, 200 -> level {levels[1]}")
+    return levels[0] > levels[1]
+
+
+# ===== CLI =====
+def parse_assignment(text):
+    """NAME=JSON -> (NAME, value)"""
+    name, _, value = text.partition("=")
+    if not name or not value:
+        raise argparse.ArgumentTypeError(f"expected NAME=JSON, got {text!r}")
+    try:
+        return name, json.loads(value)
+    except json.JSONDecodeError as e:
+        raise argparse.ArgumentTypeError(f"{name}: {e}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless bot runs for balance sweeps")
+    parser.add_argument("--runs", type=int, default=10, help="games per parameter combination")
+    parser.add_argument("--seed", type=int, default=1, help="seed of the first run")
+    parser.add_argument("--duration", type=float, default=BATCH_DURATION, help="game seconds per run")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--settings", metavar="PATH", help="settings file (.toml/.json) applied to every run")
+    parser.add_argument("--set", type=parse_assignment, action="append", default=[], metavar="NAME=JSON",
+                        help='config override for every run, e.g. MONSTER_TYPES=\'{"squid": {"hp": 150}}\'')
+    parser.add_argument("--sweep", type=parse_assignment, action="append", default=[], metavar="NAME=JSON_LIST",
+                        help="run every value in the list, e.g. PLAYER_XP_STEP=[15,25,35]")
+    parser.add_argument("--out", default=BATCH_RESULTS_PATH, help="CSV results file")
+    parser.add_argument("--check", action="store_true", help="only check that overrides reach consecutive runs in one worker")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        ok = check_overrides(args.seed)
+        print("overrides reach every run" if ok else "FAILED: overrides did not change the level reached")
+        sys.exit(0 if ok else 1)
+
+    for name, values in args.sweep:
+        if not isinstance(values, list):
+            parser.error(f"--sweep {name} needs a JSON list")
+
+    overrides = {}
+    if args.settings:
+        try:
+            overrides.update(load_settings(args.settings))
+        except (OSError, ValueError) as e:
+            parser.error(f"--settings {args.settings}: {e}")
+    for name, value in args.set:
+        overrides[name] = merge_override(overrides.get(name), value)
+
+    jobs = make_jobs(args.runs, args.seed, args.duration, overrides, dict(args.sweep))
+    run_batch(jobs, args.out, args.workers, args.duration)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+# game/bot.py
+import random
+
+from game.config import *
+from game.input import (
+    InputState, with_portal_target,
+    MOVE_UP, MOVE_DOWN, MOVE_LEFT, MOVE_RIGHT, FIRE, SONAR,
+)
+from game.navigation import FlowField
+from game.spatial import MONSTERS
+
+# ===== TASKS =====
+# a script is a list of (task, argument) steps run in order:
+#   ("explore", seconds)  roam random waypoints (seconds=None: forever)
+#   ("hunt", seconds)     chase and fight whatever is nearby
+#   ("goto", (x, y))      walk to a world position
+#   ("portal", index)     walk to the nearest portal and travel to portal index
+EXPLORE, HUNT, GOTO, PORTAL = range(4)
+TASK_CODES = {
+    "explore": EXPLORE,
+    "hunt": HUNT,
+    "goto": GOTO,
+    "portal": PORTAL,
+}
+
+DEFAULT_SCRIPT = (("explore", None),)
+
+
+def compile_script(script):
+    """Task names to codes"""
+    return [(TASK_CODES[task], argument) for task, argument in script]
+
+
+def move_buttons(dx, dy):
+    """Movement buttons that best follow a (not necessarily unit) direction"""
+    buttons = 0
+    threshold = max(abs(dx), abs(dy)) * 0.4
+    if dx > threshold:
+        buttons |= MOVE_RIGHT
+    elif dx < -threshold:
+        buttons |= MOVE_LEFT
+    if dy > threshold:
+        buttons |= MOVE_DOWN
+    elif dy < -threshold:
+        buttons |= MOVE_UP
+    return buttons
+
+
+def clear_line(grid, start, end):
+    """True if no blocked navigation cell lies on the segment start -> end"""
+    x, y = start
+    dx, dy = end[0] - x, end[1] - y
+    steps = int(max(abs(dx), abs(dy)) // (grid.cell_size / 2)) + 1
+    blocked = grid.blocked
+    for step in range(steps + 1):
+        cell = grid.cell_index(x + dx * step / steps, y + dy * step / steps)
+        if cell >= 0 and blocked[cell]:
+            return False
+    return True
+
+
+class BotController:
+    """Autopilot that plays through the input layer, like a keyboard would.
+
+    Movement follows a flow field over the map's navigation grid toward the
+    current waypoint, so walls are walked around instead of into. Combat
+    runs alongside whatever the script is doing: the nearest awake monster
+    is aimed at through the mouse position (which the player turns into
+    aim_direction) and fired at, with a little lead on its movement. Sonar
+    is pinged once unlocked when nothing is in sight, and portal steps walk
+    to a portal and request travel like the number keys do.
+
+    The bot draws from its own random stream, so the game's streams see the
+    same numbers they would with a human playing.
+    """
+
+    def __init__(self, seed=0, script=DEFAULT_SCRIPT, loop=True):
+        self.rng = random.Random(f"{seed}:bot")
+        self.script = compile_script(script)
+        self.loop = loop  # start over when the script runs out
+        self.step = -1
+        self.task = None
+        self.argument = None
+        self.task_started = 0.0
+
+        self.field = None  # flow field toward the waypoint, built on first poll
+        self.waypoint = None
+        self.trip = None  # portal index an explore step is traveling to
+        self.last_pos = None
+        self.stuck_since = None
+        self.detour = 0  # random movement buttons used to get unstuck
+        self.detour_until = 0.0
+
+    # ===== INPUT =====
+    def poll(self, game_state):
+        player = game_state.player
+        if player.is_dead:
+            self.last_pos = None
+            return InputState()
+
+        if self.field is None:
+            grid = game_state.nav_grid
+            self.field = FlowField(grid, radius=max(grid.cols, grid.rows), lookahead=2)
+        if self.task is None:
+            self.next_task(game_state)
+
+        pos = player.hitbox_rect.center
+        now = game_state.clock.seconds
+        target = self.nearest_monster(game_state, pos)
+
+        buttons, portal_target = self.run_task(game_state, pos, now, target)
+        if self.is_stuck(pos, now, buttons):
+            # wiggle free, and pick another spot if it was a roaming waypoint
+            self.detour = move_buttons(self.rng.uniform(-1, 1), self.rng.uniform(-1, 1))
+            self.detour_until = now + BOT_DETOUR_TIME
+            if self.task in (EXPLORE, HUNT):
+                self.waypoint = None
+        if now < self.detour_until:
+            buttons = self.detour
+
+        # combat, whatever the task
+        if target:
+            aim_x, aim_y = self.lead(target)
+            buttons |= FIRE
+        else:
+            # look where it's going
+            dx, dy = self.move_direction(pos)
+            length = max(abs(dx), abs(dy), 1e-9)
+            aim_x, aim_y = pos[0] + dx / length * 100, pos[1] + dy / length * 100
+            if self.sonar_ready(player, now):
+                buttons |= SONAR
+
+        if portal_target is not None:
+            buttons = with_portal_target(buttons, portal_target)
+
+        self.last_pos = pos
+        # aim goes through the mouse, in screen space like a real cursor
+        offset = game_state.camera.offset
+        return InputState(buttons, int(aim_x - offset.x), int(aim_y - offset.y))
+
+    def close(self):
+        pass
+
+    # ===== SCRIPT =====
+    def next_task(self, game_state):
+        self.step += 1
+        if self.step >= len(self.script):
+            if not self.loop or not self.script:
+                self.script = compile_script(DEFAULT_SCRIPT)
+            self.step = 0
+        self.task, self.argument = self.script[self.step]
+        self.task_started = game_state.clock.seconds
+        self.waypoint = None
+        self.trip = None
+
+    def run_task(self, game_state, pos, now, target):
+        """Movement buttons (and portal travel request) for the current step"""
+        task = self.task
+        argument = self.argument
+        elapsed = now - self.task_started
+
+        if task == HUNT or (task == EXPLORE and target):
+            if argument is not None and elapsed >= argument:
+                self.next_task(game_state)
+            if target:
+                return self.engage(pos, target), None
+            return self.roam(game_state, pos), None
+
+        if task == EXPLORE:
+            if argument is not None and elapsed >= argument:
+                self.next_task(game_state)
+            if self.trip is not None:
+                buttons, portal_target, done = self.travel(game_state, pos, self.trip)
+                if done:
+                    self.trip = None
+                return buttons, portal_target
+            return self.roam(game_state, pos), None
+
+        if task == GOTO:
+            if self.distance_sq(pos, argument) <= BOT_ARRIVE_RADIUS ** 2:
+                self.next_task(game_state)
+                return 0, None
+            return self.walk_to(argument, pos), None
+
+        # PORTAL
+        buttons, portal_target, done = self.travel(game_state, pos, argument)
+        if done:
+            self.next_task(game_state)
+        return buttons, portal_target
+
+    def travel(self, game_state, pos, index):
+        """Walk to the nearest portal and travel to portal index: (buttons, travel request, done)"""
+        network = game_state.portal_network
+        if not network or not 0 <= index < len(network.nodes):
+            return 0, None, True
+        if self.distance_sq(pos, network.nodes[index].position) <= BOT_ARRIVE_RADIUS ** 2:
+            return 0, None, True  # arrived (or started) there
+
+        portal = game_state.player.current_portal
+        if portal:
+            if not network.route(portal.node.portal_index, index):
+                return 0, None, True  # no way there from here
+            # standing in a portal: wait out the cooldown and travel
+            return 0, index, False
+
+        nearest = min(network.nodes, key=lambda node: self.distance_sq(pos, node.position))
+        return self.walk_to(nearest.position, pos), None, False
+
+    # ===== MOVEMENT =====
+    def roam(self, game_state, pos):
+        if self.waypoint is None or self.distance_sq(pos, self.waypoint) <= BOT_ARRIVE_RADIUS ** 2:
+            network = game_state.portal_network
+            if network and network.nodes and self.rng.random() < BOT_PORTAL_CHANCE:
+                # now and then explore through a portal instead
+                self.trip = self.rng.randrange(len(network.nodes))
+            self.waypoint = self.random_waypoint(game_state.nav_grid)
+        return self.walk_to(self.waypoint, pos)
+
+    def walk_to(self, goal, pos):
+        self.waypoint = goal
+        self.field.update(goal)
+        dx, dy = self.move_direction(pos)
+        return move_buttons(dx, dy)
+
+    def move_direction(self, pos):
+        """Next step toward the waypoint around walls, straight when close"""
+        if self.waypoint is None:
+            return (0, 0)
+        direction = self.field.direction_at(pos)
+        if direction is not None:
+            return direction.x, direction.y
+        return self.waypoint[0] - pos[0], self.waypoint[1] - pos[1]
+
+    def engage(self, pos, target):
+        """Close in on a target, backing off once it gets too close"""
+        target_x, target_y = target.hitbox_rect.center
+        dx, dy = target_x - pos[0], target_y - pos[1]
+        if dx * dx + dy * dy < BOT_KEEP_DISTANCE ** 2:
+            return move_buttons(-dx, -dy)
+        return move_buttons(dx, dy)
+
+    def random_waypoint(self, grid):
+        """A random open cell below the surface"""
+        min_row = WORLD_TOP // grid.cell_size + 1
+        for _ in range(50):
+            cell = self.rng.randrange(min_row * grid.cols, grid.cols * grid.rows)
+            if not grid.blocked[cell]:
+                return grid.cell_center(cell)
+        return grid.cell_center(cell)
+
+    def is_stuck(self, pos, now, buttons):
+        """True once the bot tried to move but stayed put for BOT_STUCK_TIME"""
+        if not buttons or pos != self.last_pos:
+            self.stuck_since = None
+            return False
+        if self.stuck_since is None:
+            self.stuck_since = now
+        if now - self.stuck_since >= BOT_STUCK_TIME:
+            self.stuck_since = None
+            return True
+        return False
+
+    # ===== COMBAT =====
+    def nearest_monster(self, game_state, pos):
+        """Closest awake monster in range that a torpedo could reach"""
+        x, y = pos
+        candidates = []
+        for monster in game_state.broad_phase.query_radius(pos, BOT_ENGAGE_RANGE, MONSTERS):
+            if monster.alive and not monster.asleep:
+                monster_x, monster_y = monster.hitbox_rect.center
+                candidates.append(((monster_x - x) ** 2 + (monster_y - y) ** 2, monster))
+        candidates.sort(key=lambda candidate: candidate[0])
+        for _, monster in candidates[:BOT_SIGHT_CHECKS]:
+            if clear_line(game_state.nav_grid, pos, monster.hitbox_rect.center):
+                return monster
+        return None
+
+    def lead(self, monster):
+        """Where to aim so a torpedo meets the monster, roughly"""
+        x, y = monster.hitbox_rect.center
+        speed = monster.speed * monster.speed_scale * BOT_AIM_LEAD
+        return x + monster.direction.x * speed, y + monster.direction.y * speed
+
+    def sonar_ready(self, player, now):
+        """Sonar unlocked, off cooldown and affordable (checked here, the
+        player would print a complaint for every refused ping)"""
+        return (
+            player.progression.unlocked(player.level, "sonar")
+            and not player.sonar_active
+            and now - player.last_sonar_time / 1000 >= player.sonar_cooldown
+            and player.power >= player.sonar_cost + player.torpedo_cost
+        )
+
+    @staticmethod
+    def distance_sq(a, b):
+        return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2
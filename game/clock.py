@@ -0,0 +1,27 @@
+# game/clock.py
+
+
+class SimClock:
+    """Simulation time for gameplay timers, advanced only by the game's dt.
+
+    Cooldowns read this instead of pygame.time.get_ticks() so a simulation
+    gives the same results whether it runs in real time, faster than real
+    time headless, or from a replay.
+    """
+
+    def __init__(self, start_ms=0.0):
+        self.time_ms = start_ms
+        self.tick_count = 0
+
+    def advance(self, dt):
+        """Move simulation time forward by dt seconds"""
+        self.time_ms += dt * 1000
+        self.tick_count += 1
+
+    def get_ticks(self):
+        """Milliseconds of simulated time, drop-in for pygame.time.get_ticks()"""
+        return int(self.time_ms)
+
+    @property
+    def seconds(self):
+        return self.time_ms / 1000.0
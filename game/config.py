@@ -109,6 +109,71 @@ MONSTER_SPAWN_RATIO = {
 MONSTER_SPAWN_INTERVAL = 30.0 # seconds
 MONSTER_COUNT_DIFFICULTY_SCALE = 0.25
 
+# behavior profiles, run by entities/behaviors.py
+# the first state is the initial one. each state has an action
+# (wander, chase, hold, lunge, school), a speed multiplier and transitions
+# (condition, value, next state) checked in order, where condition is
+# near/far (distance to player) or timer (seconds in the state) and value is
+# a number or the name of a profile parameter
+CHASER_BEHAVIOR = {
+    "detection_range": DETECTION_RANGE,
+    "lose_interest_range": LOSE_INTEREST_RANGE,
+    "states": {
+        "wander": {"action": "wander", "next": [("near", "detection_range", "chase")]},
+        "chase": {"action": "chase", "next": [("far", "lose_interest_range", "wander")]},
+    },
+}
+
+# schools (lamprey)
+SCHOOL_TURN_INTERVAL = 3.0 # seconds between heading changes
+SCHOOL_JOIN_RADIUS = 300 # new spawns join a school whose center is this close
+
+# boids steering for schooling monsters
+BOIDS_NEIGHBOR_RADIUS = 90 # pixels, also the neighbor grid cell size
+BOIDS_SEPARATION_RADIUS = 35
+BOIDS_MAX_NEIGHBORS = 8 # neighbors sampled per fish, bounds the cost in dense schools
+BOIDS_SEPARATION_WEIGHT = 1.5
+BOIDS_ALIGNMENT_WEIGHT = 1.0
+BOIDS_COHESION_WEIGHT = 0.8
+BOIDS_HEADING_WEIGHT = 0.6 # pull toward the school's shared heading
+
+MONSTER_BEHAVIORS = {
+    "angler_fish": CHASER_BEHAVIOR,
+    "lamprey": { # swims in schools, breaks off to chase
+        "detection_range": 300,
+        "lose_interest_range": 450,
+        "school_size": 8,
+        "states": {
+            "school": {"action": "school", "next": [("near", "detection_range", "chase")]},
+            "chase": {"action": "chase", "next": [("far", "lose_interest_range", "school")]},
+        },
+    },
+    "squid": { # lurks still until the player is close, then strikes
+        "detection_range": 250,
+        "strike_time": 1.2,
+        "retreat_time": 2.5,
+        "states": {
+            "lurk": {"action": "hold", "next": [("near", "detection_range", "strike")]},
+            "strike": {"action": "chase", "speed": 2.5, "next": [("timer", "strike_time", "retreat")]},
+            "retreat": {"action": "wander", "speed": 0.6, "next": [("timer", "retreat_time", "lurk")]},
+        },
+    },
+    "sword_fish": { # winds up, then dashes in a straight line
+        "detection_range": 500,
+        "lose_interest_range": 650,
+        "windup_time": 0.5,
+        "dash_time": 0.6,
+        "recover_time": 1.2,
+        "states": {
+            "wander": {"action": "wander", "next": [("near", "detection_range", "windup")]},
+            "windup": {"action": "hold", "next": [("far", "lose_interest_range", "wander"), ("timer", "windup_time", "dash")]},
+            "dash": {"action": "lunge", "speed": 3.5, "next": [("timer", "dash_time", "recover")]},
+            "recover": {"action": "wander", "speed": 0.5, "next": [("timer", "recover_time", "wander")]},
+        },
+    },
+    "fly": CHASER_BEHAVIOR,
+}
+
 # ===== TORPEDO =====
 # torpedo stats
 TORPEDO_SPEED = 1500
@@ -120,6 +185,8 @@ TORPEDO_DROP_SPEED = 30
 TORPEDO_FLOAT_SPEED = 10
 TORPEDO_ACCELERATION = 1000
 TORPEDO_DAMAGE_RADIUS = 80
+TORPEDO_CAPACITY = 64 # live torpedoes kept in the pool
+TORPEDO_ANGLE_STEPS = 72 # pre-rotated frames per torpedo image (5 degrees apart)
 
 # ===== SONAR =====
 # sonar stats
@@ -128,12 +195,20 @@ SONAR_DURATION = 3.5 # secs
 SONAR_COOLDOWN = 8.0 # seconds
 SONAR_COST = 35
 SONAR_RANGE = 1000 # pixels
+SONAR_WAVE_SPEED = 600 # pixels per second, monsters are revealed as the wave reaches them
+SONAR_REVEAL_FADE = 1.0 # seconds revealed monsters take to fade back out
+SONAR_MINIMAP_RADIUS = 60 # pixels, HUD minimap showing sonar pings
 
 # ===== XP =====
 # XP system
 PLAYER_MAX_LEVEL = 20
+PLAYER_XP_BASE = 50 # xp from level 1 to 2
+PLAYER_XP_STEP = 25 # extra xp needed for every level after that
 PLAYER_BASE_DAMAGE = 20
 PLAYER_MAX_DAMAGE = 100
+# explicit per-level columns replacing the curves in entities/progression.py,
+# e.g. {"damage": [20, 24, 30]} sets levels 1-3
+PLAYER_PROGRESSION = {}
 
 # ===== CAMERA =====
 # camera
@@ -167,8 +242,13 @@ PORTAL_NODES = [
     (6249, 2072, 6364, 2230),  # Portal 4
 ]
 
-# circular linked list order: 1 → 2 → 3 → 4 → 1
-PORTAL_LINKED_LIST = [0, 1, 2, 3]  # Indices in navigation order
+# links between portals (a, b): a's E leads to b, b's Q leads back to a
+# circular: 1 → 2 → 3 → 4 → 1
+PORTAL_EDGES = [(0, 1), (1, 2), (2, 3), (3, 0)]
+
+# optional TMX object layer overriding the nodes/links above
+# (one object per portal, "links" property lists linked portals: "2,4")
+PORTAL_LAYER = "Portals"
 
 # portal stats
 PORTAL_COOLDOWN = 10000 # milliseconds
@@ -215,4 +295,104 @@ DAMAGE_SOUND = 'assets/audio/sound_effects/damage.mp3'
 TELEPORT_SOUND = 'assets/audio/sound_effects/teleport.mp3'
 LOW_HEALTH_ALERT = 'assets/audio/sound_effects/low_health.mp3'
 RESPAWN_SOUND = 'assets/audio/sound_effects/respawn.mp3'
-IM_BACK = 'assets/audio/sound_effects/im_back.mp3'
\ No newline at end of file
+IM_BACK = 'assets/audio/sound_effects/im_back.mp3'
+
+# ===== AUDIO =====
+# mixer channel pool
+AUDIO_CHANNELS = 16
+SFX_MAX_DISTANCE = 900 # pixels, positional sounds past this are culled
+
+# per-sound playback rules
+# voices: max simultaneous plays, interval: min ms between retriggers,
+# priority: higher steals channels from lower when the pool is full
+SOUND_EFFECTS = {
+    "torpedo_launch": {"path": TORPEDO_LAUNCH_SOUND, "voices": 3, "interval": 60, "priority": 2, "volume": 0.8},
+    "torpedo_hit": {"path": TORPEDO_HIT_SOUND, "voices": 4, "interval": 40, "priority": 1, "volume": 0.8},
+    "sonar_ping": {"path": SONAR_PING, "voices": 1, "interval": 500, "priority": 3},
+    "damage": {"path": DAMAGE_SOUND, "voices": 1, "interval": TAKE_DAMAGE_CD, "priority": 4},
+    "teleport": {"path": TELEPORT_SOUND, "voices": 1, "interval": 500, "priority": 4},
+    "low_health": {"path": LOW_HEALTH_ALERT, "voices": 1, "interval": 2000, "priority": 4},
+    "respawn": {"path": IM_BACK, "voices": 1, "interval": 1000, "priority": 5},
+}
+
+# ===== MUSIC =====
+# background music is streamed, never loaded as a Sound
+MUSIC_VOLUME = 0.5
+MUSIC_CROSSFADE = 2.0 # seconds for a full fade out + fade in
+MUSIC_PLAYLISTS = {
+    "menu": [START_MENU_MUSIC],
+    "gameplay": [PLAYING_MUSIC],
+}
+
+# ===== REPLAY =====
+REPLAY_CHECKPOINT_INTERVAL = 300 # ticks between state hashes in a recording
+
+# ===== SAVES =====
+AUTOSAVE_INTERVAL = 5.0 # seconds of game time
+AUTOSAVE_PATH = 'saves/autosave.sav'
+QUICKSAVE_PATH = 'saves/quicksave.sav'
+
+# ===== REWIND (debug) =====
+REWIND_SECONDS = 10 # history kept in the ring buffer
+REWIND_KEYFRAME_INTERVAL = 60 # ticks between full keyframes
+
+# ===== NAVIGATION =====
+NAV_CELL_SIZE = 32 # pixels per navigation grid cell
+NAV_FLOW_RADIUS = 18 # cells searched around the player (covers LOSE_INTEREST_RANGE)
+NAV_LOOKAHEAD = 3 # cells ahead along the path that chasers steer toward
+
+# ===== ZONES =====
+ZONE_SIZE = (800, 880) # pixels, the 6400x3520 world is 8x4 zones
+ZONE_WAKE_RADIUS = 1 # zones around the player's zone whose monsters are simulated
+ZONE_KEEP_RADIUS = 2 # zones around the player whose map chunks stay rendered
+ZONE_PREFETCH_RADIUS = 1 # zones around a portal destination warmed before a jump
+ZONE_PREFETCH_PER_TICK = 1 # map chunks rendered ahead of time per tick
+
+# ===== EFFECTS =====
+EFFECT_CAPACITY = 512 # pooled particles (explosions, bubbles, debris)
+EFFECT_LOD_THRESHOLD = 0.5 # pool share in use above which bursts get smaller
+EFFECT_FADE_STEPS = 6 # baked alpha steps for bubbles and debris
+EFFECT_DRAG = 2.0 # velocity lost per second in water
+EXPLOSION_FPS = 15
+EXPLOSION_DEBRIS = 8 # shards per explosion at full detail
+EXPLOSION_BUBBLES = 6 # bubbles per explosion at full detail
+BUBBLE_RISE_SPEED = 60
+DEBRIS_SINK = 120 # downward pull on debris, pixels/s^2
+
+# ===== EVENTS =====
+EVENT_PROFILE = False # time spent per event type, see EventBus.report()
+
+# ===== SPATIAL GRID =====
+SPATIAL_CELL_SIZE = 64 # pixels per broad-phase bucket (moving entities)
+SPATIAL_STATIC_CELL_SIZE = 128 # pixels per bucket for walls and portals
+MONSTER_SEPARATION_MAX_PUSH = 4 # pixels per tick a monster is pushed out of another
+
+# ===== BOT =====
+BOT_ENGAGE_RANGE = 600 # pixels, monsters closer than this get hunted
+BOT_SIGHT_CHECKS = 4 # nearest monsters checked for a clear line of fire
+BOT_KEEP_DISTANCE = 220 # back off from targets closer than this
+BOT_ARRIVE_RADIUS = 48 # pixels, close enough to a waypoint
+BOT_STUCK_TIME = 1.0 # seconds without moving before trying to wiggle free
+BOT_DETOUR_TIME = 0.6 # seconds of random movement to get unstuck
+BOT_AIM_LEAD = 0.25 # seconds of monster movement to aim ahead
+BOT_PORTAL_CHANCE = 0.25 # chance a new roaming waypoint is a portal trip instead
+
+# ===== BATCH SIMULATION =====
+BATCH_DURATION = 300.0 # game seconds per run
+BATCH_TICK = 1 / 60 # fixed dt of batch runs
+BATCH_SAMPLE_INTERVAL = 10.0 # game seconds between monster population samples
+BATCH_RESULTS_PATH = 'batch_results.csv'
+
+# ===== SOAK TEST =====
+SOAK_REPORT_INTERVAL = 60.0 # game seconds between soak report lines
+
+# ===== MEMORY SAMPLER (debug) =====
+MEMORY_SAMPLE_INTERVAL = 60.0 # game seconds between samples
+MEMORY_HISTORY = 30 # samples kept per counter
+MEMORY_GROWTH_SAMPLES = 5 # samples a counter must keep growing over to be flagged
+MEMORY_TOP_ALLOCATIONS = 8 # tracemalloc lines listed per report
+MEMORY_TRACE_FRAMES = 1 # traceback depth kept by tracemalloc
+
+# ===== SETTINGS =====
+SETTINGS_PATH = 'settings.toml' # default for --settings
+SETTINGS_POLL_INTERVAL = 0.5 # seconds between checks for a changed settings file
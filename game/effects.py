@@ -0,0 +1,185 @@
+# game/effects.py
+import math
+from array import array
+
+import pygame
+
+from game.config import *
+
+# ===== EFFECT KINDS =====
+EXPLOSION, BUBBLE, DEBRIS = range(3)
+
+
+class EffectSystem:
+    """Fixed-capacity pool for short-lived visual effects.
+
+    Every live effect is a slot in a set of preallocated arrays (kind,
+    position, velocity, age, lifetime). Live slots are kept packed at the
+    front, so removing one just moves the last live slot into its place and
+    spawning never allocates. Frames are baked up front, including the fade,
+    and the whole pool is drawn with a single blits() call.
+
+    Effects are cosmetic: they never touch the simulation, only the
+    "effects" random stream.
+    """
+
+    def __init__(self, explosion_frames, rng, capacity=EFFECT_CAPACITY):
+        self.rng = rng.stream("effects")
+        self.capacity = capacity
+        self.count = 0
+
+        # struct-of-arrays slots
+        self.kinds = array("b", bytes(capacity))
+        self.xs = array("d", bytes(8 * capacity))
+        self.ys = array("d", bytes(8 * capacity))
+        self.vxs = array("d", bytes(8 * capacity))
+        self.vys = array("d", bytes(8 * capacity))
+        self.ages = array("d", bytes(8 * capacity))
+        self.lifetimes = array("d", bytes(8 * capacity))
+
+        # per kind: list of (surface, half width, half height)
+        self.frames = [
+            self.bake(explosion_frames),
+            self.bake(self.make_bubble_frames()),
+            self.bake(self.make_debris_frames()),
+        ]
+        self.margin = max(
+            max(half_w, half_h)
+            for frames in self.frames
+            for _, half_w, half_h in frames
+        )
+
+    # ===== FRAMES =====
+    def bake(self, surfaces):
+        return [(surf, surf.get_width() / 2, surf.get_height() / 2) for surf in surfaces]
+
+    def make_bubble_frames(self):
+        """Bubble outline fading out over its lifetime"""
+        frames = []
+        for i in range(EFFECT_FADE_STEPS):
+            surf = pygame.Surface((10, 10), pygame.SRCALPHA)
+            alpha = 200 - i * 200 // EFFECT_FADE_STEPS
+            pygame.draw.circle(surf, (180, 230, 255, alpha), (5, 5), 4, 1)
+            frames.append(surf)
+        return frames
+
+    def make_debris_frames(self):
+        """Hot shard cooling down and fading out"""
+        frames = []
+        for i in range(EFFECT_FADE_STEPS):
+            surf = pygame.Surface((4, 4), pygame.SRCALPHA)
+            heat = i / EFFECT_FADE_STEPS
+            color = (255, int(180 - 120 * heat), int(60 * heat), int(255 - 215 * heat))
+            surf.fill(color)
+            frames.append(surf)
+        return frames
+
+    # ===== SPAWNING =====
+    def spawn(self, kind, x, y, vx=0.0, vy=0.0, lifetime=0.5):
+        """Take a free slot, returns False when the pool is full"""
+        i = self.count
+        if i >= self.capacity:
+            return False
+        self.kinds[i] = kind
+        self.xs[i] = x
+        self.ys[i] = y
+        self.vxs[i] = vx
+        self.vys[i] = vy
+        self.ages[i] = 0.0
+        self.lifetimes[i] = lifetime
+        self.count = i + 1
+        return True
+
+    def detail(self):
+        """Share of optional particles to spawn, drops as the pool fills up"""
+        load = self.count / self.capacity
+        if load <= EFFECT_LOD_THRESHOLD:
+            return 1.0
+        return max(0.0, (1.0 - load) / (1.0 - EFFECT_LOD_THRESHOLD))
+
+    def explode(self, pos):
+        """Explosion flash plus a debris and bubble burst scaled by detail()"""
+        x, y = pos
+        rng = self.rng
+        self.spawn(EXPLOSION, x, y, lifetime=len(self.frames[EXPLOSION]) / EXPLOSION_FPS)
+
+        detail = self.detail()
+        for _ in range(int(EXPLOSION_DEBRIS * detail)):
+            angle = rng.uniform(0, math.tau)
+            speed = rng.uniform(60, 180)
+            self.spawn(
+                DEBRIS, x, y,
+                math.cos(angle) * speed, math.sin(angle) * speed,
+                rng.uniform(0.3, 0.6)
+            )
+        for _ in range(int(EXPLOSION_BUBBLES * detail)):
+            self.spawn(
+                BUBBLE, x + rng.uniform(-20, 20), y + rng.uniform(-20, 20),
+                rng.uniform(-15, 15), -rng.uniform(BUBBLE_RISE_SPEED * 0.5, BUBBLE_RISE_SPEED),
+                rng.uniform(0.8, 1.6)
+            )
+
+    # ===== UPDATE & DRAW =====
+    def update(self, dt):
+        kinds = self.kinds
+        xs, ys = self.xs, self.ys
+        vxs, vys = self.vxs, self.vys
+        ages, lifetimes = self.ages, self.lifetimes
+        drag = max(0.0, 1.0 - EFFECT_DRAG * dt)
+        sink = DEBRIS_SINK * dt
+
+        i = 0
+        count = self.count
+        while i < count:
+            age = ages[i] + dt
+            if age >= lifetimes[i]:
+                # move the last live slot into this one
+                count -= 1
+                kinds[i] = kinds[count]
+                xs[i] = xs[count]
+                ys[i] = ys[count]
+                vxs[i] = vxs[count]
+                vys[i] = vys[count]
+                ages[i] = ages[count]
+                lifetimes[i] = lifetimes[count]
+                continue
+
+            ages[i] = age
+            kind = kinds[i]
+            if kind != EXPLOSION:
+                if kind == DEBRIS:
+                    vys[i] += sink
+                vxs[i] *= drag
+                vys[i] *= drag
+                xs[i] += vxs[i] * dt
+                ys[i] += vys[i] * dt
+            i += 1
+
+        self.count = count
+
+    def draw(self, screen, camera_offset):
+        """Blit every effect inside the viewport in one call"""
+        offset_x, offset_y = camera_offset
+        margin = self.margin
+        max_x = screen.get_width() + margin
+        max_y = screen.get_height() + margin
+        frames = self.frames
+        kinds, xs, ys = self.kinds, self.xs, self.ys
+        ages, lifetimes = self.ages, self.lifetimes
+
+        batch = []
+        for i in range(self.count):
+            screen_x = xs[i] - offset_x
+            screen_y = ys[i] - offset_y
+            if not (-margin < screen_x < max_x and -margin < screen_y < max_y):
+                continue
+            kind_frames = frames[kinds[i]]
+            frame = min(int(ages[i] / lifetimes[i] * len(kind_frames)), len(kind_frames) - 1)
+            surf, half_w, half_h = kind_frames[frame]
+            batch.append((surf, (screen_x - half_w, screen_y - half_h)))
+
+        if batch:
+            screen.blits(batch, doreturn=False)
+
+    def clear(self):
+        self.count = 0
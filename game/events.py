@@ -0,0 +1,91 @@
+# game/events.py
+import time
+
+from game.config import *
+
+# ===== EVENT TYPES =====
+DAMAGE, KILL, XP, EXPLOSION, SOUND, DEATH, SONAR_PULSE = range(7)
+EVENT_NAMES = ("damage", "kill", "xp", "explosion", "sound", "death", "sonar")
+
+
+class EventBus:
+    """Per-game queue of gameplay side effects, drained once per tick.
+
+    Events are stored in parallel slot lists that are reused from tick to
+    tick, so emitting doesn't allocate an event object. Every event carries
+    the same four fields:
+        source - who caused it (torpedo owner, monster) or None
+        target - who it applies to (monster, player) or None
+        value  - damage / xp amount, sonar range, or the sound name
+        pos    - world position or None
+    Handlers may emit more events while the queue drains (damage -> kill ->
+    xp); those run in the same drain.
+    """
+
+    def __init__(self, profile=EVENT_PROFILE):
+        self.handlers = [[] for _ in EVENT_NAMES]
+
+        # event slots, grown on demand and never shrunk
+        self.kinds = []
+        self.sources = []
+        self.targets = []
+        self.values = []
+        self.positions = []
+        self.count = 0
+
+        # per event type: [events handled, seconds spent]
+        self.profile = profile
+        self.stats = [[0, 0.0] for _ in EVENT_NAMES]
+
+    def subscribe(self, kind, handler):
+        """handler(source, target, value, pos) runs for every event of kind"""
+        self.handlers[kind].append(handler)
+
+    def emit(self, kind, source=None, target=None, value=0, pos=None):
+        i = self.count
+        if i < len(self.kinds):
+            self.kinds[i] = kind
+            self.sources[i] = source
+            self.targets[i] = target
+            self.values[i] = value
+            self.positions[i] = pos
+        else:
+            self.kinds.append(kind)
+            self.sources.append(source)
+            self.targets.append(target)
+            self.values.append(value)
+            self.positions.append(pos)
+        self.count = i + 1
+
+    def drain(self):
+        """Run handlers for every queued event in emit order, then reset"""
+        handlers = self.handlers
+        stats = self.stats
+        profile = self.profile
+
+        i = 0
+        while i < self.count:
+            kind = self.kinds[i]
+            if profile:
+                start = time.perf_counter()
+            for handler in handlers[kind]:
+                handler(self.sources[i], self.targets[i], self.values[i], self.positions[i])
+            if profile:
+                stats[kind][1] += time.perf_counter() - start
+            stats[kind][0] += 1
+            i += 1
+
+        # drop references so dead sprites can be collected
+        for slot in range(self.count):
+            self.sources[slot] = self.targets[slot] = self.positions[slot] = None
+        self.count = 0
+
+    def report(self):
+        """Event counts (and time, when profiling) per type"""
+        lines = []
+        for name, (count, seconds) in zip(EVENT_NAMES, self.stats):
+            if self.profile:
+                lines.append(f"{name:<10}{count:>8}{seconds * 1000:>10.2f} ms")
+            else:
+                lines.append(f"{name:<10}{count:>8}")
+        return "\n".join(lines)
@@ -1,9 +1,15 @@
 import pygame
 from game.config import *
 from game.gamestate import GameState
+from game.music import MusicPlayer
+from game.replay import InputRecorder
+from game.rewind import RewindBuffer
+from game.bot import BotController
+from game.memory import MemorySampler
+from game.settings import SettingsWatcher
 
 class Game:
-    def __init__(self):
+    def __init__(self, seed=None, record_path=None, load_path=None, rewind=False, bot=False, memory=False, settings_path=None):
         # ===== PYGAME SETUP =====
         pygame.init()
         pygame.mixer.init()
@@ -12,11 +18,19 @@ class Game:
         self.clock = pygame.time.Clock()
         self.running = True
 
+        # ===== MUSIC =====
+        # menu track streams while the map loads
+        self.music = MusicPlayer()
+        self.music.play_state("menu")
+
+        # ===== SETTINGS =====
+        # applied before the game state is built so startup uses them too
+        self.settings = SettingsWatcher(settings_path) if settings_path else None
+
         # ===== SPRITE GROUPS =====
         self.collision_sprites = pygame.sprite.Group()
         self.obstacle_group = pygame.sprite.Group()
         self.visible_sprites = pygame.sprite.Group()
-        self.explosion_group = pygame.sprite.Group()
 
         # ===== MAP SETTINGS =====
         self.map_width = SCREEN_WIDTH * 3
@@ -28,26 +42,100 @@ class Game:
             collision_sprites=self.collision_sprites,
             obstacle_group=self.obstacle_group,
             visible_sprites=self.visible_sprites,
-            explosion_group=self.explosion_group
+            seed=seed
         )
 
+        if self.settings:
+            self.settings.attach(self.gamestate)
+
+        # saves
+        self.gamestate.save_system.autosave_path = AUTOSAVE_PATH
+        if load_path:
+            try:
+                self.gamestate.save_system.load(load_path)
+            except (OSError, ValueError) as e:
+                print(f"Failed to load {load_path}: {e}, starting a new game")
+
+        # debug rewind buffer (opt-in)
+        if rewind:
+            self.gamestate.rewind = RewindBuffer(self.gamestate)
+
+        # periodic memory report (opt-in)
+        if memory:
+            self.gamestate.memory = MemorySampler(self.gamestate)
+
+        # autopilot instead of the keyboard
+        if bot:
+            self.gamestate.controller = BotController(self.gamestate.rng.seed)
+
+        # input recording for offline replays
+        if record_path:
+            self.gamestate.recorder = InputRecorder(record_path, self.gamestate.rng.seed)
+
     def run(self):
-        while self.running:
-            dt = self.clock.tick(FPS) / 1000  # Delta time in seconds
+        self.music.play_state("gameplay")
+
+        try:
+            while self.running:
+                dt = self.clock.tick(FPS) / 1000  # Delta time in seconds
 
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        self.running = False
+                    elif event.type == pygame.KEYDOWN:
+                        self.handle_keydown(event.key)
+                    self.music.handle_event(event)
 
-            self.gamestate.update(dt)
+                self.music.update(dt)
+                if self.settings:
+                    self.settings.update(dt)
 
-            self.screen.fill((0, 0, 0))  # clear screen
+                # the simulation is frozen while scrubbing through the rewind buffer
+                rewind = self.gamestate.rewind
+                if rewind and rewind.active:
+                    self.scrub_rewind(rewind)
+                else:
+                    self.gamestate.update(dt)
+
+                self.screen.fill((0, 0, 0))  # clear screen
             
-            self.gamestate.draw(self.screen)
+                self.gamestate.draw(self.screen)
+
+                pygame.display.flip()
+        finally:
+            # also on a crash, so the replay so far is a complete gzip stream
+            if self.gamestate.recorder:
+                self.gamestate.recorder.close()
+            self.music.stop()
+            self.gamestate.save_system.wait()
+            if self.gamestate.memory:
+                self.gamestate.memory.close()
+            if self.settings:
+                self.settings.close()
+            pygame.quit()
 
-            pygame.display.flip()
+    def handle_keydown(self, key):
+        """Meta keys that are not part of gameplay input"""
+        if key == pygame.K_F5:
+            # the writer thread reports when the file is written (or failed)
+            if not self.gamestate.save_system.save(QUICKSAVE_PATH, report=True):
+                print("Quicksave skipped, a save is still being written")
+        elif key == pygame.K_F2 and self.gamestate.rewind:
+            self.gamestate.rewind.toggle()
+        elif key == pygame.K_F9:
+            try:
+                self.gamestate.save_system.load(QUICKSAVE_PATH)
+            except (OSError, ValueError) as e:
+                print(f"Failed to load {QUICKSAVE_PATH}: {e}")
 
-        pygame.quit()
+    def scrub_rewind(self, rewind):
+        """Step the rewind cursor while the arrow keys are held"""
+        keys = pygame.key.get_pressed()
+        step = 10 if keys[pygame.K_LSHIFT] else 1
+        if keys[pygame.K_LEFT]:
+            rewind.scrub(-step)
+        elif keys[pygame.K_RIGHT]:
+            rewind.scrub(step)
 
 def main():
     game = Game()
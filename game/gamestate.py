@@ -1,48 +1,107 @@
 # game/gamestate.py
 import pygame
+import struct
+import hashlib
 from os.path import join
 
 from game.config import *
-from game.map import MapSystem
+from game.assets import SharedAssets, load_image
+from game.audio import AudioManager
+from game.clock import SimClock
+from game.rng import RandomService
+from game.input import InputState, KeyboardController, IdleController
+from game.snapshot import SaveSystem
+from game.navigation import FlowField
+from game.spatial import BroadPhase, separate_monsters, PORTALS
+from game.zones import ZoneManager
+from game.events import EventBus, DAMAGE, KILL, XP, EXPLOSION, SOUND, DEATH, SONAR_PULSE
+from game.effects import EffectSystem
+from game.sonar import SonarSystem
 
 from entities.player import Player
+from entities.progression import ProgressionTable
 from entities.monster_spawner import MonsterSpawner
 from entities.camera import Camera
 from entities.player_respawn import RespawnSystem
+from entities.behaviors import BehaviorSystem
+from entities.torpedo import TorpedoPool
 
 from ui.hud import HUD
 from ui.world_ui import WorldUI
 
 class GameState:
-    """Main gameplay state."""
+    """Main gameplay state.
+
+    Everything a game mutates lives on its GameState, so several can run side
+    by side in one process. Pass the same SharedAssets to each to load the
+    map and frames once; leave screen out for a headless game (drawn into an
+    off-screen surface, no display needed).
+    """
 
     def __init__(
             self, 
-            screen, 
-            collision_sprites, 
-            obstacle_group, 
-            visible_sprites, 
-            explosion_group
+            screen=None, 
+            collision_sprites=None, 
+            obstacle_group=None, 
+            visible_sprites=None, 
+            seed=None,
+            controller=None,
+            assets=None
     ):
+        self.headless = screen is None
+        if self.headless:
+            pygame.font.init()  # the HUD still builds its fonts
+            screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
         self.screen = screen
 
+        # read-only map data & frame caches, shareable between games
+        self.assets = assets or SharedAssets()
+
         # sprite groups
-        self.visible_sprites = visible_sprites
+        self.visible_sprites = visible_sprites if visible_sprites is not None else pygame.sprite.Group()
         self.collision_sprites = collision_sprites
-        self.obstacle_group = obstacle_group
-        self.explosion_group = explosion_group
+        self.obstacle_group = obstacle_group if obstacle_group is not None else pygame.sprite.Group()
         self.enemy_sprites = pygame.sprite.Group()
+        self.portal_network = None
         self.portal_group = pygame.sprite.Group()
-        self.check_portal_collisions_func = None
 
-        # map
-        self.map_system = MapSystem()
-        self.map_surface = self.map_system.get_map_surface()
+        # input (live keyboard, replay or bot) & optional recorder
+        self.controller = controller or (IdleController() if self.headless else KeyboardController())
+        self.input_state = InputState()
+        self.recorder = None
+        self.rewind = None  # optional debug RewindBuffer
+        self.memory = None  # optional debug MemorySampler
+
+        # gameplay side effects (damage, xp, sounds...) queued and drained once per tick
+        self.events = EventBus()
+
+        # simulation clock (all gameplay timers read this)
+        self.clock = SimClock()
+        # seeded random streams (spawn, ai, respawn)
+        self.rng = RandomService(seed)
+        print(f"Seed: {self.rng.seed}")
+
+        # map (shared, never modified)
+        self.map_system = self.assets.map_system
         self.collision_sprites = self.map_system.collision_sprites
+        # world streaming: sleeping zones & map chunks
+        self.zones = ZoneManager(self.map_system, streaming=not self.headless)
+
+        # navigation: shared walkable grid + this game's flow field toward the player
+        self.nav_grid = self.assets.nav_grid
+        self.flow_field = FlowField(self.nav_grid)
+        # group behaviors (schools)
+        self.behaviors = BehaviorSystem(self.rng)
+        # broad phase shared by every collision check (walls come prebuilt)
+        self.broad_phase = BroadPhase(walls=self.assets.walls)
 
         # assets
-        self.explosion_frames = self.load_explosion_frames()
-        self.sounds = self.load_audio()
+        self.explosion_frames = self.assets.cached("explosion", self.load_explosion_frames)
+        self.audio = AudioManager()
+        # pooled explosions, bubbles & debris
+        self.effects = EffectSystem(self.explosion_frames, self.rng)
+        # sonar reveals & minimap pings
+        self.sonar = SonarSystem(self)
 
         # camera
         self.camera = Camera(
@@ -61,7 +120,9 @@ class GameState:
             map_height=self.map_system.map_height,
             obstacle_group=self.obstacle_group,
             game_ref=self,
+            progression=ProgressionTable(),
         )
+        self.audio.listener = self.player
 
         # monster spawner
         self.monster_spawner = MonsterSpawner(
@@ -69,12 +130,33 @@ class GameState:
             enemy_sprites=self.enemy_sprites,
             collision_sprites=self.collision_sprites,
             map_collision_sprites=self.map_system.collision_sprites,
-            visible_sprites=self.visible_sprites
+            visible_sprites=self.visible_sprites,
+            rng=self.rng,
+            flow_field=self.flow_field,
+            behaviors=self.behaviors,
+            events=self.events,
+            broad_phase=self.broad_phase,
+            assets=self.assets
         )
 
+        # torpedoes (pooled projectile engine)
+        self.torpedoes = TorpedoPool(game_ref=self)
+
         # respawn system
         self.respawn_system = RespawnSystem(self)
 
+        # event handlers
+        self.events.subscribe(DAMAGE, self.on_damage)
+        self.events.subscribe(KILL, self.on_kill)
+        self.events.subscribe(XP, self.on_xp)
+        self.events.subscribe(EXPLOSION, self.on_explosion)
+        self.events.subscribe(SOUND, self.on_sound)
+        self.events.subscribe(DEATH, self.on_death)
+        self.events.subscribe(SONAR_PULSE, self.sonar.pulse)
+
+        # save/load (autosave is enabled by the owner)
+        self.save_system = SaveSystem(self)
+
         # camera sprites        
         if hasattr(self.player, 'game_ref') and hasattr(self.player.game_ref, 'camera'):
             self.register_camera_sprites()
@@ -86,13 +168,17 @@ class GameState:
         self.hud = HUD(
             player=self.player,
             screen=self.screen,
+            clock=self.clock,
             camera=self.camera,
+            assets=self.assets,
+            sonar=self.sonar,
         )
         # world UI
         self.world_ui = WorldUI(
             player=self.player,
             camera=self.camera,
-            screen=self.screen
+            screen=self.screen,
+            clock=self.clock
         )
         
 
@@ -102,7 +188,7 @@ class GameState:
         frames = []
         for i in range(6):
             try:
-                img = pygame.image.load(join(EXPLOSION_PATH, f"{i}.png")).convert_alpha()
+                img = load_image(join(EXPLOSION_PATH, f"{i}.png"))
                 frames.append(img)
             except Exception: # fallback: generate circles as explosion
                 surf = pygame.Surface((32, 32), pygame.SRCALPHA)
@@ -110,22 +196,6 @@ class GameState:
                 frames.append(surf)
         return frames
         
-    def load_audio(self):
-        """Load sound effects to play for specific actions"""
-        sounds = {}
-        try:
-            sounds["torpedo_launch"] = pygame.mixer.Sound(TORPEDO_LAUNCH_SOUND)
-            sounds["torpedo_hit"] = pygame.mixer.Sound(TORPEDO_HIT_SOUND)
-            sounds["sonar_ping"] = pygame.mixer.Sound(SONAR_PING)
-            sounds["low_health"] = pygame.mixer.Sound(LOW_HEALTH_ALERT)
-            sounds["respawn"] = pygame.mixer.Sound(IM_BACK)
-            sounds["projectile_hit"] = sounds["torpedo_hit"]
-            sounds['damage'] = pygame.mixer.Sound(DAMAGE_SOUND)
-            sounds['teleport'] = pygame.mixer.Sound(TELEPORT_SOUND)
-        except Exception as e:
-            print(f"Failed to load audio: {e}")
-        return sounds
-
     # ===== SETUP HELPERS =====
     def register_camera_sprites(self):
         """Register all drawable sprites to the camera"""
@@ -140,31 +210,71 @@ class GameState:
 
     def create_portals(self):
         try:
-            from entities.portal import create_portal_network, check_portal_collisions
+            from entities.portal import create_portal_network
 
-            self.portal_group = create_portal_network(
+            self.portal_network = create_portal_network(
+                self.map_system.tmx_data,
                 self.visible_sprites,
                 self.camera,
                 self
             )
-            self.check_portal_collisions_func = check_portal_collisions
+            self.portal_group = self.portal_network.group
+            for portal in self.portal_group:
+                self.broad_phase.add_static(portal, portal.rect, PORTALS)
         except Exception as e:
             import traceback
             traceback.print_exc()
+            self.portal_network = None
             self.portal_group = pygame.sprite.Group()
-            self.check_portal_collisions_func = None 
 
-    # ===== INTERNAL LOGIC =====
-    def update_monster_player_target(self):
-        target = None if self.player.is_invincible else self.player
-        for monster in self.enemy_sprites:
-            monster.player = target
+    def portal_prefetch(self):
+        """Portal destinations to warm up while the player stands next to a portal"""
+        if not self.portal_group or self.player.is_dead:
+            return ()
+        from entities.portal import portal_destinations
+        return portal_destinations(self.player, self.broad_phase)
+
+    # ===== EVENT HANDLERS =====
+    def on_damage(self, source, target, amount, pos):
+        xp = target.take_damage(amount)
+        if xp:
+            self.events.emit(KILL, source, target, xp, pos)
+
+    def on_kill(self, killer, victim, xp, pos):
+        if killer is not None:
+            self.events.emit(XP, target=killer, value=xp)
+
+    def on_xp(self, source, target, amount, pos):
+        target.add_xp(amount)
+
+    def on_explosion(self, source, target, value, pos):
+        self.effects.explode(pos)
+
+    def on_sound(self, source, target, name, pos):
+        self.audio.play(name, pos)
+
+    def on_death(self, source, target, value, pos):
+        self.respawn_system.start_respawn()
 
     # ===== UPDATE & DRAW =====
     def update(self, dt):
+        self.clock.advance(dt)
+        self.input_state = self.controller.poll(self)
+        if self.recorder:
+            self.recorder.record_tick(dt, self.input_state)
+        self.zones.update(self.player, self.enemy_sprites, self.portal_prefetch())
+        self.flow_field.update(self.player.hitbox_rect.center)
+        self.behaviors.update(dt)
+        self.sonar.update(dt)
+
         self.visible_sprites.update(dt)
         self.enemy_sprites.update(dt)
-        self.explosion_group.update(dt)
+        self.broad_phase.refresh(self.player, self.enemy_sprites, self.obstacle_group)
+        if separate_monsters(self.broad_phase, self.nav_grid):
+            # torpedoes & sonar query the grid, bucket the pushed monsters again
+            self.broad_phase.refresh(self.player, self.enemy_sprites, self.obstacle_group)
+        self.torpedoes.update(dt)
+        self.effects.update(dt)
         self.monster_spawner.update(dt)
         self.respawn_system.update(dt)
         self.portal_group.update(dt)
@@ -172,23 +282,54 @@ class GameState:
         if self.portal_group:
             from entities.portal import check_portal_collisions
             check_portal_collisions(
-                self.portal_group,
+                self.portal_network,
                 self.player,
-                pygame.time.get_ticks()
+                self.clock.get_ticks(),
+                self.input_state
             )
 
+        self.events.drain()
+
         self.camera.centered_player_cam(self.player)
-        self.update_monster_player_target()
+        self.save_system.update(dt)
+
+        if self.recorder:
+            self.recorder.end_tick(self)
+        if self.rewind:
+            self.rewind.record()
+        if self.memory and self.memory.update(dt):
+            print(self.memory.report())
+
+    def state_hash(self):
+        """64-bit digest of the simulation state, used to detect replay divergence"""
+        digest = hashlib.blake2b(digest_size=8)
+        player = self.player
+        digest.update(struct.pack(
+            "<qiiddii",
+            self.clock.get_ticks(),
+            player.hitbox_rect.centerx,
+            player.hitbox_rect.centery,
+            player.health,
+            player.power,
+            player.xp,
+            player.level
+        ))
+        for monster in self.enemy_sprites:
+            digest.update(struct.pack("<iid", monster.hitbox_rect.centerx, monster.hitbox_rect.centery, monster.health))
+        torpedoes = self.torpedoes
+        for i in range(torpedoes.count):
+            digest.update(struct.pack("<dd", torpedoes.xs[i], torpedoes.ys[i]))
+        return int.from_bytes(digest.digest(), "little")
 
     def draw(self, screen, dt=1/60):
         # map
-        screen.blit(self.map_surface, -self.camera.offset)
+        self.zones.draw_map(screen, self.camera.offset)
         # camera world sprites
         self.camera.custom_draw(self.player)
-        # explosions
-        for explosion in self.explosion_group:
-            pos = pygame.math.Vector2(explosion.rect.topleft) - self.camera.offset
-            screen.blit(explosion.image, pos)
+        # torpedoes
+        self.torpedoes.draw(screen, self.camera.offset)
+        # explosions & particles
+        self.effects.draw(screen, self.camera.offset)
         # world UI
         self.world_ui.draw(self.enemy_sprites)
         # torpedo trajectory
@@ -196,5 +337,8 @@ class GameState:
             self.player.draw_trajectory(screen, self.camera.offset, dt)
         # HUD
         self.hud.draw(self.enemy_sprites, self.camera.offset)
+        # rewind debug overlay
+        if self.rewind:
+            self.rewind.draw(screen)
 
                 
\ No newline at end of file
@@ -0,0 +1,100 @@
+# game/input.py
+import pygame
+
+# ===== ACTIONS =====
+# bit flags packed into InputState.buttons
+MOVE_UP = 1 << 0
+MOVE_DOWN = 1 << 1
+MOVE_LEFT = 1 << 2
+MOVE_RIGHT = 1 << 3
+BOOST = 1 << 4
+FIRE = 1 << 5
+SONAR = 1 << 6
+PORTAL_NEXT = 1 << 7
+PORTAL_PREV = 1 << 8
+
+# travel target (portal index + 1, 0 = none) packed above the button bits
+PORTAL_TARGET_SHIFT = 9
+PORTAL_TARGET_MASK = 0xF
+NO_PORTAL_TARGET = -1
+
+KEY_BINDINGS = (
+    (MOVE_UP, pygame.K_w),
+    (MOVE_DOWN, pygame.K_s),
+    (MOVE_LEFT, pygame.K_a),
+    (MOVE_RIGHT, pygame.K_d),
+    (BOOST, pygame.K_LSHIFT),
+    (FIRE, pygame.K_SPACE),
+    (SONAR, pygame.K_f),
+    (PORTAL_NEXT, pygame.K_e),
+    (PORTAL_PREV, pygame.K_q),
+)
+
+# number keys travel to portal 1-9
+PORTAL_TRAVEL_KEYS = (
+    pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4, pygame.K_5,
+    pygame.K_6, pygame.K_7, pygame.K_8, pygame.K_9,
+)
+
+
+class InputState:
+    """Everything gameplay reads from the player for one tick"""
+    __slots__ = ("buttons", "mouse_x", "mouse_y")
+
+    def __init__(self, buttons=0, mouse_x=0, mouse_y=0):
+        self.buttons = buttons
+        self.mouse_x = mouse_x  # screen space
+        self.mouse_y = mouse_y
+
+    def held(self, action):
+        return bool(self.buttons & action)
+
+    @property
+    def mouse_pos(self):
+        return (self.mouse_x, self.mouse_y)
+
+    @property
+    def portal_target(self):
+        """Portal index the player asked to travel to, NO_PORTAL_TARGET if none"""
+        return ((self.buttons >> PORTAL_TARGET_SHIFT) & PORTAL_TARGET_MASK) - 1
+
+
+def with_portal_target(buttons, portal_index):
+    """buttons with a travel request to portal_index packed in"""
+    buttons &= ~(PORTAL_TARGET_MASK << PORTAL_TARGET_SHIFT)
+    return buttons | ((portal_index + 1) & PORTAL_TARGET_MASK) << PORTAL_TARGET_SHIFT
+
+
+class IdleController:
+    """Presses nothing, the default for headless games (no keyboard to read)"""
+
+    def poll(self, game_state):
+        return InputState()
+
+    def close(self):
+        pass
+
+
+class KeyboardController:
+    """Reads the live keyboard and mouse"""
+
+    def poll(self, game_state):
+        keys = pygame.key.get_pressed()
+        buttons = 0
+        for action, key in KEY_BINDINGS:
+            if keys[key]:
+                buttons |= action
+
+        if pygame.mouse.get_pressed()[0]:
+            buttons |= FIRE
+
+        for portal_index, key in enumerate(PORTAL_TRAVEL_KEYS):
+            if keys[key]:
+                buttons = with_portal_target(buttons, portal_index)
+                break
+
+        mouse_x, mouse_y = pygame.mouse.get_pos()
+        return InputState(buttons, mouse_x, mouse_y)
+
+    def close(self):
+        pass
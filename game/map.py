@@ -1,6 +1,7 @@
 import pygame
 import os
 
+import pytmx
 from pytmx.util_pygame import load_pygame
 
 from game.config import *
@@ -11,24 +12,27 @@ class MapSystem:
     def __init__(self):
         # tiled map data
         self.tmx_data = None  # TMX map data
+        self.has_tiles = False  # tile images loaded (needs a display)
         self.map_width = SCREEN_WIDTH * 3  # fallback: default width if map fails
         self.map_height = SCREEN_HEIGHT * 3  # fallback: default height if map fails
 
         # collision
         self.collision_sprites = pygame.sprite.Group()  # all collision objects
 
-        # load & setup
+        # load & setup (tiles are rendered per chunk by the zone manager)
         self.load_map()
         self.setup_collision()
 
-        # map rendering (render once)
-        self.map_surface = self.render_map_surface()
-
     # ===== MAP LOADING =====
     def load_map(self):
         """Load TMX map file and set map dimensions"""
         try:
-            self.tmx_data = load_pygame(MAP_PATH)
+            if pygame.display.get_surface() is not None:
+                self.tmx_data = load_pygame(MAP_PATH)
+                self.has_tiles = True
+            else:
+                # headless: layout, walls & objects only, no tile images
+                self.tmx_data = pytmx.TiledMap(MAP_PATH)
             # Set map dimensions in pixels
             self.map_width = self.tmx_data.width * self.tmx_data.tilewidth
             self.map_height = self.tmx_data.height * self.tmx_data.tileheight
@@ -38,42 +42,33 @@ class MapSystem:
             self.tmx_data = None
 
     # ===== MAP RENDERING =====
-    def render_map_surface(self):
-        """Render the entire map once"""
-        if not self.tmx_data:
-            return self.create_simple_background()
-        
-        map_surface = pygame.Surface((self.map_width, self.map_height), pygame.SRCALPHA)
-
-        for layer in self.tmx_data.visible_layers:
-            if hasattr(layer, 'data'):
-                for x, y, gid in layer:
-                    tile = self.tmx_data.get_tile_image_by_gid(gid)
-                    if tile:
-                        map_surface.blit(tile, (x * self.tmx_data.tilewidth, y * self.tmx_data.tileheight))
-        return map_surface
-    
-    def get_map_surface(self):
-        """Render entire map to a single surface for fast blitting"""
-        if not self.tmx_data:
-            return self.create_simple_background()  # fallback surface
-
-        map_surface = pygame.Surface((self.map_width, self.map_height), pygame.SRCALPHA)
+    def render_chunk(self, rect):
+        """Render only the tiles inside a world rect, for streamed map chunks"""
+        chunk = pygame.Surface(rect.size, pygame.SRCALPHA)
+        if not self.has_tiles:
+            self.draw_background(chunk, rect)
+            return chunk
+
+        tile_width = self.tmx_data.tilewidth
+        tile_height = self.tmx_data.tileheight
+        first_col = max(0, rect.left // tile_width)
+        last_col = min(self.tmx_data.width, -(-rect.right // tile_width))
+        first_row = max(0, rect.top // tile_height)
+        last_row = min(self.tmx_data.height, -(-rect.bottom // tile_height))
 
-        # render visible tile layers only
         for layer in self.tmx_data.visible_layers:
             if hasattr(layer, 'data'):
-                tile_count = 0
-
-                for x, y, gid in layer:
-                    tile = self.tmx_data.get_tile_image_by_gid(gid)
-                    if tile:
-                        map_surface.blit(tile, (x * TILE_SIZE, y * TILE_SIZE))
-                        tile_count += 1
+                for y in range(first_row, last_row):
+                    line = layer.data[y]
+                    for x in range(first_col, last_col):
+                        gid = line[x]
+                        if not gid:
+                            continue
+                        tile = self.tmx_data.get_tile_image_by_gid(gid)
+                        if tile:
+                            chunk.blit(tile, (x * tile_width - rect.left, y * tile_height - rect.top))
+        return chunk
 
-        print("Map rendering complete!")
-        return map_surface
-    
     # ===== COLLISION SETUP =====
     def setup_collision(self):
         """Create collision sprites from Object Layer 1"""
@@ -119,16 +114,11 @@ class MapSystem:
         CollisionSprite((self.map_width, 0), (border, self.map_height), [self.collision_sprites])
     
     # ===== FALLBACK BACKGROUND =====
-    def create_simple_background(self):
-        """Fallback background if TMX map fails: ocean gradient"""
-        print("Creating simple background...")
-        background = pygame.Surface((self.map_width, self.map_height))
-
+    def draw_background(self, surface, rect):
+        """Draw the part of the ocean gradient covered by a world rect"""
         # draw gradient by lines for performance
-        for y in range(0, self.map_height, 4):
+        for y in range(rect.top - rect.top % 4, rect.bottom, 4):
             depth = y / self.map_height  # 0.0 top -> 1.0 bottom
             blue = 50 + int(100 * depth)
             green = 30 + int(30 * depth)
-            pygame.draw.line(background, (0, green, blue), (0, y), (self.map_width, y), 4)
-
-        return background
+            pygame.draw.line(surface, (0, green, blue), (0, y - rect.top), (rect.width, y - rect.top), 4)
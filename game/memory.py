@@ -0,0 +1,173 @@
+# game/memory.py
+import tracemalloc
+
+import pygame
+
+from game.config import *
+
+
+# high-water marks that never shrink by design, not leaks
+NEVER_SHRINK = ("pool.event_slots",)
+
+
+def surface_bytes(surface):
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+def collect_surfaces(value, found):
+    """Every Surface inside nested lists / tuples / dicts, keyed by id"""
+    if isinstance(value, pygame.Surface):
+        found[id(value)] = value
+    elif isinstance(value, dict):
+        for item in value.values():
+            collect_surfaces(item, found)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            collect_surfaces(item, found)
+    return found
+
+
+class MemorySampler:
+    """Periodic look at what a long session is holding on to.
+
+    Every interval game seconds it records:
+        - the size of every sprite group the game state owns (found by
+          scanning its attributes, so new groups are picked up for free)
+        - pool and cache sizes (torpedoes, effects, event slots, schools,
+          map chunks)
+        - bytes held by surfaces: sprite images, map chunks, shared assets
+        - with trace=True, the tracemalloc lines whose allocations grew the
+          most since the previous sample
+    Counters that kept growing over the last MEMORY_GROWTH_SAMPLES samples
+    are flagged as suspected leaks in report().
+    """
+
+    def __init__(self, game_state, interval=MEMORY_SAMPLE_INTERVAL, trace=True, top=MEMORY_TOP_ALLOCATIONS):
+        self.game_state = game_state
+        self.interval = interval
+        self.trace = trace
+        self.top = top
+        self.timer = 0.0
+
+        self.history = {}  # counter name -> recent values
+        self.samples = 0
+        self.last_time = None  # game seconds of the last sample
+        self.top_growth = []  # (location, size diff, count diff) from tracemalloc
+
+        self.snapshot = None
+        self.started_trace = False  # only stop tracemalloc if we started it
+        if trace:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(MEMORY_TRACE_FRAMES)
+                self.started_trace = True
+            self.snapshot = tracemalloc.take_snapshot()
+
+    # ===== SAMPLING =====
+    def update(self, dt):
+        """Take a sample every interval seconds, returns True when one was taken"""
+        self.timer += dt
+        if self.timer < self.interval:
+            return False
+        self.timer = 0.0
+        self.sample()
+        return True
+
+    def sample(self):
+        counters = self.count_groups()
+        counters.update(self.count_pools())
+        counters.update(self.count_surfaces())
+
+        for name, value in counters.items():
+            values = self.history.setdefault(name, [])
+            values.append(value)
+            del values[:-MEMORY_HISTORY]
+        self.samples += 1
+        self.last_time = self.game_state.clock.seconds
+
+        if self.trace:
+            snapshot = tracemalloc.take_snapshot().filter_traces((
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            ))
+            stats = snapshot.compare_to(self.snapshot, "lineno")
+            self.top_growth = [
+                (str(stat.traceback[0]), stat.size_diff, stat.count_diff)
+                for stat in stats[:self.top]
+                if stat.size_diff > 0
+            ]
+            self.snapshot = snapshot
+        return counters
+
+    def count_groups(self):
+        counters = {}
+        for name, value in vars(self.game_state).items():
+            if isinstance(value, pygame.sprite.AbstractGroup):
+                counters[f"group.{name}"] = len(value)
+        return counters
+
+    def count_pools(self):
+        game_state = self.game_state
+        schools = [school for schools in game_state.behaviors.schools.values() for school in schools]
+        return {
+            "pool.torpedoes": game_state.torpedoes.count,
+            "pool.effects": game_state.effects.count,
+            "pool.event_slots": len(game_state.events.kinds),
+            "pool.schools": len(schools),
+            "pool.school_members": sum(len(school.members) for school in schools),
+            "cache.map_chunks": len(game_state.zones.chunks),
+            "cache.assets": len(game_state.assets.cache),
+        }
+
+    def count_surfaces(self):
+        game_state = self.game_state
+        sprites = {}
+        for name, value in vars(game_state).items():
+            if isinstance(value, pygame.sprite.AbstractGroup):
+                for sprite in value:
+                    image = getattr(sprite, "image", None)
+                    if image is not None:
+                        sprites[id(image)] = image
+        chunks = collect_surfaces(game_state.zones.chunks, {})
+        assets = collect_surfaces(game_state.assets.cache, {})
+        return {
+            "surface_kb.sprites": sum(map(surface_bytes, sprites.values())) // 1024,
+            "surface_kb.map_chunks": sum(map(surface_bytes, chunks.values())) // 1024,
+            "surface_kb.assets": sum(map(surface_bytes, assets.values())) // 1024,
+        }
+
+    # ===== ANALYSIS =====
+    def growing(self, samples=MEMORY_GROWTH_SAMPLES):
+        """Counters that never shrank and grew overall across the last samples"""
+        flagged = []
+        for name, values in self.history.items():
+            if name in NEVER_SHRINK:
+                continue
+            recent = values[-samples:]
+            if len(recent) < samples or recent[-1] <= recent[0]:
+                continue
+            if all(a <= b for a, b in zip(recent, recent[1:])):
+                flagged.append((name, recent[0], recent[-1]))
+        return flagged
+
+    def report(self):
+        lines = [f"--- memory @ {self.last_time or 0:.0f}s (sample {self.samples}) ---"]
+        for name, values in self.history.items():
+            lines.append(f"{name:<28}{values[-1]:>10}")
+
+        flagged = self.growing()
+        if flagged:
+            lines.append(f"growing over the last {MEMORY_GROWTH_SAMPLES} samples:")
+            for name, first, last in flagged:
+                lines.append(f"  ! {name:<26}{first:>8} -> {last}")
+
+        if self.top_growth:
+            lines.append("top allocation growth since the last sample:")
+            for location, size_diff, count_diff in self.top_growth:
+                lines.append(f"  {size_diff / 1024:>+9.1f} KB {count_diff:>+7} blocks  {location}")
+        return "\n".join(lines)
+
+    def close(self):
+        if self.started_trace and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self.started_trace = False
+        self.snapshot = None
@@ -0,0 +1,118 @@
+# game/music.py
+import pygame
+from game.config import *
+
+MUSIC_END_EVENT = pygame.USEREVENT + 1
+
+
+class MusicPlayer:
+    """Streams background music through pygame.mixer.music.
+
+    Tracks are decoded on the fly instead of being loaded as Sounds, so memory
+    stays flat no matter how long a track is. Switching state fades the
+    current track out and the new one in, and the next track of a playlist is
+    queued ahead of time so the stream never has to stop to open it.
+    """
+
+    def __init__(self, playlists=MUSIC_PLAYLISTS, volume=MUSIC_VOLUME, crossfade=MUSIC_CROSSFADE):
+        self.playlists = playlists
+        self.volume = volume
+        self.crossfade = crossfade
+        self.enabled = pygame.mixer.get_init() is not None
+
+        # playback state
+        self.current_state = None
+        self.pending_state = None
+        self.track_index = 0
+        self.gain = 0.0  # fade multiplier (0 - 1)
+
+        if self.enabled:
+            pygame.mixer.music.set_endevent(MUSIC_END_EVENT)
+
+    # ===== STATE SWITCHING =====
+    def play_state(self, state):
+        """Crossfade to the playlist of a game state ('menu', 'gameplay', ...)"""
+        if not self.enabled:
+            return
+        if state == self.current_state and self.pending_state is None:
+            return
+
+        self.pending_state = state
+
+        # nothing playing yet: start right away at full volume
+        if self.current_state is None:
+            self.start_pending()
+            self.gain = 1.0
+            self.apply_volume()
+
+    def start_pending(self):
+        """Open the first track of the pending playlist and start streaming"""
+        state = self.pending_state
+        self.pending_state = None
+        self.current_state = state
+        self.track_index = 0
+        self.gain = 0.0
+
+        playlist = self.playlists.get(state, [])
+        if not playlist:
+            pygame.mixer.music.stop()
+            return
+
+        try:
+            pygame.mixer.music.load(playlist[0])
+            pygame.mixer.music.set_volume(0)
+            # single tracks loop forever, playlists chain through the queue
+            pygame.mixer.music.play(loops=-1 if len(playlist) == 1 else 0)
+            self.prefetch_next()
+        except Exception as e:
+            print(f"Failed to play music for '{state}': {e}")
+
+    def prefetch_next(self):
+        """Queue the following track so it starts without a gap"""
+        playlist = self.playlists.get(self.current_state, [])
+        if len(playlist) < 2:
+            return
+
+        next_track = playlist[(self.track_index + 1) % len(playlist)]
+        try:
+            pygame.mixer.music.queue(next_track)
+        except Exception as e:
+            print(f"Failed to queue music '{next_track}': {e}")
+
+    # ===== EVENTS & UPDATE =====
+    def handle_event(self, event):
+        """Advance the playlist when the streamed track ends"""
+        if event.type != MUSIC_END_EVENT:
+            return
+
+        playlist = self.playlists.get(self.current_state, [])
+        if len(playlist) < 2:
+            return
+
+        self.track_index = (self.track_index + 1) % len(playlist)
+        self.prefetch_next()
+
+    def update(self, dt):
+        """Step the fade out / fade in ramps"""
+        if not self.enabled:
+            return
+
+        step = dt / (self.crossfade / 2) if self.crossfade > 0 else 1.0
+
+        if self.pending_state is not None:
+            self.gain = max(0.0, self.gain - step)
+            if self.gain == 0.0:
+                self.start_pending()
+        elif self.gain < 1.0:
+            self.gain = min(1.0, self.gain + step)
+
+        self.apply_volume()
+
+    def apply_volume(self):
+        pygame.mixer.music.set_volume(self.gain * self.volume)
+
+    def stop(self):
+        if self.enabled:
+            pygame.mixer.music.stop()
+        self.current_state = None
+        self.pending_state = None
@@ -0,0 +1,161 @@
+# game/navigation.py
+from array import array
+from collections import deque
+
+import pygame
+
+from game.config import *
+
+# 4 straight neighbors first, then diagonals
+NEIGHBORS = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1))
+
+
+class NavigationGrid:
+    """Coarse walkability grid built once from the map collision rects"""
+
+    def __init__(self, collision_sprites, map_width, map_height, cell_size=NAV_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cols = max(1, -(-map_width // cell_size))
+        self.rows = max(1, -(-map_height // cell_size))
+        self.blocked = bytearray(self.cols * self.rows)
+
+        for sprite in collision_sprites:
+            self.block_rect(sprite.rect)
+
+    def block_rect(self, rect):
+        """Mark every cell a rect overlaps as blocked"""
+        size = self.cell_size
+        left = max(0, rect.left // size)
+        right = min(self.cols - 1, (rect.right - 1) // size)
+        top = max(0, rect.top // size)
+        bottom = min(self.rows - 1, (rect.bottom - 1) // size)
+        if left > right or top > bottom:
+            return
+
+        span = right - left + 1
+        for row in range(top, bottom + 1):
+            start = row * self.cols + left
+            self.blocked[start:start + span] = b"\x01" * span
+
+    def cell_index(self, x, y):
+        """Grid index of a world position, -1 if outside the map"""
+        col = int(x) // self.cell_size
+        row = int(y) // self.cell_size
+        if 0 <= col < self.cols and 0 <= row < self.rows:
+            return row * self.cols + col
+        return -1
+
+    def cell_center(self, index):
+        half = self.cell_size / 2
+        return (
+            (index % self.cols) * self.cell_size + half,
+            (index // self.cols) * self.cell_size + half,
+        )
+
+
+class FlowField:
+    """Breadth-first flow field toward a single target, shared by all chasers.
+
+    Every reachable cell near the target stores the neighbor it should move
+    to next. The field is only rebuilt when the target moves to another cell,
+    and lazily, the first time a chaser asks for a direction afterwards, so the
+    cost is per target move rather than per monster.
+    """
+
+    def __init__(self, grid, radius=NAV_FLOW_RADIUS, lookahead=NAV_LOOKAHEAD):
+        self.grid = grid
+        self.radius = radius  # in cells, bounds the search around the target
+        self.lookahead = lookahead  # cells ahead to steer at, smooths BFS staircases
+
+        size = grid.cols * grid.rows
+        self.parent = array("i", [-1]) * size
+        # cells whose stamp != generation are outside the current field,
+        # so nothing needs clearing between rebuilds
+        self.stamp = array("I", [0]) * size
+        self.generation = 0
+
+        self.target_cell = -1
+        self.dirty = False
+
+    def update(self, target_pos):
+        """Retarget the field, returns True if the target changed cell"""
+        cell = self.grid.cell_index(*target_pos)
+        if cell == self.target_cell:
+            return False
+        self.target_cell = cell
+        self.dirty = True
+        return True
+
+    def rebuild(self):
+        self.dirty = False
+        self.generation += 1
+
+        grid = self.grid
+        target = self.target_cell
+        if target < 0 or grid.blocked[target]:
+            return
+
+        cols, rows = grid.cols, grid.rows
+        blocked = grid.blocked
+        parent = self.parent
+        stamp = self.stamp
+        generation = self.generation
+
+        target_col, target_row = target % cols, target // cols
+        min_col = max(0, target_col - self.radius)
+        max_col = min(cols - 1, target_col + self.radius)
+        min_row = max(0, target_row - self.radius)
+        max_row = min(rows - 1, target_row + self.radius)
+
+        stamp[target] = generation
+        parent[target] = -1
+        frontier = deque((target,))
+
+        while frontier:
+            cell = frontier.popleft()
+            col, row = cell % cols, cell // cols
+
+            for dx, dy in NEIGHBORS:
+                next_col = col + dx
+                next_row = row + dy
+                if not (min_col <= next_col <= max_col and min_row <= next_row <= max_row):
+                    continue
+
+                neighbor = next_row * cols + next_col
+                if stamp[neighbor] == generation or blocked[neighbor]:
+                    continue
+                # no cutting corners past walls on diagonals
+                if dx and dy and (blocked[row * cols + next_col] or blocked[next_row * cols + col]):
+                    continue
+
+                stamp[neighbor] = generation
+                parent[neighbor] = cell
+                frontier.append(neighbor)
+
+    def direction_at(self, pos):
+        """Normalized direction toward the next cell on the way to the target.
+
+        Returns None when pos is outside the field or already in the target
+        cell, callers then steer straight at the target.
+        """
+        if self.dirty:
+            self.rebuild()
+
+        index = self.grid.cell_index(*pos)
+        if index < 0 or self.stamp[index] != self.generation:
+            return None
+
+        next_cell = self.parent[index]
+        if next_cell < 0:
+            return None
+        for _ in range(self.lookahead - 1):
+            ahead = self.parent[next_cell]
+            if ahead < 0:
+                break
+            next_cell = ahead
+
+        center_x, center_y = self.grid.cell_center(next_cell)
+        direction = pygame.math.Vector2(center_x - pos[0], center_y - pos[1])
+        if not direction.length_squared():
+            return None
+        return direction.normalize()
@@ -0,0 +1,131 @@
+# game/replay.py
+import os
+import gzip
+import struct
+import time
+
+import pygame
+
+from game.config import *
+from game.input import InputState
+
+# ===== LOG FORMAT =====
+# gzip stream: header, then tagged records
+#   header: magic, version, seed, checkpoint interval (ticks)
+#   TICK:   dt, buttons, mouse x, mouse y
+#   HASH:   tick index, state hash (written after that tick's update)
+REPLAY_MAGIC = b"SSRP"
+REPLAY_VERSION = 1
+HEADER = struct.Struct("<4sBQH")
+TAG = struct.Struct("<B")
+TICK_RECORD = struct.Struct("<dHhh")
+HASH_RECORD = struct.Struct("<IQ")
+TAG_TICK = 0
+TAG_HASH = 1
+
+
+class InputRecorder:
+    """Writes the seed and every tick's input to a compact binary log"""
+
+    def __init__(self, path, seed, checkpoint_interval=REPLAY_CHECKPOINT_INTERVAL):
+        self.path = path
+        self.checkpoint_interval = checkpoint_interval
+        self.file = gzip.open(path, "wb")
+        self.file.write(HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, seed, checkpoint_interval))
+        self.tick = 0
+
+    def record_tick(self, dt, input_state):
+        self.file.write(TAG.pack(TAG_TICK))
+        self.file.write(TICK_RECORD.pack(dt, input_state.buttons, input_state.mouse_x, input_state.mouse_y))
+
+    def end_tick(self, game_state):
+        """Write a state hash every checkpoint_interval ticks"""
+        if self.checkpoint_interval and self.tick % self.checkpoint_interval == 0:
+            self.file.write(TAG.pack(TAG_HASH))
+            self.file.write(HASH_RECORD.pack(self.tick, game_state.state_hash()))
+        self.tick += 1
+
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
+            print(f"Replay saved: {self.path} ({self.tick} ticks)")
+
+
+class ReplayController:
+    """Input source that hands back whatever state the replay driver set"""
+
+    def __init__(self):
+        self.state = InputState()
+
+    def poll(self, game_state):
+        return self.state
+
+    def close(self):
+        pass
+
+
+def read_replay(path):
+    """Yield (seed, interval) first, then ('tick', dt, InputState) / ('hash', tick, value)"""
+    with gzip.open(path, "rb") as f:
+        magic, version, seed, interval = HEADER.unpack(f.read(HEADER.size))
+        if magic != REPLAY_MAGIC:
+            raise ValueError(f"{path} is not a replay file")
+        if version != REPLAY_VERSION:
+            raise ValueError(f"Unsupported replay version {version}")
+        yield seed, interval
+
+        while True:
+            tag = f.read(TAG.size)
+            if not tag:
+                return
+            if tag[0] == TAG_TICK:
+                dt, buttons, mouse_x, mouse_y = TICK_RECORD.unpack(f.read(TICK_RECORD.size))
+                yield "tick", dt, InputState(buttons, mouse_x, mouse_y)
+            elif tag[0] == TAG_HASH:
+                tick, value = HASH_RECORD.unpack(f.read(HASH_RECORD.size))
+                yield "hash", tick, value
+            else:
+                raise ValueError(f"Corrupt replay record tag {tag[0]}")
+
+
+# ===== REPLAY DRIVER =====
+def run_replay(path, verify=True):
+    """Run a recorded session through a headless GameState as fast as possible.
+
+    Returns a list of (tick, expected, actual) for every checkpoint whose state
+    hash did not match.
+    """
+    from game.gamestate import GameState
+
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+
+    records = read_replay(path)
+    seed, interval = next(records)
+
+    # headless: no display needed
+    controller = ReplayController()
+    game_state = GameState(seed=seed, controller=controller)
+
+    mismatches = []
+    ticks = 0
+    start = time.perf_counter()
+
+    for record in records:
+        if record[0] == "tick":
+            _, dt, input_state = record
+            controller.state = input_state
+            game_state.update(dt)
+            ticks += 1
+        elif verify:
+            _, tick, expected = record
+            actual = game_state.state_hash()
+            if actual != expected:
+                mismatches.append((tick, expected, actual))
+                print(f"Divergence at tick {tick}: expected {expected:016x}, got {actual:016x}")
+
+    elapsed = time.perf_counter() - start
+    rate = ticks / elapsed if elapsed > 0 else 0
+    print(f"Replayed {ticks} ticks in {elapsed:.2f}s ({rate:.0f} ticks/s), {len(mismatches)} divergences")
+    print(game_state.events.report())
+    return mismatches
@@ -0,0 +1,173 @@
+# game/rewind.py
+from collections import deque
+
+import pygame
+
+from game.config import *
+
+# ===== TRACKED CHANNELS =====
+PLAYER = 0
+MONSTERS = 1
+TORPEDOES = 2
+
+STATE_COLORS = {
+    "wander": (120, 200, 255),
+    "chase": (255, 80, 80),
+}
+
+
+class RewindBuffer:
+    """Debug ring buffer of the last few seconds of entity state.
+
+    Each tick stores only what changed since the previous tick, with a full
+    keyframe every REWIND_KEYFRAME_INTERVAL ticks so any frame can be rebuilt
+    by replaying at most one keyframe's worth of deltas. Memory is bounded by
+    the deque length.
+
+    Scrubbing is view-only: the world is frozen at the pause point and the
+    recorded positions are drawn on top of it as outlines.
+    """
+
+    def __init__(self, game_state, seconds=REWIND_SECONDS, keyframe_interval=REWIND_KEYFRAME_INTERVAL):
+        self.game_state = game_state
+        self.keyframe_interval = keyframe_interval
+        self.frames = deque(maxlen=int(seconds * FPS))
+
+        # last recorded values per channel (key -> tuple)
+        self.last = ({}, {}, {})
+        self.ticks_since_keyframe = keyframe_interval
+
+        # scrubbing
+        self.active = False
+        self.cursor = 0
+        self.font = None
+
+    # ===== RECORDING =====
+    def sample(self):
+        """Current values of every tracked entity"""
+        player = self.game_state.player
+        rect = player.hitbox_rect
+        players = {0: (rect.x, rect.y, rect.width, rect.height, player.health)}
+
+        monsters = {}
+        for monster in self.game_state.enemy_sprites:
+            rect = monster.hitbox_rect
+            monsters[monster.uid] = (rect.x, rect.y, rect.width, rect.height, monster.health, monster.state)
+
+        torpedoes = {}
+        pool = self.game_state.torpedoes
+        for i in range(pool.count):
+            torpedoes[pool.ids[i]] = (int(pool.xs[i]), int(pool.ys[i]))
+
+        return players, monsters, torpedoes
+
+    def record(self):
+        """Append this tick as a keyframe or as a delta against the last tick"""
+        if self.active:
+            return
+
+        current = self.sample()
+        clock = self.game_state.clock
+
+        if self.ticks_since_keyframe >= self.keyframe_interval:
+            self.frames.append((clock.tick_count, clock.time_ms, True, current))
+            self.ticks_since_keyframe = 0
+        else:
+            deltas = []
+            for channel, values in enumerate(current):
+                previous = self.last[channel]
+                changed = {key: value for key, value in values.items() if previous.get(key) != value}
+                removed = tuple(key for key in previous if key not in values)
+                deltas.append((changed, removed))
+            self.frames.append((clock.tick_count, clock.time_ms, False, deltas))
+
+        self.last = current
+        self.ticks_since_keyframe += 1
+
+    def rebuild(self, index):
+        """Full entity state at frames[index], or None if no keyframe precedes it"""
+        start = index
+        while start >= 0 and not self.frames[start][2]:
+            start -= 1
+        if start < 0:
+            return None
+
+        state = [dict(values) for values in self.frames[start][3]]
+        for i in range(start + 1, index + 1):
+            for channel, (changed, removed) in enumerate(self.frames[i][3]):
+                values = state[channel]
+                values.update(changed)
+                for key in removed:
+                    values.pop(key, None)
+        return state
+
+    def first_scrubbable(self):
+        for i, frame in enumerate(self.frames):
+            if frame[2]:
+                return i
+        return len(self.frames)
+
+    # ===== SCRUBBING =====
+    def toggle(self):
+        """Pause into the recording, or resume the live game"""
+        if self.active:
+            self.active = False
+            self.game_state.camera.centered_player_cam(self.game_state.player)
+            return False
+
+        if self.first_scrubbable() >= len(self.frames):
+            return False
+
+        self.active = True
+        self.cursor = len(self.frames) - 1
+        # reveals & minimap pings from the pause point don't match the recorded frames
+        self.game_state.sonar.clear()
+        self.focus_camera()
+        return True
+
+    def scrub(self, steps):
+        if not self.active:
+            return
+        self.cursor = max(self.first_scrubbable(), min(len(self.frames) - 1, self.cursor + steps))
+        self.focus_camera()
+
+    def focus_camera(self):
+        state = self.rebuild(self.cursor)
+        if not state or 0 not in state[PLAYER]:
+            return
+        x, y, width, height, _ = state[PLAYER][0]
+        camera = self.game_state.camera
+        camera.offset.x = max(0, min(x + width // 2 - camera.screen_width // 2, camera.map_width - camera.screen_width))
+        camera.offset.y = max(0, min(y + height // 2 - camera.screen_height // 2, camera.map_height - camera.screen_height))
+
+    # ===== DRAW =====
+    def draw(self, screen):
+        """Overlay the recorded frame under the cursor"""
+        if not self.active:
+            return
+
+        state = self.rebuild(self.cursor)
+        if state is None:
+            return
+        offset = self.game_state.camera.offset
+
+        for x, y, width, height, health, monster_state in state[MONSTERS].values():
+            color = STATE_COLORS.get(monster_state, (255, 255, 255))
+            pygame.draw.rect(screen, color, (x - offset.x, y - offset.y, width, height), 2)
+
+        for x, y in state[TORPEDOES].values():
+            pygame.draw.circle(screen, (255, 255, 0), (x - offset.x, y - offset.y), 5, 2)
+
+        for x, y, width, height, health in state[PLAYER].values():
+            pygame.draw.rect(screen, (0, 255, 0), (x - offset.x, y - offset.y, width, height), 2)
+
+        if self.font is None:
+            self.font = pygame.font.Font(None, 28)
+
+        tick, time_ms = self.frames[self.cursor][:2]
+        seconds_back = (self.frames[-1][1] - time_ms) / 1000
+        text = self.font.render(
+            f"REWIND  -{seconds_back:.2f}s  (tick {tick})   LEFT/RIGHT scrub, SHIFT x10, F2 resume",
+            True, (255, 255, 0)
+        )
+        screen.blit(text, text.get_rect(midbottom=(screen.get_width() // 2, screen.get_height() - 20)))
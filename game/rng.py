@@ -0,0 +1,36 @@
+# game/rng.py
+import random
+
+
+class RandomService:
+    """Per-game random numbers split into named, independently seeded streams.
+
+    Each stream is derived from the game seed and its name, so drawing more
+    numbers in one system (e.g. AI) never shifts the sequence another system
+    (e.g. spawning) sees. Same seed + same inputs = same game.
+    """
+
+    def __init__(self, seed=None):
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+        self.seed = seed
+        self.streams = {}
+
+        # common streams
+        self.spawn = self.stream("spawn")
+        self.ai = self.stream("ai")
+        self.respawn = self.stream("respawn")
+
+    def stream(self, name):
+        """Get (or create) the random.Random for a named subsystem"""
+        if name not in self.streams:
+            self.streams[name] = random.Random(f"{self.seed}:{name}")
+        return self.streams[name]
+
+    # ===== SNAPSHOTS =====
+    def get_state(self):
+        return {name: rng.getstate() for name, rng in self.streams.items()}
+
+    def set_state(self, state):
+        for name, rng_state in state.items():
+            self.stream(name).setstate(rng_state)
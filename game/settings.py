@@ -0,0 +1,221 @@
+# game/settings.py
+import os
+import sys
+import json
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11: JSON settings only
+    tomllib = None
+
+from game.config import *
+from game import config
+
+# top-level packages whose modules copy config values with `import *`
+GAME_PACKAGES = ("game", "entities", "ui")
+
+# player attribute -> config value it starts from
+PLAYER_SETTINGS = (
+    ("normal_speed", "PLAYER_SPEED"),
+    ("boost_speed", "BOOST_SPEED"),
+    ("max_health", "PLAYER_HEALTH"),
+    ("max_power", "PLAYER_MAX_POWER"),
+    ("power_regen_rate", "POWER_REGEN"),
+    ("hit_cooldown", "TAKE_DAMAGE_CD"),
+    ("torpedo_cooldown", "TORPEDO_COOLDOWN"),
+    ("sonar_duration", "SONAR_DURATION"),
+    ("sonar_cooldown", "SONAR_COOLDOWN"),
+    ("sonar_cost", "SONAR_COST"),
+    ("sonar_range", "SONAR_RANGE"),
+    ("portal_cooldown", "PORTAL_COOLDOWN"),
+)
+
+
+# ===== CONFIG OVERRIDES =====
+def merge_override(base, value):
+    """value on top of base; dicts are merged key by key (MONSTER_TYPES...)"""
+    if isinstance(base, dict) and isinstance(value, dict):
+        merged = dict(base)
+        for key, item in value.items():
+            merged[key] = merge_override(base.get(key), item)
+        return merged
+    return value
+
+
+def apply_overrides(overrides):
+    """Replace config values in every loaded game module, returns an undo function.
+
+    Modules read config through `from game.config import *`, so each holds
+    its own reference and all of them are patched. Values already baked in
+    at import time (default arguments, BEHAVIOR_TABLES) are not affected.
+    Undoing also covers modules imported after the overrides were applied,
+    which copied the overridden values.
+    """
+    applied = []
+    for name, value in overrides.items():
+        if not hasattr(config, name):
+            raise KeyError(f"Unknown config value {name}")
+        original = getattr(config, name)
+        merged = merge_override(original, value)
+        applied.append((name, original, merged))
+        for module in game_modules():
+            if name in vars(module):
+                setattr(module, name, merged)
+
+    def restore():
+        for name, original, merged in reversed(applied):
+            for module in game_modules():
+                if vars(module).get(name) is merged:
+                    setattr(module, name, original)
+
+    return restore
+
+
+def game_modules():
+    return [
+        module for module_name, module in list(sys.modules.items())
+        if module is not None and module_name.split(".")[0] in GAME_PACKAGES
+    ]
+
+
+# ===== SETTINGS FILES =====
+def load_settings(path):
+    """Overrides from a .toml or .json file: {CONFIG_NAME: value}"""
+    if path.endswith(".toml"):
+        if tomllib is None:
+            raise ValueError("TOML settings need Python 3.11+, use a .json file")
+        with open(path, "rb") as f:
+            overrides = tomllib.load(f)
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            overrides = json.load(f)
+
+    if not isinstance(overrides, dict):
+        raise ValueError("settings must be a table of CONFIG_NAME = value")
+    unknown = [name for name in overrides if not hasattr(config, name)]
+    if unknown:
+        raise ValueError(f"unknown config values: {', '.join(unknown)}")
+    return overrides
+
+
+# ===== LIVE OBJECTS =====
+def rebuild_tables():
+    """Recompile tables built from config when their module was imported"""
+    from entities.behaviors import build_behavior_tables
+    build_behavior_tables()
+
+
+def refresh_live(game_state):
+    """Push the current config into objects that copied values when created.
+
+    Everything read from module globals at use time (fog radii, spawn areas,
+    difficulty step...) is live as soon as the modules are patched; this
+    covers the rest without touching loaded assets. Monster size and frame
+    count need new frames, so they only apply to monsters spawned later.
+    """
+    from entities.behaviors import get_behavior_table
+    rebuild_tables()
+
+    for monster in game_state.enemy_sprites:
+        data = MONSTER_TYPES.get(monster.enemy_type, MONSTER_TYPES["fly"])
+        # keep the share of health it has left
+        ratio = monster.health / monster.max_health if monster.max_health else 1
+        monster.max_health = data["hp"]
+        monster.health = monster.max_health * ratio
+        # clamp instead of re-rolling, the spawn stream must not be drawn from
+        low, high = data["speed"]
+        monster.speed = min(max(monster.speed, low), high)
+        monster.damage = data.get("damage", 10)
+        monster.xp_reward = data.get("xp", 10)
+
+        state = monster.state
+        monster.behavior = get_behavior_table(monster.enemy_type)
+        monster.behavior_state = monster.behavior.index(state)
+        monster.state = monster.behavior.names[monster.behavior_state]
+
+    spawner = game_state.monster_spawner
+    spawner.spawn_interval = MONSTER_SPAWN_INTERVAL
+    spawner.base_spawn_count = MONSTER_SPAWN_RATIO.copy()
+
+    player = game_state.player
+    for attribute, name in PLAYER_SETTINGS:
+        setattr(player, attribute, getattr(config, name))
+    player.progression.build()
+    player.max_level = player.progression.max_level
+    player.level = min(player.level, player.max_level)
+    player.update_level_stats()
+    player.health = min(player.health, player.max_health)
+    player.power = min(player.power, player.max_power)
+
+
+class SettingsWatcher:
+    """Settings file applied on top of config and reloaded when it changes.
+
+    The file holds config names with the values to use instead, e.g. in TOML:
+
+        FOG_RADIUS = 400
+        MONSTER_SPAWN_INTERVAL = 20.0
+
+        [MONSTER_TYPES.squid]
+        hp = 150
+
+    Dicts are merged with the config value, so only the keys given change.
+    The file's modification time is checked every SETTINGS_POLL_INTERVAL
+    seconds; on a change the previous overrides are undone, the new ones
+    applied and the live objects refreshed, so removing a line reverts it.
+    A file that fails to parse is reported and the last good settings stay.
+
+    Overrides patch module globals, so they reach every GameState in the
+    process. Replays don't record settings changes; play them back with the
+    same settings file.
+    """
+
+    def __init__(self, path=SETTINGS_PATH, interval=SETTINGS_POLL_INTERVAL):
+        self.path = path
+        self.interval = interval
+        self.timer = 0.0
+        self.game_state = None
+        self.restore = None
+        self.mtime = None
+        self.reload()
+
+    def attach(self, game_state):
+        """Start pushing values into game_state (settings already applied to config)"""
+        self.game_state = game_state
+        refresh_live(game_state)
+
+    # ===== RELOADING =====
+    def update(self, dt):
+        self.timer += dt
+        if self.timer < self.interval:
+            return
+        self.timer = 0.0
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            return  # mid-save or removed, keep the current settings
+        if mtime != self.mtime:
+            self.reload()
+
+    def reload(self):
+        """Load the file and apply it, returns True on success"""
+        try:
+            self.mtime = os.stat(self.path).st_mtime_ns
+            overrides = load_settings(self.path)
+        except (OSError, ValueError) as e:
+            print(f"Failed to load settings {self.path}: {e}")
+            return False
+
+        if self.restore:
+            self.restore()
+        self.restore = apply_overrides(overrides)
+        if self.game_state:
+            refresh_live(self.game_state)
+        print(f"Applied {len(overrides)} settings from {self.path}")
+        return True
+
+    def close(self):
+        """Put the original config back"""
+        if self.restore:
+            self.restore()
+            self.restore = None
@@ -0,0 +1,426 @@
+# game/snapshot.py
+import os
+import zlib
+import struct
+import threading
+
+from game.config import *
+from entities.behaviors import School
+from entities.torpedo import TORPEDO_STATES
+
+# ===== FILE FORMAT =====
+# header (magic, version) followed by a zlib-compressed body of fixed-size
+# struct records. Strings are length-prefixed utf-8.
+SNAPSHOT_MAGIC = b"SSSV"
+SNAPSHOT_VERSION = 2
+
+HEADER = struct.Struct("<4sH")
+COUNT = struct.Struct("<I")
+STRING_LENGTH = struct.Struct("<B")
+CLOCK = struct.Struct("<dI")
+# x, y, level, xp | health, power, damage, boost/torpedo cost, regen, aim x/y |
+# damage, hit, torpedo, sonar, sonar start, portal, invincibility, flash, respawn times |
+# dead, invincible, sonar active, facing right
+PLAYER = struct.Struct("<iiii8d9q4?")
+# x, y, health, speed, direction x/y, change dir timer, attack cooldown,
+# behavior timer, alive, school index (the behavior state is stored by name)
+MONSTER = struct.Struct("<ii7d?i")
+# center x/y, heading x/y, turn timer (the monster type is stored by name)
+SCHOOL = struct.Struct("<5d")
+# pos, velocity, target direction, current direction (x/y each), state timer,
+# animation timer, damage, frame index, facing left
+TORPEDO = struct.Struct("<11dB?")
+# timer, game time, difficulty scale, last difficulty tick, wave number
+SPAWNER = struct.Struct("<4dI")
+# respawn index, respawning, respawn timer, invincible, invincibility timer, flash timer, visible
+RESPAWN = struct.Struct("<I?q?qq?")
+POINT = struct.Struct("<ii")
+RNG_SEED = struct.Struct("<Q")
+RNG_STREAM = struct.Struct("<B625I?d")
+
+
+# ===== CAPTURE & APPLY =====
+def capture(game_state):
+    """Copy the simulation state into plain tuples (cheap, main thread)"""
+    player = game_state.player
+    spawner = game_state.monster_spawner
+    respawn = game_state.respawn_system
+
+    schools = [
+        school
+        for type_schools in game_state.behaviors.schools.values()
+        for school in type_schools
+    ]
+    school_index = {id(school): i for i, school in enumerate(schools)}
+    torpedoes = game_state.torpedoes
+
+    return {
+        "clock": (game_state.clock.time_ms, game_state.clock.tick_count),
+        "player": (
+            player.hitbox_rect.centerx, player.hitbox_rect.centery, player.level, int(player.xp),
+            player.health, player.power, player.damage, player.boost_cost, player.torpedo_cost,
+            player.hp_regen_rate, player.aim_direction.x, player.aim_direction.y,
+            player.last_damage_time, player.last_hit_time, player.last_torpedo_time,
+            player.last_sonar_time, player.sonar_start_time, player.last_portal_time,
+            player.invincibility_timer, player.last_flash_time, player.respawn_timer,
+            player.is_dead, player.is_invincible, player.sonar_active,
+            player.last_horizontal == 'right',
+        ),
+        "monsters": [
+            (
+                monster.enemy_type, monster.state,
+                (
+                    monster.hitbox_rect.centerx, monster.hitbox_rect.centery, monster.health,
+                    monster.speed, monster.direction.x, monster.direction.y,
+                    monster.change_dir_timer, monster.attack_cooldown,
+                    monster.behavior_timer, monster.alive,
+                    school_index.get(id(monster.school), -1),
+                ),
+            )
+            for monster in game_state.enemy_sprites
+        ],
+        "schools": [
+            (
+                school.enemy_type,
+                (
+                    school.center.x, school.center.y, school.heading.x, school.heading.y,
+                    school.turn_timer,
+                ),
+            )
+            for school in schools
+        ],
+        "torpedoes": [
+            (
+                TORPEDO_STATES[torpedoes.states[i]],
+                (
+                    torpedoes.xs[i], torpedoes.ys[i], torpedoes.vxs[i], torpedoes.vys[i],
+                    torpedoes.target_xs[i], torpedoes.target_ys[i],
+                    torpedoes.dir_xs[i], torpedoes.dir_ys[i],
+                    torpedoes.timers[i], torpedoes.anim_timers[i], torpedoes.damages[i],
+                    torpedoes.frames[i], bool(torpedoes.facing_left[i]),
+                ),
+            )
+            for i in range(torpedoes.count)
+        ],
+        "spawner": (
+            spawner.timer, spawner.game_time, spawner.difficulty_scale,
+            spawner.last_difficulty_tick, spawner.wave_number,
+        ),
+        "respawn": (
+            (
+                respawn.current_respawn_index, respawn.is_respawning, respawn.respawn_timer,
+                respawn.is_invincible, respawn.invincibility_timer, respawn.flash_timer,
+                respawn.visible,
+            ),
+            [tuple(point) for point in respawn.respawn_points],
+        ),
+        "rng": (game_state.rng.seed, game_state.rng.get_state()),
+    }
+
+
+def apply(game_state, snapshot):
+    """Rebuild the simulation from a snapshot"""
+    clock = game_state.clock
+    clock.time_ms, clock.tick_count = snapshot["clock"]
+
+    # cosmetic effects & sonar reveals aren't saved, drop the ones from before the load
+    game_state.effects.clear()
+    game_state.sonar.clear()
+
+    # player
+    player = game_state.player
+    (
+        x, y, player.level, player.xp,
+        player.health, player.power, player.damage, player.boost_cost, player.torpedo_cost,
+        player.hp_regen_rate, aim_x, aim_y,
+        player.last_damage_time, player.last_hit_time, player.last_torpedo_time,
+        player.last_sonar_time, player.sonar_start_time, player.last_portal_time,
+        player.invincibility_timer, player.last_flash_time, player.respawn_timer,
+        player.is_dead, player.is_invincible, player.sonar_active, facing_right,
+    ) = snapshot["player"]
+    player.hitbox_rect.center = (x, y)
+    player.rect.center = (x, y)
+    player.aim_direction.update(aim_x, aim_y)
+    player.last_horizontal = 'right' if facing_right else 'left'
+
+    # schools, rebuilt exactly instead of re-registering monsters
+    behaviors = game_state.behaviors
+    behaviors.schools = {}
+    schools = []
+    for enemy_type, (center_x, center_y, heading_x, heading_y, turn_timer) in snapshot["schools"]:
+        school = School(enemy_type, behaviors.rng, (center_x, center_y))
+        school.heading.update(heading_x, heading_y)
+        school.turn_timer = turn_timer
+        behaviors.schools.setdefault(enemy_type, []).append(school)
+        schools.append(school)
+
+    # monsters
+    for monster in game_state.enemy_sprites.sprites():
+        monster.kill()
+    for enemy_type, state, values in snapshot["monsters"]:
+        (
+            x, y, health, speed, dir_x, dir_y, change_dir_timer, attack_cooldown,
+            behavior_timer, alive, school_index,
+        ) = values
+        monster = game_state.monster_spawner.create_monster(enemy_type, (x, y), register=False)
+        monster.hitbox_rect.center = (x, y)
+        monster.rect.center = (x, y)
+        monster.health = health
+        monster.speed = speed
+        monster.direction.update(dir_x, dir_y)
+        monster.change_dir_timer = change_dir_timer
+        monster.attack_cooldown = attack_cooldown
+        monster.alive = alive
+        monster.state = state
+        monster.behavior_state = monster.behavior.index(state)
+        monster.behavior_timer = behavior_timer
+        if school_index >= 0:
+            monster.school = schools[school_index]
+            monster.school.members.append(monster)
+
+    # torpedoes
+    torpedoes = game_state.torpedoes
+    torpedoes.clear()
+    for state, values in snapshot["torpedoes"]:
+        (
+            pos_x, pos_y, vel_x, vel_y, target_x, target_y, current_x, current_y,
+            state_timer, animation_timer, damage, frame_index, facing_left,
+        ) = values
+        i = torpedoes.launch(
+            (pos_x, pos_y),
+            (target_x, target_y),
+            'left' if facing_left else 'right',
+            damage,
+            player
+        )
+        if i < 0:
+            break
+        # the saved aim is already unit length, don't renormalize it
+        torpedoes.target_xs[i] = target_x
+        torpedoes.target_ys[i] = target_y
+        torpedoes.vxs[i] = vel_x
+        torpedoes.vys[i] = vel_y
+        torpedoes.dir_xs[i] = current_x
+        torpedoes.dir_ys[i] = current_y
+        torpedoes.states[i] = TORPEDO_STATES.index(state) if state in TORPEDO_STATES else 0
+        torpedoes.timers[i] = state_timer
+        torpedoes.anim_timers[i] = animation_timer
+        torpedoes.frames[i] = frame_index
+
+    # monster spawner
+    spawner = game_state.monster_spawner
+    (
+        spawner.timer, spawner.game_time, spawner.difficulty_scale,
+        spawner.last_difficulty_tick, spawner.wave_number,
+    ) = snapshot["spawner"]
+
+    # respawn system
+    respawn = game_state.respawn_system
+    values, points = snapshot["respawn"]
+    (
+        respawn.current_respawn_index, respawn.is_respawning, respawn.respawn_timer,
+        respawn.is_invincible, respawn.invincibility_timer, respawn.flash_timer,
+        respawn.visible,
+    ) = values
+    respawn.respawn_points = list(points)
+
+    # random streams last: recreating entities above draws from them
+    seed, rng_state = snapshot["rng"]
+    game_state.rng.seed = seed
+    game_state.rng.set_state(rng_state)
+
+    game_state.camera.centered_player_cam(player)
+
+
+# ===== ENCODING =====
+def write_string(parts, text):
+    data = text.encode("utf-8")
+    parts.append(STRING_LENGTH.pack(len(data)))
+    parts.append(data)
+
+
+def read_string(data, offset):
+    (length,) = STRING_LENGTH.unpack_from(data, offset)
+    offset += STRING_LENGTH.size
+    return data[offset:offset + length].decode("utf-8"), offset + length
+
+
+def encode(snapshot):
+    """Serialize a captured snapshot to bytes"""
+    parts = [
+        CLOCK.pack(*snapshot["clock"]),
+        PLAYER.pack(*snapshot["player"]),
+    ]
+
+    parts.append(COUNT.pack(len(snapshot["monsters"])))
+    for enemy_type, state, values in snapshot["monsters"]:
+        write_string(parts, enemy_type)
+        write_string(parts, state)
+        parts.append(MONSTER.pack(*values))
+
+    parts.append(COUNT.pack(len(snapshot["schools"])))
+    for enemy_type, values in snapshot["schools"]:
+        write_string(parts, enemy_type)
+        parts.append(SCHOOL.pack(*values))
+
+    parts.append(COUNT.pack(len(snapshot["torpedoes"])))
+    for state, values in snapshot["torpedoes"]:
+        write_string(parts, state)
+        parts.append(TORPEDO.pack(*values))
+
+    parts.append(SPAWNER.pack(*snapshot["spawner"]))
+
+    values, points = snapshot["respawn"]
+    parts.append(RESPAWN.pack(*values))
+    parts.append(COUNT.pack(len(points)))
+    for point in points:
+        parts.append(POINT.pack(*point))
+
+    seed, streams = snapshot["rng"]
+    parts.append(RNG_SEED.pack(seed))
+    parts.append(COUNT.pack(len(streams)))
+    for name, (version, internal, gauss_next) in streams.items():
+        write_string(parts, name)
+        parts.append(RNG_STREAM.pack(version, *internal, gauss_next is not None, gauss_next or 0.0))
+
+    body = zlib.compress(b"".join(parts), 1)
+    return HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION) + body
+
+
+def decode(data):
+    """Parse bytes written by encode() back into a snapshot"""
+    magic, version = HEADER.unpack_from(data, 0)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError("Not a save file")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported save version {version}")
+
+    body = zlib.decompress(data[HEADER.size:])
+    offset = 0
+
+    def read(record):
+        nonlocal offset
+        values = record.unpack_from(body, offset)
+        offset += record.size
+        return values
+
+    def read_text():
+        nonlocal offset
+        text, offset = read_string(body, offset)
+        return text
+
+    snapshot = {"clock": read(CLOCK), "player": read(PLAYER)}
+
+    monsters = []
+    for _ in range(read(COUNT)[0]):
+        enemy_type = read_text()
+        state = read_text()
+        monsters.append((enemy_type, state, read(MONSTER)))
+    snapshot["monsters"] = monsters
+
+    schools = []
+    for _ in range(read(COUNT)[0]):
+        enemy_type = read_text()
+        schools.append((enemy_type, read(SCHOOL)))
+    snapshot["schools"] = schools
+
+    torpedoes = []
+    for _ in range(read(COUNT)[0]):
+        state = read_text()
+        torpedoes.append((state, read(TORPEDO)))
+    snapshot["torpedoes"] = torpedoes
+
+    snapshot["spawner"] = read(SPAWNER)
+
+    values = read(RESPAWN)
+    points = [read(POINT) for _ in range(read(COUNT)[0])]
+    snapshot["respawn"] = (values, points)
+
+    (seed,) = read(RNG_SEED)
+    streams = {}
+    for _ in range(read(COUNT)[0]):
+        name = read_text()
+        stream = read(RNG_STREAM)
+        version, internal = stream[0], stream[1:626]
+        has_gauss, gauss_next = stream[626], stream[627]
+        streams[name] = (version, tuple(internal), gauss_next if has_gauss else None)
+    snapshot["rng"] = (seed, streams)
+
+    return snapshot
+
+
+# ===== SAVE SYSTEM =====
+class SaveSystem:
+    """Saves and loads GameState snapshots, with optional periodic autosave.
+
+    Only the capture runs on the game thread; encoding, compression and the
+    file write happen on a background thread so autosaves don't hitch.
+    """
+
+    def __init__(self, game_state, autosave_path=None, autosave_interval=AUTOSAVE_INTERVAL):
+        self.game_state = game_state
+        self.autosave_path = autosave_path
+        self.autosave_interval = autosave_interval
+        self.timer = 0.0
+        self.writer = None  # background thread of the save in progress
+
+    def save(self, path, background=True, report=False):
+        """Capture now and write to path, returns False if a save is still running.
+        With report=True the writer prints once the file is actually written."""
+        if self.writer and self.writer.is_alive():
+            return False
+
+        snapshot = capture(self.game_state)
+        if not background:
+            write_file(path, snapshot, report)
+            return True
+
+        self.writer = threading.Thread(target=write_file, args=(path, snapshot, report), daemon=True)
+        self.writer.start()
+        return True
+
+    def load(self, path):
+        """Restore the game state from a save file.
+        Raises OSError if it can't be read, ValueError if it is corrupt."""
+        self.wait()
+        with open(path, "rb") as f:
+            data = f.read()
+        try:
+            snapshot = decode(data)
+        except (zlib.error, struct.error, IndexError, UnicodeDecodeError) as e:
+            raise ValueError(f"{path} is corrupt: {e}") from e
+        apply(self.game_state, snapshot)
+        print(f"Loaded save: {path}")
+
+    def wait(self):
+        """Block until the save in progress has been written"""
+        if self.writer:
+            self.writer.join()
+            self.writer = None
+
+    def update(self, dt):
+        if not self.autosave_path:
+            return
+
+        self.timer += dt
+        if self.timer >= self.autosave_interval:
+            if self.save(self.autosave_path):
+                self.timer = 0.0
+
+
+def write_file(path, snapshot, report=False):
+    """Encode and atomically replace the save file"""
+    try:
+        data = encode(snapshot)
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+        temp_path = path + ".tmp"
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+        if report:
+            print(f"Saved {path}")
+    except Exception as e:
+        print(f"Failed to save {path}: {e}")
@@ -0,0 +1,70 @@
+# game/soak.py
+import os
+import time
+
+from game.config import *
+
+try:
+    import resource  # unix only
+except ImportError:
+    resource = None
+
+
+def peak_memory_mb():
+    """Peak resident memory of this process, None where unavailable"""
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # KB on Linux
+
+
+def run_soak(duration, seed=None, report_interval=SOAK_REPORT_INTERVAL, dt=BATCH_TICK, memory=False):
+    """Let the autopilot play a headless game for duration game seconds.
+
+    Prints tick cost and memory every report_interval game seconds, so frame
+    time drift and memory growth over a long session show up as trends.
+    With memory=True a MemorySampler report follows every line (sampled
+    outside the timed ticks). Returns the per-window average tick cost in ms.
+    """
+    from game.gamestate import GameState
+    from game.bot import BotController
+    from game.memory import MemorySampler
+
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    game_state = GameState(seed=seed)
+    game_state.controller = BotController(game_state.rng.seed)
+    sampler = MemorySampler(game_state) if memory else None
+
+    window_ticks = max(1, round(report_interval / dt))
+    windows = []
+    tick_time = 0.0
+    worst = 0.0
+
+    print(f"{'time':>8}{'avg ms':>9}{'max ms':>9}{'monsters':>10}{'sprites':>9}{'level':>7}{'peak MB':>9}")
+    perf_counter = time.perf_counter
+    for tick in range(1, int(duration / dt) + 1):
+        start = perf_counter()
+        game_state.update(dt)
+        cost = perf_counter() - start
+        tick_time += cost
+        worst = max(worst, cost)
+
+        if tick % window_ticks == 0:
+            average = tick_time / window_ticks * 1000
+            windows.append(average)
+            peak_mb = peak_memory_mb()
+            print(
+                f"{game_state.clock.seconds:>7.0f}s{average:>9.2f}{worst * 1000:>9.2f}"
+                f"{len(game_state.enemy_sprites):>10}{len(game_state.visible_sprites):>9}"
+                f"{game_state.player.level:>7}{'' if peak_mb is None else f'{peak_mb:.1f}':>9}"
+            )
+            tick_time = 0.0
+            worst = 0.0
+            if sampler:
+                sampler.sample()
+                print(sampler.report())
+
+    if sampler:
+        sampler.close()
+    if len(windows) >= 2:
+        print(f"Tick cost drift: {windows[0]:.2f} ms -> {windows[-1]:.2f} ms")
+    return windows
@@ -0,0 +1,74 @@
+# game/sonar.py
+from game.config import *
+from game.spatial import MONSTERS
+
+
+class SonarSystem:
+    """Monster reveals and minimap pings from sonar pulses.
+
+    A pulse (the player's SONAR_PULSE event) runs one radius query on the broad
+    phase. Each monster it finds is revealed once the expanding wave gets
+    to it (distance / SONAR_WAVE_SPEED), stays fully visible until the
+    pulse's duration is almost over and fades out over SONAR_REVEAL_FADE.
+    Only the revealed monsters are touched per tick, so the cost follows
+    the number of monsters found, not the population.
+
+    Every revealed monster also leaves a ping, its position when the wave
+    hit it, for the HUD minimap. Reveals are cosmetic: monsters only use
+    reveal_alpha to pick how visible they are.
+    """
+
+    def __init__(self, game_state):
+        self.broad_phase = game_state.broad_phase
+        self.clock = game_state.clock
+        self.revealed = []  # [monster, reveal start ms, reveal end ms]
+        self.pings = []  # [x, y, enemy type, ping start ms, ping end ms, strength 0-1]
+
+    # ===== PULSES =====
+    def pulse(self, source, target, sonar_range, pos):
+        """SONAR_PULSE event handler: reveal every monster within sonar_range of pos"""
+        now = self.clock.get_ticks()
+        end = now + int(source.sonar_duration * 1000)
+        x, y = pos
+        for monster in self.broad_phase.query_radius(pos, sonar_range, MONSTERS):
+            monster_x, monster_y = monster.rect.center
+            distance = ((monster_x - x) ** 2 + (monster_y - y) ** 2) ** 0.5
+            start = now + int(distance / SONAR_WAVE_SPEED * 1000)
+            self.revealed.append([monster, start, end])
+            self.pings.append([monster_x, monster_y, monster.enemy_type, start, end, 0.0])
+
+    def clear(self):
+        for entry in self.revealed:
+            entry[0].reveal_alpha = 0
+        self.revealed = []
+        self.pings = []
+
+    # ===== UPDATE =====
+    def update(self, dt):
+        """Age reveals and pings, dropping the finished ones"""
+        now = self.clock.get_ticks()
+        fade = SONAR_REVEAL_FADE * 1000
+
+        revealed = []
+        for entry in self.revealed:
+            monster, start, end = entry
+            if now >= end or not monster.alive:
+                monster.reveal_alpha = 0
+                continue
+            monster.reveal_alpha = int(255 * self.strength(now, start, end, fade))
+            revealed.append(entry)
+        self.revealed = revealed
+
+        pings = []
+        for ping in self.pings:
+            if now < ping[4]:
+                ping[5] = self.strength(now, ping[3], ping[4], fade)
+                pings.append(ping)
+        self.pings = pings
+
+    @staticmethod
+    def strength(now, start, end, fade):
+        """0 before the wave arrives, 1 while revealed, fading to 0 at end"""
+        if now < start:
+            return 0.0
+        return max(0.0, min(1.0, (end - now) / fade))
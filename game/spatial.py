@@ -0,0 +1,202 @@
+# game/spatial.py
+import pygame
+
+from game.config import *
+
+# ===== LAYERS =====
+# bit flags, combine with | to query several layers at once
+WALLS = 1
+MONSTERS = 2
+PLAYER = 4
+PORTALS = 8
+OBSTACLES = 16
+ALL_LAYERS = WALLS | MONSTERS | PLAYER | PORTALS | OBSTACLES
+
+
+class SpatialGrid:
+    """Uniform hash grid of (item, rect, layer) entries for broad-phase tests.
+
+    Entries are bucketed into every cell their rect touches. A match is only
+    reported from the cell that holds the top-left corner of the two rects'
+    intersection, so queries and pairs never return duplicates. That relies
+    on an entry's rect not moving while it is in the grid: insert a copy of
+    a rect that changes, and re-insert it after it moved.
+    """
+
+    def __init__(self, cell_size=SPATIAL_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def clear(self):
+        self.cells.clear()
+
+    def insert(self, item, rect, layer):
+        size = self.cell_size
+        cells = self.cells
+        entry = (item, rect, layer)
+        for col in range(rect.left // size, (rect.right - 1) // size + 1):
+            for row in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                key = (col, row)
+                if key in cells:
+                    cells[key].append(entry)
+                else:
+                    cells[key] = [entry]
+
+    def query(self, rect, mask=ALL_LAYERS):
+        """Items on the masked layers whose rect overlaps rect"""
+        size = self.cell_size
+        cells = self.cells
+        found = []
+        for col in range(rect.left // size, (rect.right - 1) // size + 1):
+            for row in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                bucket = cells.get((col, row))
+                if not bucket:
+                    continue
+                for item, item_rect, layer in bucket:
+                    if (
+                        layer & mask
+                        and rect.colliderect(item_rect)
+                        and max(rect.left, item_rect.left) // size == col
+                        and max(rect.top, item_rect.top) // size == row
+                    ):
+                        found.append(item)
+        return found
+
+    def overlapping_pairs(self, mask=ALL_LAYERS):
+        """Yield (a, b) for every pair of masked items whose rects overlap"""
+        size = self.cell_size
+        for (col, row), bucket in self.cells.items():
+            count = len(bucket)
+            if count < 2:
+                continue
+            for i in range(count - 1):
+                item_a, rect_a, layer_a = bucket[i]
+                if not layer_a & mask:
+                    continue
+                for j in range(i + 1, count):
+                    item_b, rect_b, layer_b = bucket[j]
+                    if not layer_b & mask or not rect_a.colliderect(rect_b):
+                        continue
+                    # report from the cell owning the intersection's corner only
+                    if (
+                        max(rect_a.left, rect_b.left) // size == col
+                        and max(rect_a.top, rect_b.top) // size == row
+                    ):
+                        yield item_a, item_b
+
+
+class BroadPhase:
+    """Collision service shared by every entity in a game.
+
+    Walls and portals never move, so they go into a static grid built once.
+    Monsters, the player and obstacles are re-bucketed once per tick with
+    refresh(). Entities ask for candidates on a layer mask instead of
+    looping over whole sprite groups.
+    """
+
+    def __init__(self, cell_size=SPATIAL_CELL_SIZE, static_cell_size=SPATIAL_STATIC_CELL_SIZE, walls=None):
+        # the wall grid can be shared between games (SharedAssets), portals are per game
+        self.walls = walls if walls is not None else SpatialGrid(static_cell_size)
+        self.static = SpatialGrid(static_cell_size)
+        self.dynamic = SpatialGrid(cell_size)
+
+    def add_static(self, item, rect, layer):
+        if layer == WALLS:
+            self.walls.insert(item, rect, layer)
+        else:
+            self.static.insert(item, rect, layer)
+
+    def refresh(self, player, monsters, obstacles=()):
+        """Re-bucket everything that moves, once per tick (and again if
+        separation moved monsters). Rects are stored as snapshots, the live
+        ones change in place."""
+        dynamic = self.dynamic
+        dynamic.clear()
+        dynamic.insert(player, player.hitbox_rect.copy(), PLAYER)
+        for monster in monsters:
+            if monster.alive:
+                dynamic.insert(monster, monster.hitbox_rect.copy(), MONSTERS)
+        for obstacle in obstacles:
+            dynamic.insert(obstacle, obstacle.rect.copy(), OBSTACLES)
+
+    # ===== QUERIES =====
+    def query(self, rect, mask):
+        """Items on the masked layers overlapping rect"""
+        found = []
+        if mask & WALLS:
+            found.extend(self.walls.query(rect, mask))
+        if mask & PORTALS:
+            found.extend(self.static.query(rect, mask))
+        if mask & (MONSTERS | PLAYER | OBSTACLES):
+            found.extend(self.dynamic.query(rect, mask))
+        return found
+
+    def collides(self, rect, mask):
+        """True if anything on the masked layers overlaps rect"""
+        return bool(self.query(rect, mask))
+
+    def query_radius(self, center, radius, mask):
+        """Items on the masked layers whose rect center is within radius"""
+        x, y = center
+        area = pygame.Rect(x - radius, y - radius, radius * 2 + 1, radius * 2 + 1)
+        radius_sq = radius * radius
+        found = []
+        for item in self.query(area, mask):
+            item_x, item_y = item.rect.center
+            if (item_x - x) ** 2 + (item_y - y) ** 2 <= radius_sq:
+                found.append(item)
+        return found
+
+    def pairs(self, mask):
+        """Overlapping pairs among the moving items on the masked layers"""
+        return self.dynamic.overlapping_pairs(mask)
+
+
+# ===== MONSTER SEPARATION =====
+def separate_monsters(broad_phase, nav_grid=None):
+    """Push overlapping monster hitboxes apart along their shallowest axis.
+
+    Each monster of a pair moves half the overlap, capped per tick so big
+    piles spread out over a few frames instead of popping. Pushes that would
+    move a monster's center into a blocked navigation cell are dropped.
+    Returns the number of pairs pushed; the grid then holds stale positions
+    and needs a refresh before it is queried again.
+    """
+    max_push = MONSTER_SEPARATION_MAX_PUSH
+    pushed = 0
+    for monster_a, monster_b in broad_phase.pairs(MONSTERS):
+        rect_a = monster_a.hitbox_rect
+        rect_b = monster_b.hitbox_rect
+        overlap_x = min(rect_a.right, rect_b.right) - max(rect_a.left, rect_b.left)
+        overlap_y = min(rect_a.bottom, rect_b.bottom) - max(rect_a.top, rect_b.top)
+        if overlap_x <= 0 or overlap_y <= 0:
+            continue  # already pushed apart by an earlier pair
+
+        if overlap_x < overlap_y:
+            push = min((overlap_x + 1) // 2, max_push)
+            sign = 1 if rect_a.centerx >= rect_b.centerx else -1
+            nudge(monster_a, sign * push, 0, nav_grid)
+            nudge(monster_b, -sign * push, 0, nav_grid)
+        else:
+            push = min((overlap_y + 1) // 2, max_push)
+            sign = 1 if rect_a.centery >= rect_b.centery else -1
+            nudge(monster_a, 0, sign * push, nav_grid)
+            nudge(monster_b, 0, -sign * push, nav_grid)
+        pushed += 1
+    return pushed
+
+
+def nudge(monster, dx, dy, nav_grid):
+    rect = monster.hitbox_rect
+    if nav_grid:
+        target = nav_grid.cell_index(rect.centerx + dx, rect.centery + dy)
+        if target < 0 or (
+            nav_grid.blocked[target]
+            and target != nav_grid.cell_index(rect.centerx, rect.centery)
+        ):
+            return
+
+    rect.x += dx
+    rect.y += dy
+    monster.keep_within_bounds()
+    monster.rect.center = rect.center
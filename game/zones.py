@@ -0,0 +1,141 @@
+# game/zones.py
+import pygame
+
+from game.config import *
+
+
+class ZoneManager:
+    """Splits the world into fixed regions and keeps only the ones near the player live.
+
+    Zones within ZONE_WAKE_RADIUS (in zones) of the player's zone are awake:
+    their monsters run AI, movement and drawing. Everything else sleeps,
+    frozen in place until the player (or a portal jump) brings it back in
+    range. Being awake only depends on where the player is, so saves and
+    replays see the same set of live monsters.
+
+    The map is streamed the same way: each zone's tiles are rendered into
+    their own chunk surface, a few per tick, once the zone is within
+    ZONE_KEEP_RADIUS zones of the player (so before it scrolls into view),
+    and dropped again once it is further away.
+
+    Prefetch positions (portal destinations the player could jump to) count
+    as extra centers: their zones wake up early and their chunks are
+    rendered ahead of time, a few per tick, so a jump lands somewhere warm.
+    """
+
+    def __init__(self, map_system, zone_size=ZONE_SIZE, wake_radius=ZONE_WAKE_RADIUS, keep_radius=ZONE_KEEP_RADIUS, streaming=True):
+        self.map_system = map_system
+        self.streaming = streaming  # headless games never draw, so never render chunks
+        self.zone_width, self.zone_height = zone_size
+        self.cols = max(1, -(-map_system.map_width // self.zone_width))
+        self.rows = max(1, -(-map_system.map_height // self.zone_height))
+        self.wake_radius = wake_radius
+        self.keep_radius = max(keep_radius, wake_radius)
+
+        self.awake = bytearray(self.cols * self.rows)
+        self.centers = ()  # player zone first, then prefetched zones
+        self.chunks = {}  # zone index -> rendered map surface
+        self.pending = []  # chunks to render ahead of a portal jump
+
+    # ===== ZONES =====
+    def zone_at(self, x, y):
+        """Index of the zone holding a world position (clamped to the map)"""
+        col = min(self.cols - 1, max(0, int(x) // self.zone_width))
+        row = min(self.rows - 1, max(0, int(y) // self.zone_height))
+        return row * self.cols + col
+
+    def zone_rect(self, index):
+        col = index % self.cols
+        row = index // self.cols
+        rect = pygame.Rect(col * self.zone_width, row * self.zone_height, self.zone_width, self.zone_height)
+        return rect.clip(pygame.Rect(0, 0, self.map_system.map_width, self.map_system.map_height))
+
+    def zone_distance(self, a, b):
+        """Chebyshev distance between two zones, in zones"""
+        return max(abs(a % self.cols - b % self.cols), abs(a // self.cols - b // self.cols))
+
+    def is_awake(self, pos):
+        return bool(self.awake[self.zone_at(*pos)])
+
+    def zones_around(self, index, radius):
+        col = index % self.cols
+        row = index // self.cols
+        return [
+            y * self.cols + x
+            for y in range(max(0, row - radius), min(self.rows, row + radius + 1))
+            for x in range(max(0, col - radius), min(self.cols, col + radius + 1))
+        ]
+
+    # ===== UPDATE =====
+    def update(self, player, monsters, prefetch=()):
+        """Wake/sleep zones around the player (and prefetch positions) and flag
+        every monster accordingly"""
+        centers = (self.zone_at(*player.hitbox_rect.center),)
+        centers += tuple(self.zone_at(*pos) for pos in prefetch)
+        if centers != self.centers:
+            self.centers = centers
+            for index in range(len(self.awake)):
+                self.awake[index] = any(
+                    self.zone_distance(center, index) <= self.wake_radius for center in centers
+                )
+
+            # drop map chunks that drifted out of range
+            for index in list(self.chunks):
+                if all(self.zone_distance(center, index) > self.keep_radius for center in centers):
+                    del self.chunks[index]
+
+            # queue the chunks around the player (nearest first, before they
+            # scroll into view), then the ones a jump would need
+            if self.streaming:
+                player_zone = centers[0]
+                around = sorted(
+                    self.zones_around(player_zone, self.keep_radius),
+                    key=lambda index: self.zone_distance(player_zone, index),
+                )
+                self.pending = [
+                    index
+                    for index in around + [
+                        index
+                        for center in centers[1:]
+                        for index in self.zones_around(center, ZONE_PREFETCH_RADIUS)
+                    ]
+                    if index not in self.chunks
+                ]
+
+        self.prefetch_chunks()
+
+        awake = self.awake
+        zone_at = self.zone_at
+        for monster in monsters:
+            monster.asleep = not awake[zone_at(*monster.hitbox_rect.center)]
+
+    # ===== MAP STREAMING =====
+    def prefetch_chunks(self, budget=ZONE_PREFETCH_PER_TICK):
+        """Render a few queued chunks ahead of time"""
+        while self.pending and budget > 0:
+            index = self.pending.pop(0)
+            if index not in self.chunks:
+                self.chunks[index] = self.map_system.render_chunk(self.zone_rect(index))
+                budget -= 1
+
+    def draw_map(self, screen, camera_offset):
+        """Blit the map chunks overlapping the view. Chunks are normally
+        prefetched before they show up; a missing one is rendered on the spot."""
+        offset_x, offset_y = int(camera_offset[0]), int(camera_offset[1])
+        width, height = screen.get_size()
+
+        first_col = max(0, offset_x // self.zone_width)
+        last_col = min(self.cols - 1, (offset_x + width - 1) // self.zone_width)
+        first_row = max(0, offset_y // self.zone_height)
+        last_row = min(self.rows - 1, (offset_y + height - 1) // self.zone_height)
+
+        batch = []
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                index = row * self.cols + col
+                chunk = self.chunks.get(index)
+                if chunk is None:
+                    chunk = self.map_system.render_chunk(self.zone_rect(index))
+                    self.chunks[index] = chunk
+                batch.append((chunk, (col * self.zone_width - offset_x, row * self.zone_height - offset_y)))
+        screen.blits(batch, doreturn=False)
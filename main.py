@@ -1,19 +1,53 @@
 # main.py
 import sys
 import os
+import argparse
 
 project_root = os.path.dirname(os.path.abspath(__file__))
 if project_root not in sys.path:
-    sys.path.inart(0, project_root)
+    sys.path.insert(0, project_root)
 
 from game.game import Game
+from game.config import SETTINGS_PATH
+
+def seed_value(text):
+    """Seeds are stored as unsigned 64-bit ints in replays and saves"""
+    seed = int(text)
+    if not 0 <= seed < 2 ** 64:
+        raise argparse.ArgumentTypeError(f"seed must be between 0 and 2**64 - 1, got {seed}")
+    return seed
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Subnautic Shooter")
+    parser.add_argument("--seed", type=seed_value, default=None, help="seed for spawning, AI and respawn randomness")
+    parser.add_argument("--record", metavar="PATH", help="record inputs to a replay file")
+    parser.add_argument("--load", metavar="PATH", help="start from a save file")
+    parser.add_argument("--rewind", action="store_true", help="keep a rewind buffer for debugging (F2 to pause and scrub)")
+    parser.add_argument("--replay", metavar="PATH", help="run a recorded replay headless and verify it")
+    parser.add_argument("--bot", action="store_true", help="let the autopilot play")
+    parser.add_argument("--soak", type=float, metavar="SECONDS", help="autopilot a headless game for SECONDS of game time, reporting tick cost and memory")
+    parser.add_argument("--memory", action="store_true", help="print sprite group, surface and tracemalloc reports periodically and flag growing groups")
+    parser.add_argument("--settings", nargs="?", const=SETTINGS_PATH, metavar="PATH", help=f"apply config overrides from a .toml/.json file and reload it when it changes (default: {SETTINGS_PATH})")
+    return parser.parse_args()
 
 def main():
+    args = parse_args()
+
+    if args.replay:
+        from game.replay import run_replay
+        mismatches = run_replay(args.replay)
+        sys.exit(1 if mismatches else 0)
+
+    if args.soak:
+        from game.soak import run_soak
+        run_soak(args.soak, seed=args.seed, memory=args.memory)
+        return
+
     print("="*40)
     print(" SUBNAUTIC SHOOTER - Loading...")
     print("="*40)
     
-    game = Game()
+    game = Game(seed=args.seed, record_path=args.record, load_path=args.load, rewind=args.rewind, bot=args.bot, memory=args.memory, settings_path=args.settings)
     game.run()
 
 if __name__ == "__main__":
@@ -1,15 +1,20 @@
 # entities/ui/hud.py
 import pygame
 from game.config import *
+from game.assets import load_image
+from game.input import PORTAL_TRAVEL_KEYS
 
 
 class HUD:
     """Heads-up display for player stats, abilities, portals, and overlays."""
 
-    def __init__(self, player, screen, camera=None):
+    def __init__(self, player, screen, clock, camera=None, assets=None, sonar=None):
         self.player = player
         self.screen = screen
+        self.clock = clock
         self.camera = camera
+        self.assets = assets
+        self.sonar = sonar
 
         # fonts
         self.font = pygame.font.Font(None, 28)
@@ -61,6 +66,11 @@ class HUD:
         self.sonar_icon = self.load_icon(SONAR_ICON_PATH)
         self.portal_icon = self.load_icon(PORTAL_ICON_PATH)
 
+        # sonar minimap (top right), redrawn only while there are pings
+        radius = SONAR_MINIMAP_RADIUS
+        self.minimap_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        self.minimap_pos = (SCREEN_WIDTH - radius * 2 - 20, 20)
+
     # ===== HELPERS =====
     def next_y(self):
         """Advance vertical cursor for stacked HUD elements."""
@@ -88,8 +98,13 @@ class HUD:
         pygame.draw.rect(self.screen, self.border_color, bar_rect, self.bar_border)
 
     def load_icon(self, path):
+        if self.assets:
+            return self.assets.cached(("icon", path, self.icon_size), self.build_icon, path)
+        return self.build_icon(path)
+
+    def build_icon(self, path):
         try:
-            icon = pygame.image.load(path).convert_alpha()
+            icon = load_image(path)
             return pygame.transform.smoothscale(icon, (self.icon_size, self.icon_size))
         except Exception:
             surf = pygame.Surface((self.icon_size, self.icon_size), pygame.SRCALPHA)
@@ -138,13 +153,14 @@ class HUD:
     def draw_xp(self):
         y = self.next_y()
 
-        if self.player.level >= self.player.max_level:
-            text = f"Level {self.player.level}: MAX LEVEL"
+        player = self.player
+        if player.level >= player.max_level:
+            text = f"Level {player.level}: MAX LEVEL"
             ratio = 1.0
         else:
-            xp_needed = self.player.xp_to_next[self.player.level]
-            ratio = min(1.0, self.player.xp / xp_needed)
-            text = f"Level {self.player.level}: {self.player.xp}/{xp_needed} XP"
+            xp_needed = player.progression.xp_to_next[player.level]
+            ratio = min(1.0, player.xp / xp_needed)
+            text = f"Level {player.level}: {player.xp}/{xp_needed} XP"
 
         self.draw_bar(text, ratio, y, self.xp_fg, self.xp_bg)
 
@@ -167,6 +183,38 @@ class HUD:
             self.xp_bg
         )
 
+    # ===== SONAR MINIMAP =====
+    def draw_sonar_minimap(self):
+        """Sonar pings around the player, scaled so the edge is the sonar range"""
+        if not self.sonar or not self.sonar.pings:
+            return
+
+        radius = SONAR_MINIMAP_RADIUS
+        surface = self.minimap_surface
+        surface.fill((0, 0, 0, 0))
+        pygame.draw.circle(surface, (0, 40, 30, 160), (radius, radius), radius)
+        pygame.draw.circle(surface, (80, 200, 150, 200), (radius, radius), radius, 1)
+        pygame.draw.circle(surface, (255, 255, 255, 255), (radius, radius), 2)
+
+        scale = radius / self.player.sonar_range
+        player_x, player_y = self.player.rect.center
+        radius_sq = (radius - 3) ** 2
+        for x, y, enemy_type, start, end, strength in self.sonar.pings:
+            if not strength:
+                continue  # the wave hasn't reached it yet
+            dot_x = (x - player_x) * scale
+            dot_y = (y - player_y) * scale
+            if dot_x * dot_x + dot_y * dot_y > radius_sq:
+                continue
+            pygame.draw.circle(
+                surface,
+                (120, 255, 160, int(255 * strength)),
+                (int(radius + dot_x), int(radius + dot_y)),
+                3
+            )
+
+        self.screen.blit(surface, self.minimap_pos)
+
     # ===== PORTAL INFO =====
     def draw_portal_info(self):
         """Draw active portal info when player is near a portal."""
@@ -176,26 +224,37 @@ class HUD:
 
         y = self.next_y()
 
-        index = portal.node.portal_index + 1
-        next_i = portal.node.next.portal_index + 1
-        prev_i = portal.node.prev.portal_index + 1
+        node = portal.node
+        index = node.portal_index + 1
+
+        links = []
+        if node.next:
+            links.append(f"E → Portal {node.next.portal_index + 1}")
+        if node.prev:
+            links.append(f"Q ← Portal {node.prev.portal_index + 1}")
 
         title = self.portal_title_font.render(
             f"Portal {index}", True, (0, 255, 0)
         )
         hint = self.portal_hint_font.render(
-            f"E → Portal {next_i}    Q ← Portal {prev_i}",
+            "    ".join(links), True, (180, 255, 180)
+        )
+        # only the first portals have a number key
+        travelable = min(len(PORTAL_TRAVEL_KEYS), len(self.player.game_ref.portal_network.nodes))
+        travel = self.portal_hint_font.render(
+            f"1-{travelable}: travel to portal",
             True, (180, 255, 180)
         )
 
         self.screen.blit(title, (self.ui_x, y))
         self.screen.blit(hint, (self.ui_x, y + 18))
+        self.screen.blit(travel, (self.ui_x, y + 34))
 
-        self.cursor_y += 10  # extra spacing
+        self.cursor_y += 26  # extra spacing for the hint lines
 
     # ===== ABILITY ICONS =====    
     def draw_torpedo_icon(self, x, y):
-        current = pygame.time.get_ticks()
+        current = self.clock.get_ticks()
         elapsed = (current - self.player.last_torpedo_time) / 1000
         cd = self.player.torpedo_cooldown
 
@@ -211,9 +270,9 @@ class HUD:
         )
     
     def draw_sonar_icon(self, x, y):
-        current = pygame.time.get_ticks()
+        current = self.clock.get_ticks()
 
-        if self.player.level < self.player.sonar_level_required:
+        if not self.player.progression.unlocked(self.player.level, "sonar"):
             self.draw_icon_with_cooldown(
                 self.sonar_icon,
                 x, y,
@@ -246,9 +305,10 @@ class HUD:
         )
 
     def draw_portal_icon(self, x, y):
-        current = pygame.time.get_ticks()
+        current = self.clock.get_ticks()
         elapsed = (current - self.player.last_portal_time) / 1000
-        cooldown_ratio = max(0, 1 - (elapsed / PORTAL_COOLDOWN)) if elapsed < PORTAL_COOLDOWN else 0
+        cd = self.player.portal_cooldown / 1000
+        cooldown_ratio = max(0, 1 - (elapsed / cd)) if elapsed < cd else 0
 
         disabled = self.player.current_portal is None
 
@@ -272,7 +332,7 @@ class HUD:
             died.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
         )
 
-        elapsed = (pygame.time.get_ticks() - self.player.respawn_timer) / 1000
+        elapsed = (self.clock.get_ticks() - self.player.respawn_timer) / 1000
         remaining = max(0, RESPAWN_DELAY - elapsed)
 
         timer = self.medium_font.render(
@@ -287,7 +347,7 @@ class HUD:
         if not self.player.is_invincible or self.player.is_dead:
             return
 
-        elapsed = (pygame.time.get_ticks() - self.player.invincibility_timer) / 1000
+        elapsed = (self.clock.get_ticks() - self.player.invincibility_timer) / 1000
         remaining = max(0, RESPAWN_PROTECTION_TIME - elapsed)
 
         text = self.font.render(
@@ -313,6 +373,7 @@ class HUD:
         self.draw_power()
         self.draw_portal_info()
         self.draw_invincibility()
+        self.draw_sonar_minimap()
 
         self.draw_torpedo_icon(x, y)
         self.draw_sonar_icon(x + self.icon_size + self.icon_padding, y)
@@ -6,10 +6,11 @@ from game.config import *
 class WorldUI:
     """Handles world-space UI and visual effects"""
 
-    def __init__(self, player, camera, screen):
+    def __init__(self, player, camera, screen, clock):
         self.player = player
         self.camera = camera
         self.screen = screen
+        self.clock = clock
 
         # fog setup
         self.fog_surface = pygame.Surface(
@@ -22,7 +23,7 @@ class WorldUI:
         if not self.player or not self.player.sonar_active:
             return
 
-        current_time = pygame.time.get_ticks()
+        current_time = self.clock.get_ticks()
         elapsed = (current_time - self.player.sonar_start_time) / 1000.0
 
         if elapsed >= self.player.sonar_duration:
@@ -42,7 +43,7 @@ class WorldUI:
             if wave_time < 0:
                 continue
 
-            radius = int(wave_time * 600)
+            radius = int(wave_time * SONAR_WAVE_SPEED)
             if radius > max(screen_width, screen_height):
                 continue
 